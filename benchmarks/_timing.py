@@ -0,0 +1,94 @@
+"""
+Timing helpers shared by the benchmark scripts.
+"""
+
+import time
+import tracemalloc
+from typing import Callable
+
+
+def best_of(func: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    """
+    Time a function and return the best time per call in seconds.
+
+    Args:
+        `func`: Function to time, called without arguments
+        `number`: Number of calls per measurement
+        `repeat`: Number of measurements, of which the fastest is kept
+
+    Returns:
+        `float`: Seconds per call of the fastest measurement
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    return best
+
+
+def peak_allocated(func: Callable[[], object]) -> int:
+    """
+    Measure the peak memory allocated by one call of a function.
+
+    Allocations are traced with `tracemalloc`, and the result includes the
+    value returned by the function, which is alive at the end of the call.
+
+    Args:
+        `func`: Function to measure, called without arguments
+
+    Returns:
+        `int`: Peak bytes allocated during the call, above what was allocated before it
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return peak - before
+
+
+def report(
+    title: str,
+    results: list[tuple[str, float]],
+    items: int = 1,
+    unit: str = "item",
+    allocations: list[int] | None = None,
+) -> None:
+    """
+    Print timings as a table, with the speed-up of each row over the first.
+
+    Args:
+        `title`: Heading of the table
+        `results`: (label, seconds per call) pairs, the baseline first
+        `items`: Number of items processed per call, for the per-item columns
+        `unit`: Name of the items in the per-item columns
+        `allocations`: Peak bytes allocated per call of each row, as returned
+            by `peak_allocated`, for an extra per-item column
+
+    Returns:
+        `None`
+    """
+    baseline = results[0][1]
+    width = max(len(label) for label, _ in results)
+
+    print(title)
+    for i, (label, seconds) in enumerate(results):
+        line = (
+            f"  {label:<{width}}  {seconds * 1e3:10.3f} ms/call"
+            f"  {seconds / items * 1e6:10.3f} us/{unit}"
+            f"  {baseline / seconds:7.1f}x"
+        )
+        if allocations is not None:
+            line += f"  {allocations[i] / items:10.1f} B/{unit} peak"
+        print(line)
+    print()
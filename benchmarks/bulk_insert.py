@@ -0,0 +1,104 @@
+"""
+Benchmark of inserting sensor readings into MongoDB.
+
+Compares `create_sensor_reading`, the baseline, which makes two round-trips
+per reading, with `create_sensor_readings_bulk`, which inserts a batch of
+readings from many machines with one `insert_many` and one `bulk_write` of
+last_seen updates. Both variants build their `SensorReading` models inside
+the timed call, as a caller would.
+
+Unlike the other benchmarks this one needs a server: it runs against the
+MongoDB server at MONGODB_URI, such as a local mongod, in a scratch database
+that is dropped afterwards.
+
+Usage:
+
+    MONGODB_URI=mongodb://localhost:27017 python -m benchmarks.bulk_insert --readings 2000 --machines 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from benchmarks._timing import best_of, report
+from domain.models import Machine, SensorReading
+from domain.utils.crud import create_document, create_sensor_reading, create_sensor_readings_bulk
+
+
+async def _insert_one_by_one(db: AsyncIOMotorDatabase, rows: list[tuple]) -> None:
+    """Insert readings with create_sensor_reading, one at a time."""
+    for machine_id, values, timestamp in rows:
+        await create_sensor_reading(db, machine_id, values, timestamp)
+
+
+async def _insert_bulk(db: AsyncIOMotorDatabase, rows: list[tuple]) -> None:
+    """Insert readings with a single call to create_sensor_readings_bulk."""
+    readings = [
+        SensorReading(machine_id=machine_id, values=values, timestamp=timestamp)
+        for machine_id, values, timestamp in rows
+    ]
+    await create_sensor_readings_bulk(db, readings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--readings", type=int, default=2000)
+    parser.add_argument("--machines", type=int, default=10)
+    parser.add_argument("--sensors", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    uri = os.environ.get("MONGODB_URI")
+    if not uri:
+        sys.exit("MONGODB_URI is not set; point it to a MongoDB server, e.g. mongodb://localhost:27017")
+
+    loop = asyncio.new_event_loop()
+    client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=5000, io_loop=loop)
+    db = client[f"benchmark_{uuid.uuid4().hex[:12]}"]
+
+    try:
+        machine_ids = [
+            loop.run_until_complete(create_document(db, Machine(machine_id=f"machine-{i}")))
+            for i in range(args.machines)
+        ]
+        start = datetime(2024, 1, 1)
+        rows = [
+            (
+                machine_ids[i % args.machines],
+                {f"sensor_{j:02d}": random.gauss(0, 1) for j in range(args.sensors)},
+                start + timedelta(seconds=i // args.machines),
+            )
+            for i in range(args.readings)
+        ]
+
+        results = [
+            ("create_sensor_reading", best_of(
+                lambda: loop.run_until_complete(_insert_one_by_one(db, rows)), repeat=args.repeat
+            )),
+            ("create_sensor_readings_bulk", best_of(
+                lambda: loop.run_until_complete(_insert_bulk(db, rows)), repeat=args.repeat
+            )),
+        ]
+        report(
+            f"{args.readings} readings x {args.sensors} sensors from {args.machines} machines",
+            results,
+            items=args.readings,
+            unit="reading",
+        )
+
+        for label, seconds in results:
+            print(f"{label}: {args.readings / seconds:,.0f} readings/sec")
+    finally:
+        loop.run_until_complete(client.drop_database(db.name))
+        client.close()
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
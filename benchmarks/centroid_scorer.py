@@ -0,0 +1,87 @@
+"""
+Benchmark of nearest-centroid scoring of sensor readings.
+
+Compares a per-reading Python loop over the centroids of the cluster
+profiles, the baseline, with `CentroidScorer.score_readings`, which also
+arranges the readings as a matrix, and with `CentroidScorer.score` on a
+matrix that is already built, for batches of increasing size, and prints
+the readings/sec of each.
+
+Usage:
+
+    python -m benchmarks.centroid_scorer --readings 1 10 100 1000 10000 100000 --clusters 8 --sensors 20
+"""
+
+import argparse
+import math
+import random
+
+from benchmarks._timing import best_of, report
+from domain.utils.scoring import CentroidScorer
+
+
+def _score_loop(
+    cluster_profiles: dict[str, dict[str, dict[str, float]]], readings: list[dict[str, float]]
+) -> list[tuple[int, float]]:
+    """Assign each reading to its nearest centroid one reading at a time."""
+    centroids = {int(cluster_id): profile["centroid"] for cluster_id, profile in cluster_profiles.items()}
+    results = []
+    for values in readings:
+        distances = {
+            cluster_id: math.sqrt(sum((values[sensor] - center) ** 2 for sensor, center in centroid.items()))
+            for cluster_id, centroid in centroids.items()
+        }
+        nearest = min(distances, key=distances.get)
+        if distances[nearest] == 0:
+            results.append((nearest, 1.0))
+            continue
+        weights = {cluster_id: 1.0 / distance for cluster_id, distance in distances.items()}
+        results.append((nearest, weights[nearest] / sum(weights.values())))
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--readings", type=int, nargs="+", default=[1, 10, 100, 1000, 10000, 100000])
+    parser.add_argument("--clusters", type=int, default=8)
+    parser.add_argument("--sensors", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sensors = [f"sensor_{j:02d}" for j in range(args.sensors)]
+    cluster_profiles = {
+        str(cluster_id): {"centroid": {sensor: random.gauss(0, 3) for sensor in sensors}, "size": 100}
+        for cluster_id in range(args.clusters)
+    }
+    all_readings = [{sensor: random.gauss(0, 3) for sensor in sensors} for _ in range(max(args.readings))]
+    scorer = CentroidScorer.from_profiles(cluster_profiles)
+
+    for num_readings in args.readings:
+        readings = all_readings[:num_readings]
+        matrix = scorer.to_matrix(readings)
+
+        # Both implementations pick the same clusters
+        cluster_ids, _ = scorer.score(matrix)
+        assert [cluster_id for cluster_id, _ in _score_loop(cluster_profiles, readings)] == cluster_ids.tolist()
+
+        # Repeat small batches so that each measurement is long enough to time
+        number = max(1, 10000 // num_readings)
+        results = [
+            ("per-reading loop", best_of(lambda: _score_loop(cluster_profiles, readings), number, args.repeat)),
+            ("score_readings", best_of(lambda: scorer.score_readings(readings), number, args.repeat)),
+            ("score on a matrix", best_of(lambda: scorer.score(matrix), number, args.repeat)),
+        ]
+        report(
+            f"{num_readings} readings x {args.sensors} sensors, {args.clusters} clusters",
+            results,
+            items=num_readings,
+            unit="reading",
+        )
+
+        for label, seconds in results:
+            print(f"{label}: {num_readings / seconds:,.0f} readings/sec")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of decoding reading documents read back from the database.
+
+Compares building validated `SensorReading` models, the baseline, with
+building them through `model_construct` (`validate=False`), returning raw
+documents (`raw=True`), and returning raw documents of a projection of the
+timestamp and values only. Each variant starts from the BSON the server
+would send, so the projection also saves decoding the fields it leaves out.
+
+Usage:
+
+    python -m benchmarks.decode_documents --readings 10000 --sensors 20
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+import bson
+from bson import ObjectId
+
+from benchmarks._timing import best_of, report
+from domain.models import SensorReading
+from domain.utils.db import decode_documents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--readings", type=int, default=10000)
+    parser.add_argument("--sensors", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    machine_id = ObjectId()
+    start = datetime(2024, 1, 1)
+    docs = [
+        {
+            "_id": ObjectId(),
+            "timestamp": start + timedelta(seconds=i),
+            "values": {f"sensor_{j:02d}": random.gauss(0, 1) for j in range(args.sensors)},
+            "machine_id": machine_id,
+            "failure_id": None,
+        }
+        for i in range(args.readings)
+    ]
+    full = b"".join(bson.encode(doc) for doc in docs)
+    projected = b"".join(bson.encode({"timestamp": doc["timestamp"], "values": doc["values"]}) for doc in docs)
+
+    report(
+        f"{args.readings} readings x {args.sensors} sensors, from BSON",
+        [
+            ("validated models", best_of(
+                lambda: decode_documents(bson.decode_all(full), SensorReading), repeat=args.repeat
+            )),
+            ("model_construct", best_of(
+                lambda: decode_documents(bson.decode_all(full), SensorReading, validate=False), repeat=args.repeat
+            )),
+            ("raw documents", best_of(
+                lambda: decode_documents(bson.decode_all(full), SensorReading, raw=True), repeat=args.repeat
+            )),
+            ("raw projection", best_of(
+                lambda: decode_documents(bson.decode_all(projected), SensorReading, raw=True), repeat=args.repeat
+            )),
+        ],
+        items=args.readings,
+        unit="reading",
+    )
+
+    print(f"BSON bytes per reading: {len(full) / args.readings:.1f} full, {len(projected) / args.readings:.1f} projected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of one simulation step for a fleet of machines.
+
+Compares the per-machine loop of `SensorDataProducer.update_sensor_values`,
+run once per machine, with `FleetSimulator.step` followed by
+`FleetSimulator.to_sensor_data`, which produce the same readings format.
+The per-machine loop is reproduced here without the producer's Event Hubs
+and storage setup.
+
+Usage:
+
+    python -m benchmarks.fleet_step --machines 10 100 1000 10000
+"""
+
+import argparse
+import random
+from typing import Any
+
+from loguru import logger
+
+from benchmarks._timing import best_of, report
+from producer.models import FailureInfo
+from producer.services.fleet import FleetSimulator
+
+
+def _sensor_stats(num_sensors: int) -> dict[str, dict[str, float]]:
+    return {
+        f"Sensor {i}": {"mean": 0.0, "std": 1.0, "min": -3.0, "max": 3.0}
+        for i in range(1, num_sensors + 1)
+    }
+
+
+def _failure_patterns(num_sensors: int) -> dict[float, dict[str, dict[str, float]]]:
+    return {
+        1.0: {f"Sensor {i}": {"mean": 0.8, "std": 0.3} for i in range(1, num_sensors + 1)},
+        2.0: {f"Sensor {i}": {"mean": -0.8, "std": 0.3} for i in range(1, num_sensors + 1)},
+    }
+
+
+def _per_machine_step(
+    machines: list[dict[str, Any]],
+    sensor_stats: dict[str, dict[str, float]],
+    failure_patterns: dict[float, dict[str, dict[str, float]]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Advance every machine with the logic of `update_sensor_values`."""
+    tick = []
+    for machine in machines:
+        current_values = machine["current_values"]
+        readings: dict[str, float] = {}
+        has_failure = machine["active_failure"] is not None
+
+        for col, stats in sensor_stats.items():
+            drift = stats["std"] * 0.1
+            new_value = current_values.get(col, stats["mean"]) + random.normalvariate(0, drift)
+            new_value += 0.05 * (stats["mean"] - new_value)
+            new_value = max(min(new_value, stats["max"] * 1.2), stats["min"] * 1.2)
+            current_values[col] = new_value
+            readings[col] = round(new_value, 6)
+
+        if machine["active_failure"]:
+            failure = machine["active_failure"]
+            pattern = random.choice(list(failure_patterns.values()))
+            progress = min(1.0, failure.time / 10)
+            for col, stats in pattern.items():
+                if col in readings:
+                    failure_value = random.normalvariate(stats["mean"], stats["std"])
+                    readings[col] = round(readings[col] * (1 - progress) + failure_value * progress, 6)
+
+            failure.time += 1
+            if failure.time >= failure.duration:
+                machine["active_failure"] = None
+
+        elif random.random() < 0.05:
+            machine["active_failure"] = FailureInfo(time=0, duration=random.randint(30, 60))
+
+        tick.append((machine["machine_id"], {"readings": readings, "has_failure": has_failure}))
+
+    return tick
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--machines", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--sensors", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # The simulators log every failure that starts or ends
+    logger.remove()
+
+    sensor_stats = _sensor_stats(args.sensors)
+    failure_patterns = _failure_patterns(args.sensors)
+
+    for num_machines in args.machines:
+        machines = [
+            {
+                "machine_id": f"m{i:07d}",
+                "current_values": {col: random.normalvariate(0, 1) for col in sensor_stats},
+                "active_failure": None,
+            }
+            for i in range(num_machines)
+        ]
+        fleet = FleetSimulator(
+            sensor_stats, failure_patterns, num_machines=num_machines, num_sensors=args.sensors, seed=0
+        )
+        number = max(1, 10000 // num_machines)
+
+        report(
+            f"{num_machines} machines x {args.sensors} sensors",
+            [
+                ("per-machine loop", best_of(
+                    lambda: _per_machine_step(machines, sensor_stats, failure_patterns), number, args.repeat
+                )),
+                ("FleetSimulator.step", best_of(fleet.step, number, args.repeat)),
+                ("step + to_sensor_data", best_of(lambda: fleet.to_sensor_data(*fleet.step()), number, args.repeat)),
+            ],
+            items=num_machines,
+            unit="machine",
+        )
+
+
+if __name__ == "__main__":
+    main()
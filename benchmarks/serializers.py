@@ -0,0 +1,127 @@
+"""
+Benchmark of the message serialisers.
+
+Compares the reference `json` serialiser, which validates through the
+`SensorMessage` model, with the `pydantic`, `template`, `binary` and
+`binary32` serialisers, encoding one message per reading and one columnar
+micro-batch per tick. The peak memory allocated while encoding, traced
+with `tracemalloc`, and the encoded sizes are reported alongside the
+timings. Decoding with `decode_message` and `decode_batch_message` is
+then timed for the JSON, `binary` and `binary32` formats.
+
+Usage:
+
+    python -m benchmarks.serializers --readings 1000 --sensors 20
+"""
+
+import argparse
+import random
+from datetime import datetime
+
+from benchmarks._timing import best_of, peak_allocated, report
+from producer.models import SensorBatchMessage
+from producer.utils.serialization import SERIALIZERS, decode_batch_message, decode_message, get_serializer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--readings", type=int, default=1000)
+    parser.add_argument("--sensors", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    timestamp = datetime(2024, 1, 1, 12).isoformat()
+    sensors = [f"Sensor {i}" for i in range(1, args.sensors + 1)]
+    readings = [
+        (f"m{i:07d}", {sensor: round(random.gauss(0, 1), 6) for sensor in sensors}, random.random() < 0.05)
+        for i in range(args.readings)
+    ]
+    batch = SensorBatchMessage(
+        machine_ids=[machine_id for machine_id, _, _ in readings],
+        timestamps=[timestamp],
+        sensors=sensors,
+        values=[list(values.values()) for _, values, _ in readings],
+        has_failure=[has_failure for _, _, has_failure in readings],
+    )
+
+    # The reference serialiser first, as the baseline
+    names = ["json", *(name for name in SERIALIZERS if name != "json")]
+    serializers = {name: get_serializer(name) for name in names}
+
+    encoders = {
+        name: lambda serializer=serializer: [
+            serializer.serialize(machine_id, values, has_failure, timestamp)
+            for machine_id, values, has_failure in readings
+        ]
+        for name, serializer in serializers.items()
+    }
+    report(
+        f"One message per reading, {args.readings} readings x {args.sensors} sensors",
+        [(name, best_of(encode, repeat=args.repeat)) for name, encode in encoders.items()],
+        items=args.readings,
+        unit="reading",
+        allocations=[peak_allocated(encode) for encode in encoders.values()],
+    )
+
+    batch_encoders = {
+        name: lambda serializer=serializer: serializer.serialize_batch(batch)
+        for name, serializer in serializers.items()
+    }
+    report(
+        f"One micro-batch of {args.readings} readings x {args.sensors} sensors",
+        [(name, best_of(encode, repeat=args.repeat)) for name, encode in batch_encoders.items()],
+        items=args.readings,
+        unit="reading",
+        allocations=[peak_allocated(encode) for encode in batch_encoders.values()],
+    )
+
+    # The JSON serialisers share one format, so json stands for all of them
+    decoders = {name: serializers[name] for name in ("json", "binary", "binary32")}
+    bodies = {
+        name: [
+            serializer.serialize(machine_id, values, has_failure, timestamp)
+            for machine_id, values, has_failure in readings
+        ]
+        for name, serializer in decoders.items()
+    }
+    report(
+        f"Decoding one message per reading, {args.readings} readings x {args.sensors} sensors",
+        [
+            (name, best_of(
+                lambda name=name, serializer=serializer: [
+                    decode_message(body, serializer.content_type) for body in bodies[name]
+                ],
+                repeat=args.repeat,
+            ))
+            for name, serializer in decoders.items()
+        ],
+        items=args.readings,
+        unit="reading",
+    )
+
+    batch_bodies = {name: serializer.serialize_batch(batch) for name, serializer in decoders.items()}
+    report(
+        f"Decoding one micro-batch of {args.readings} readings x {args.sensors} sensors",
+        [
+            (name, best_of(
+                lambda name=name, serializer=serializer: decode_batch_message(
+                    batch_bodies[name], serializer.batch_content_type
+                ),
+                repeat=args.repeat,
+            ))
+            for name, serializer in decoders.items()
+        ],
+        items=args.readings,
+        unit="reading",
+    )
+
+    print("Encoded bytes per reading")
+    machine_id, values, has_failure = readings[0]
+    for name, serializer in serializers.items():
+        message = len(serializer.serialize(machine_id, values, has_failure, timestamp))
+        batched = len(serializer.serialize_batch(batch)) / args.readings
+        print(f"  {name:<8}  {message:6d} as a message  {batched:8.1f} in a micro-batch")
+
+
+if __name__ == "__main__":
+    main()
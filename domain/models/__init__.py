@@ -10,17 +10,21 @@ This package serves as a single source of truth for data models across all
 microservices in the system, eliminating duplication and enforcing consistency.
 """
 
+from .bucket import ReadingBucket
 from .cluster import Cluster
 from .drift import DriftEvent
 from .failure import Failure
 from .machine import Machine
 from .prediction import SensorPrediction
 from .reading import SensorReading
+from .rollup import SensorRollup
 from .version import ModelVersion
 
 __all__ = [
     "Machine",
     "SensorReading",
+    "ReadingBucket",
+    "SensorRollup",
     "Failure",
     "Cluster",
     "SensorPrediction",
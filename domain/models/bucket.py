@@ -0,0 +1,53 @@
+"""
+Time-bucketed sensor reading representation for the Sensor Failure Detection System.
+
+This module defines the ReadingBucket model that stores the readings of one
+machine over a fixed time window in a single document, as an alternative
+layout to one SensorReading document per reading.
+"""
+
+from datetime import datetime
+from pydantic import Field
+
+from domain.models.base import MongoBaseModel, PyObjectId
+
+
+class ReadingBucket(MongoBaseModel):
+    """
+    Model representing a bucket of sensor readings.
+
+    This class stores the readings of a machine within a fixed time window
+    as columns: one array of timestamps, one array of failure references and
+    one array of values per sensor, all aligned by position. Per-sensor
+    minimum and maximum values and the number of readings are maintained as
+    the bucket fills, so that summaries can be read without unpacking it.
+
+    Attributes:
+        id (ObjectId): MongoDB document ID
+        machine_id (ObjectId): Reference to the machine that produced the readings
+        start_time (datetime): Start of the bucket's time window (inclusive)
+        end_time (datetime): End of the bucket's time window (exclusive)
+        count (int): Number of readings in the bucket
+        sensors (List[str]): Sorted names of the sensors of every reading in the bucket
+        timestamps (List[datetime]): When each reading was taken
+        failure_ids (List[ObjectId]): Reference to an active failure for each reading, if any
+        values (Dict[str, List[float]]): Sensor measurements, one array per sensor
+        min_values (Dict[str, float]): Minimum value of each sensor in the bucket
+        max_values (Dict[str, float]): Maximum value of each sensor in the bucket
+    """
+    machine_id: PyObjectId = Field(..., description="Reference to the machine that produced the readings")
+    start_time: datetime = Field(..., description="Start of the bucket's time window (inclusive)")
+    end_time: datetime = Field(..., description="End of the bucket's time window (exclusive)")
+    count: int = Field(default=0, description="Number of readings in the bucket")
+    sensors: list[str] = Field(default_factory=list, description="Sorted names of the sensors of every reading in the bucket")
+    timestamps: list[datetime] = Field(default_factory=list, description="When each reading was taken")
+    failure_ids: list[PyObjectId | None] = Field(default_factory=list, description="Reference to an active failure for each reading, if any")
+    values: dict[str, list[float]] = Field(default_factory=dict, description="Sensor measurements, one array per sensor")
+    min_values: dict[str, float] = Field(default_factory=dict, description="Minimum value of each sensor in the bucket")
+    max_values: dict[str, float] = Field(default_factory=dict, description="Maximum value of each sensor in the bucket")
+
+    class Config:
+        collection = "reading_buckets"
+
+    def __str__(self) -> str:
+        return f"Bucket for {self.machine_id} from {self.start_time} ({self.count} readings)"
@@ -27,7 +27,8 @@ class Cluster(MongoBaseModel):
         mlflow_run_id (str): Unique identifier for the MLflow run where this model is tracked
         mlflow_model_version (int): MLflow model registry version number
         created_at (datetime): Timestamp when this record was created
-        is_active (bool): Whether this is the currently active clustering model
+        is_active (bool): Whether this is the currently active clustering model (set on
+            the cluster returned by get_active_cluster, not kept up to date on stored clusters)
         n_clusters (int): Number of clusters in this model
         silhouette_score (float): Clustering quality metric
         cluster_profiles (Dict): JSON representation of the cluster centroids and characteristics
@@ -0,0 +1,72 @@
+"""
+Sensor rollup representation for the Sensor Failure Detection System.
+
+This module defines the SensorRollup model that stores pre-aggregated
+statistics of a machine's sensor values over a minute or an hour, so that
+long-range charts can be drawn without reading the raw readings.
+"""
+
+import math
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from domain.models.base import MongoBaseModel, PyObjectId
+
+
+class SensorStats(BaseModel):
+    """
+    Running statistics of one sensor within a rollup period.
+
+    Attributes:
+        count (int): Number of values
+        sum (float): Sum of the values
+        sum_sq (float): Sum of the squared values
+        min (float): Minimum value
+        max (float): Maximum value
+    """
+    count: int = Field(default=0, description="Number of values")
+    sum: float = Field(default=0.0, description="Sum of the values")
+    sum_sq: float = Field(default=0.0, description="Sum of the squared values")
+    min: float | None = Field(None, description="Minimum value")
+    max: float | None = Field(None, description="Maximum value")
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the values, or None if there are none."""
+        return self.sum / self.count if self.count else None
+
+    @property
+    def std(self) -> float | None:
+        """Population standard deviation of the values, or None if there are none."""
+        if not self.count:
+            return None
+        return math.sqrt(max(self.sum_sq / self.count - self.mean ** 2, 0.0))
+
+
+class SensorRollup(MongoBaseModel):
+    """
+    Model representing pre-aggregated sensor statistics.
+
+    This class stores, for one machine and one period at a given resolution,
+    the count, sum, sum of squares, minimum and maximum of each sensor. The
+    statistics are maintained incrementally as readings are written.
+
+    Attributes:
+        id (ObjectId): MongoDB document ID
+        machine_id (ObjectId): Reference to the machine that produced the readings
+        resolution (str): Length of the period ("minute" or "hour")
+        start_time (datetime): Start of the period
+        count (int): Number of readings in the period
+        sensors (Dict[str, SensorStats]): Statistics of each sensor in the period
+    """
+    machine_id: PyObjectId = Field(..., description="Reference to the machine that produced the readings")
+    resolution: str = Field(..., description="Length of the period (\"minute\" or \"hour\")")
+    start_time: datetime = Field(..., description="Start of the period")
+    count: int = Field(default=0, description="Number of readings in the period")
+    sensors: dict[str, SensorStats] = Field(default_factory=dict, description="Statistics of each sensor in the period")
+
+    class Config:
+        collection = "sensor_rollups"
+
+    def __str__(self) -> str:
+        return f"{self.resolution.capitalize()} rollup for {self.machine_id} at {self.start_time}"
@@ -13,7 +13,21 @@ from .db import (
     get_failure_readings,
     get_reading_predictions,
     get_active_failures,
-    get_readings_in_timerange
+    get_active_cluster,
+    get_readings_in_timerange,
+    decode_documents,
+    get_documents_by_ids,
+    prefetch_reading_relations,
+    iter_cursor_batches,
+    iter_machine_readings,
+    iter_failure_readings,
+    iter_readings_in_timerange,
+    encode_page_token,
+    decode_page_token,
+    get_keyset_page,
+    get_machine_readings_page,
+    get_predictions_page,
+    aggregate_sensor_stats
 )
 
 from .crud import (
@@ -21,18 +35,60 @@ from .crud import (
     update_document,
     delete_document,
     get_documents,
+    iter_documents,
     create_machine,
     update_machine_last_seen,
     create_sensor_reading,
+    create_sensor_readings_bulk,
     create_failure,
     resolve_failure,
     create_prediction,
+    create_predictions_bulk,
     create_cluster_model,
+    activate_cluster,
     create_drift_event,
     create_model_version,
     mark_model_version_processed
 )
 
+from .indexes import (
+    INDEX_PLAN,
+    PlannedIndex,
+    ensure_indexes,
+    report_indexes,
+    explain_index
+)
+
+from .writebehind import LastSeenBuffer
+
+from .cache import ActiveClusterCache
+
+from .drift import DriftDetector
+
+from .connections import (
+    ClientOptions,
+    get_client,
+    ensure_indexes_once,
+    close_clients
+)
+
+from .buckets import (
+    bucket_start,
+    append_reading_to_bucket,
+    append_readings_to_buckets,
+    unpack_bucket,
+    iter_bucketed_readings,
+    get_bucketed_readings,
+    create_timeseries_readings_collection
+)
+
+from .rollups import (
+    ROLLUP_RESOLUTIONS,
+    update_rollups,
+    get_rollups,
+    get_sensor_rollup_series
+)
+
 __all__ = [
     # Database connection and relationships
     "init_db",
@@ -42,7 +98,30 @@ __all__ = [
     "get_failure_readings",
     "get_reading_predictions",
     "get_active_failures",
+    "get_active_cluster",
     "get_readings_in_timerange",
+    "decode_documents",
+    
+    # Batched lookups
+    "get_documents_by_ids",
+    "prefetch_reading_relations",
+    
+    # Streaming reads
+    "iter_cursor_batches",
+    "iter_machine_readings",
+    "iter_failure_readings",
+    "iter_readings_in_timerange",
+    "iter_documents",
+    
+    # Keyset pagination
+    "encode_page_token",
+    "decode_page_token",
+    "get_keyset_page",
+    "get_machine_readings_page",
+    "get_predictions_page",
+    
+    # Server-side aggregation
+    "aggregate_sensor_stats",
     
     # CRUD operations
     "create_document",
@@ -54,11 +133,51 @@ __all__ = [
     "create_machine",
     "update_machine_last_seen",
     "create_sensor_reading",
+    "create_sensor_readings_bulk",
     "create_failure",
     "resolve_failure",
     "create_prediction",
+    "create_predictions_bulk",
     "create_cluster_model",
+    "activate_cluster",
     "create_drift_event",
     "create_model_version",
-    "mark_model_version_processed"
+    "mark_model_version_processed",
+    
+    # Index planning
+    "INDEX_PLAN",
+    "PlannedIndex",
+    "ensure_indexes",
+    "report_indexes",
+    "explain_index",
+    
+    # Client management
+    "ClientOptions",
+    "get_client",
+    "ensure_indexes_once",
+    "close_clients",
+    
+    # Write-behind buffering
+    "LastSeenBuffer",
+    
+    # Caching
+    "ActiveClusterCache",
+    
+    # Drift detection
+    "DriftDetector",
+    
+    # Bucketed readings
+    "bucket_start",
+    "append_reading_to_bucket",
+    "append_readings_to_buckets",
+    "unpack_bucket",
+    "iter_bucketed_readings",
+    "get_bucketed_readings",
+    "create_timeseries_readings_collection",
+    
+    # Rollups
+    "ROLLUP_RESOLUTIONS",
+    "update_rollups",
+    "get_rollups",
+    "get_sensor_rollup_series"
 ]
\ No newline at end of file
@@ -0,0 +1,328 @@
+"""
+Time-bucketed storage for sensor readings.
+
+This module provides an optional storage mode in which each document holds
+a machine's readings for a fixed time window (see ReadingBucket), so that a
+machine producing a reading per second needs one document and one index
+entry per window rather than per reading. Write helpers $push readings into
+the current bucket, creating it on demand, and read helpers unpack buckets
+back into SensorReading models for a time range.
+
+Where the server supports native time-series collections, the readings
+collection can instead be created as one, which applies the same layout
+internally while the existing SensorReading helpers keep working unchanged.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne, DESCENDING
+from pymongo.errors import CollectionInvalid, OperationFailure
+from bson import ObjectId
+
+from domain.models import ReadingBucket, SensorReading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_SECONDS = 3600
+DEFAULT_MAX_BUCKET_SIZE = 3600
+
+
+def bucket_start(timestamp: datetime, bucket_seconds: int = DEFAULT_BUCKET_SECONDS) -> datetime:
+    """
+    Get the start of the bucket window containing a timestamp
+
+    Args:
+        timestamp: Time of a reading
+        bucket_seconds: Length of the bucket window in seconds
+
+    Returns:
+        Timestamp floored to a multiple of bucket_seconds since the epoch
+    """
+    epoch = datetime(1970, 1, 1, tzinfo=timestamp.tzinfo)
+    elapsed = (timestamp - epoch) // timedelta(microseconds=1)
+    return timestamp - timedelta(microseconds=elapsed % (bucket_seconds * 1_000_000))
+
+
+def _bucket_filter(
+    machine_id: ObjectId,
+    window_start: datetime,
+    sensors: list[str],
+    size: int,
+    max_bucket_size: int
+) -> dict[str, Any]:
+    """Match a bucket of the window with the same sensors and room for size more readings."""
+    return {
+        "machine_id": machine_id,
+        "start_time": window_start,
+        "sensors": sensors,
+        "count": {"$lte": max_bucket_size - size}
+    }
+
+
+def _bucket_update(
+    timestamps: list[datetime],
+    failure_ids: list[ObjectId | None],
+    values: list[dict[str, float]],
+    window_end: datetime
+) -> dict[str, Any]:
+    """Build the update that appends readings to a bucket and maintains its summaries."""
+    sensors = {sensor for reading_values in values for sensor in reading_values}
+    columns = {sensor: [reading_values[sensor] for reading_values in values] for sensor in sensors}
+
+    update: dict[str, Any] = {
+        "$push": {
+            "timestamps": {"$each": timestamps},
+            "failure_ids": {"$each": failure_ids},
+            **{f"values.{sensor}": {"$each": column} for sensor, column in columns.items()}
+        },
+        "$inc": {"count": len(timestamps)},
+        "$setOnInsert": {"end_time": window_end}
+    }
+    if columns:
+        update["$min"] = {f"min_values.{sensor}": min(column) for sensor, column in columns.items()}
+        update["$max"] = {f"max_values.{sensor}": max(column) for sensor, column in columns.items()}
+    return update
+
+
+async def append_reading_to_bucket(
+    db: AsyncIOMotorDatabase,
+    machine_id: str | ObjectId,
+    values: dict[str, float],
+    timestamp: datetime | None = None,
+    failure_id: str | ObjectId = None,
+    bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+    max_bucket_size: int = DEFAULT_MAX_BUCKET_SIZE
+) -> None:
+    """
+    Append a sensor reading to the machine's bucket for its time window
+
+    The bucket is created if it does not exist yet. Once a bucket holds
+    max_bucket_size readings, further readings in the same window go to a
+    new bucket, which keeps documents well below the size limit. Every
+    reading in a bucket carries the same sensors, since the per-sensor
+    arrays are aligned with the timestamps by position, so a reading with a
+    different set of sensors goes to a separate bucket of the same window.
+
+    Args:
+        db: MongoDB database
+        machine_id: ID of the machine
+        values: Sensor measurements
+        timestamp: When the reading was taken (defaults to current time)
+        failure_id: ID of the associated failure, if any
+        bucket_seconds: Length of the bucket window in seconds
+        max_bucket_size: Maximum number of readings per bucket
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+
+    if isinstance(failure_id, str) and ObjectId.is_valid(failure_id):
+        failure_id = ObjectId(failure_id)
+
+    timestamp = timestamp or datetime.now()
+    window_start = bucket_start(timestamp, bucket_seconds)
+
+    await db[ReadingBucket.Config.collection].update_one(
+        _bucket_filter(machine_id, window_start, sorted(values), 1, max_bucket_size),
+        _bucket_update([timestamp], [failure_id], [values], window_start + timedelta(seconds=bucket_seconds)),
+        upsert=True
+    )
+
+
+async def append_readings_to_buckets(
+    db: AsyncIOMotorDatabase,
+    readings: list[SensorReading],
+    bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+    max_bucket_size: int = DEFAULT_MAX_BUCKET_SIZE
+) -> int:
+    """
+    Append many sensor readings, possibly from many machines, to their buckets
+
+    Readings are grouped by machine, time window and set of sensors, and
+    each group is appended in chunks of at most max_bucket_size readings,
+    each with a single upsert using $push with $each, all sent in one
+    bulk_write. A chunk only goes into a bucket with room for all of it,
+    otherwise a new bucket is started, so buckets never exceed
+    max_bucket_size.
+
+    Args:
+        db: MongoDB database
+        readings: Sensor readings to append
+        bucket_seconds: Length of the bucket window in seconds
+        max_bucket_size: Maximum number of readings per bucket
+
+    Returns:
+        Number of bucket writes issued
+    """
+    groups: dict[tuple[ObjectId, datetime, tuple[str, ...]], list[SensorReading]] = defaultdict(list)
+    for reading in readings:
+        window_start = bucket_start(reading.timestamp, bucket_seconds)
+        groups[(reading.machine_id, window_start, tuple(sorted(reading.values)))].append(reading)
+
+    operations = []
+    for (machine_id, window_start, sensors), group in groups.items():
+        for i in range(0, len(group), max_bucket_size):
+            chunk = group[i:i + max_bucket_size]
+            operations.append(UpdateOne(
+                _bucket_filter(machine_id, window_start, list(sensors), len(chunk), max_bucket_size),
+                _bucket_update(
+                    [reading.timestamp for reading in chunk],
+                    [reading.failure_id for reading in chunk],
+                    [reading.values for reading in chunk],
+                    window_start + timedelta(seconds=bucket_seconds)
+                ),
+                upsert=True
+            ))
+
+    if operations:
+        await db[ReadingBucket.Config.collection].bulk_write(operations, ordered=True)
+
+    return len(operations)
+
+
+def unpack_bucket(
+    doc: dict[str, Any],
+    start_time: datetime | None = None,
+    end_time: datetime | None = None
+) -> list[SensorReading]:
+    """
+    Unpack a raw bucket document into sensor readings
+
+    Args:
+        doc: Raw ReadingBucket document
+        start_time: Optional start of the time range to keep (inclusive)
+        end_time: Optional end of the time range to keep (inclusive)
+
+    Returns:
+        List of sensor readings in the bucket's insertion order; the readings
+        have no ID of their own
+    """
+    sensors = list(doc.get("values", {}).items())
+    failure_ids = doc.get("failure_ids") or [None] * len(doc["timestamps"])
+
+    readings = []
+    for i, (timestamp, failure_id) in enumerate(zip(doc["timestamps"], failure_ids)):
+        if (start_time is not None and timestamp < start_time) or (end_time is not None and timestamp > end_time):
+            continue
+        readings.append(SensorReading.model_construct(
+            id=None,
+            timestamp=timestamp,
+            values={sensor: column[i] for sensor, column in sensors},
+            machine_id=doc["machine_id"],
+            failure_id=failure_id
+        ))
+
+    return readings
+
+
+async def iter_bucketed_readings(
+    db: AsyncIOMotorDatabase,
+    machine_id: str | ObjectId,
+    start_time: datetime,
+    end_time: datetime
+) -> AsyncIterator[list[SensorReading]]:
+    """
+    Stream readings for a machine within a time range, one bucket at a time
+
+    Args:
+        db: MongoDB database
+        machine_id: ID of the machine
+        start_time: Start of the time range
+        end_time: End of the time range
+
+    Yields:
+        Readings of each overlapping bucket within the range, buckets ordered
+        by start_time (newest first) and readings sorted by timestamp (newest first)
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+
+    cursor = db[ReadingBucket.Config.collection].find({
+        "machine_id": machine_id,
+        "start_time": {"$lte": end_time},
+        "end_time": {"$gt": start_time}
+    }).sort("start_time", DESCENDING)
+
+    async for doc in cursor:
+        readings = unpack_bucket(doc, start_time, end_time)
+        if readings:
+            readings.sort(key=lambda reading: reading.timestamp, reverse=True)
+            yield readings
+
+
+async def get_bucketed_readings(
+    db: AsyncIOMotorDatabase,
+    machine_id: str | ObjectId,
+    start_time: datetime,
+    end_time: datetime
+) -> list[SensorReading]:
+    """
+    Get readings for a machine within a time range from bucketed storage
+
+    Args:
+        db: MongoDB database
+        machine_id: ID of the machine
+        start_time: Start of the time range
+        end_time: End of the time range
+
+    Returns:
+        List of readings in the specified time range, sorted by timestamp (newest first)
+    """
+    readings = [
+        reading
+        async for batch in iter_bucketed_readings(db, machine_id, start_time, end_time)
+        for reading in batch
+    ]
+    # Overflow buckets share a window, so their readings may interleave
+    readings.sort(key=lambda reading: reading.timestamp, reverse=True)
+    return readings
+
+
+async def create_timeseries_readings_collection(
+    db: AsyncIOMotorDatabase,
+    granularity: str = "seconds",
+    expire_after_seconds: int | None = None
+) -> bool:
+    """
+    Create the readings collection as a native time-series collection
+
+    Must be called before init_db and before any reading is written, since
+    creating the readings indexes creates the collection and an existing
+    collection cannot be converted. If the collection already exists, or
+    the server does not support time-series collections, as with the
+    CosmosDB API for MongoDB, the collection is left as it is and a warning
+    is logged.
+
+    Args:
+        db: MongoDB database
+        granularity: Expected interval between readings of a machine
+            ("seconds", "minutes" or "hours")
+        expire_after_seconds: Optional retention period for readings
+
+    Returns:
+        True if the time-series collection was created, False otherwise
+    """
+    options: dict[str, Any] = {
+        "timeseries": {"timeField": "timestamp", "metaField": "machine_id", "granularity": granularity}
+    }
+    if expire_after_seconds is not None:
+        options["expireAfterSeconds"] = expire_after_seconds
+
+    collection = SensorReading.Config.collection
+    existing = await db.list_collection_names(filter={"name": collection})
+    if existing:
+        logger.warning(
+            "Collection %r already exists and cannot be converted to a time-series collection; "
+            "call create_timeseries_readings_collection before init_db", collection
+        )
+        return False
+
+    try:
+        await db.create_collection(collection, **options)
+    except (CollectionInvalid, OperationFailure) as err:
+        logger.warning("Time-series collection %r not created: %s", collection, err)
+        return False
+
+    return True
@@ -0,0 +1,184 @@
+"""
+In-process cache of the active clustering model.
+
+This module keeps the active Cluster, including its cluster_profiles, and
+the latest unprocessed ModelVersion in memory so that hot-path prediction
+never queries the database per request. The cache is refreshed whenever a
+change stream reports a change to either collection, and falls back to
+polling where change streams are unavailable, such as on standalone servers.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import DESCENDING
+from pymongo.errors import OperationFailure
+
+from domain.models import Cluster, ModelVersion
+from domain.utils.db import ACTIVE_CLUSTER_COLLECTION, get_active_cluster
+
+logger = logging.getLogger(__name__)
+
+# Errors of deployments without change streams: standalone servers
+# (40573), and servers that do not know the $changeStream stage (40324)
+# or command options it needs (115)
+CHANGE_STREAMS_UNSUPPORTED_CODES = frozenset({40573, 40324, 115})
+
+
+class ActiveClusterCache:
+    """
+    Caches the active cluster and the latest unprocessed model version.
+
+    Reads are served from memory once the cache has been loaded. Hits,
+    misses and staleness are tracked so that services can export them as
+    metrics.
+
+    Attributes:
+        db: MongoDB database
+        poll_interval: Seconds between refreshes while no change stream is open
+        hits: Number of reads served from memory
+        misses: Number of reads that had to load from the database
+        watching: Whether a change stream is currently open
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, poll_interval: float = 30.0) -> None:
+        self.db = db
+        self.poll_interval = poll_interval
+        self.hits = 0
+        self.misses = 0
+        self.watching = False
+        self._cluster: Cluster | None = None
+        self._model_version: ModelVersion | None = None
+        self._loaded = False
+        self._current_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "ActiveClusterCache":
+        await self.refresh()
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads served from memory, or 0.0 before any read."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def staleness(self) -> float | None:
+        """
+        Seconds since the cached values were last known to be current
+
+        The values are known to be current after each refresh and, while a
+        change stream is open, each time the stream returns, whether with a
+        change or with an empty batch that advances its resume token. This
+        is None if the cache has never been loaded.
+        """
+        if self._current_at is None:
+            return None
+        return time.monotonic() - self._current_at
+
+    async def refresh(self) -> None:
+        """
+        Reload the active cluster and the latest unprocessed model version
+        """
+        async with self._lock:
+            cluster = await get_active_cluster(self.db, raw=True)
+            model_version = await self.db[ModelVersion.Config.collection].find_one(
+                {"is_processed": False}, sort=[("created_at", DESCENDING)]
+            )
+            self._cluster = Cluster(**cluster) if cluster else None
+            self._model_version = ModelVersion(**model_version) if model_version else None
+            self._loaded = True
+            self._current_at = time.monotonic()
+
+    async def _ensure_loaded(self) -> None:
+        """Count the read as a hit, or load the cache and count it as a miss."""
+        if self._loaded:
+            self.hits += 1
+        else:
+            self.misses += 1
+            await self.refresh()
+
+    async def get_active_cluster(self) -> Cluster | None:
+        """
+        Get the active cluster
+
+        Returns:
+            The active cluster, or None if no cluster is active
+        """
+        await self._ensure_loaded()
+        return self._cluster
+
+    async def get_latest_model_version(self) -> ModelVersion | None:
+        """
+        Get the most recently created unprocessed model version
+
+        Returns:
+            The latest unprocessed model version, or None if there is none
+        """
+        await self._ensure_loaded()
+        return self._model_version
+
+    async def _watch(self) -> None:
+        """Refresh on every change to the active cluster pointer, clusters or model versions."""
+        collections = [ACTIVE_CLUSTER_COLLECTION, Cluster.Config.collection, ModelVersion.Config.collection]
+        pipeline = [{"$match": {"ns.coll": {"$in": collections}}}]
+        async with self.db.watch(pipeline) as stream:
+            self.watching = True
+            # Changes made before the stream opened are picked up by this refresh
+            await self.refresh()
+            while stream.alive:
+                change = await stream.try_next()
+                if change is not None:
+                    await self.refresh()
+                else:
+                    # No change up to the stream's latest resume token
+                    self._current_at = time.monotonic()
+
+    async def _run(self) -> None:
+        """Keep the cache current with a change stream, polling while none is available."""
+        supported = True
+        while True:
+            if supported:
+                try:
+                    await self._watch()
+                except OperationFailure as err:
+                    if err.code in CHANGE_STREAMS_UNSUPPORTED_CODES:
+                        logger.info("Change streams are unavailable (%s), polling every %ss", err, self.poll_interval)
+                        supported = False
+                    else:
+                        logger.warning("Change stream failed, reopening in %ss: %s", self.poll_interval, err)
+                except Exception:
+                    logger.exception("Change stream failed, reopening in %ss", self.poll_interval)
+                finally:
+                    self.watching = False
+
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Refreshing the active cluster cache failed")
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """
+        Start keeping the cache current in the background of the running event loop
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stop keeping the cache current
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
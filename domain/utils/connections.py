@@ -0,0 +1,151 @@
+"""
+Shared MongoDB/CosmosDB client management.
+
+Motor clients own a connection pool and background monitoring tasks, so
+they are expensive to create and meant to be shared. This module keeps one
+client per connection string for the whole process, configures its pool,
+timeouts and wire compression from environment variables, and records which
+databases have already had their indexes ensured so that this happens once
+per process rather than on every connection.
+
+Pool settings are read from the following environment variables:
+
+    MONGO_MAX_POOL_SIZE                 Maximum connections per server (default 100)
+    MONGO_MIN_POOL_SIZE                 Connections kept open per server (default 0)
+    MONGO_MAX_IDLE_TIME_MS              Idle time before a connection is closed (default unset)
+    MONGO_CONNECT_TIMEOUT_MS            Timeout for opening a connection (default 20000)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS   Timeout for finding a usable server (default 30000)
+    MONGO_COMPRESSORS                   Comma-separated wire compressors, e.g. "zstd,snappy" (default unset)
+"""
+
+import asyncio
+import os
+from typing import Any
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pydantic import BaseModel, Field
+
+from domain.utils.indexes import ensure_indexes
+
+
+class ClientOptions(BaseModel):
+    """
+    Connection pool, timeout and compression options for a Motor client.
+
+    Attributes:
+        max_pool_size (int): Maximum number of connections per server
+        min_pool_size (int): Number of connections kept open per server
+        max_idle_time_ms (int, optional): Idle time before a pooled connection is closed
+        connect_timeout_ms (int): Timeout for opening a connection
+        server_selection_timeout_ms (int): Timeout for finding a usable server
+        compressors (str, optional): Comma-separated wire compressors in order of preference
+    """
+    max_pool_size: int = Field(default=100, description="Maximum number of connections per server")
+    min_pool_size: int = Field(default=0, description="Number of connections kept open per server")
+    max_idle_time_ms: int | None = Field(None, description="Idle time before a pooled connection is closed")
+    connect_timeout_ms: int = Field(default=20000, description="Timeout for opening a connection")
+    server_selection_timeout_ms: int = Field(default=30000, description="Timeout for finding a usable server")
+    compressors: str | None = Field(None, description="Comma-separated wire compressors in order of preference")
+
+    @classmethod
+    def from_env(cls) -> "ClientOptions":
+        """Read the options from MONGO_* environment variables, falling back to the defaults."""
+        options: dict[str, Any] = {}
+        for field, variable in (
+            ("max_pool_size", "MONGO_MAX_POOL_SIZE"),
+            ("min_pool_size", "MONGO_MIN_POOL_SIZE"),
+            ("max_idle_time_ms", "MONGO_MAX_IDLE_TIME_MS"),
+            ("connect_timeout_ms", "MONGO_CONNECT_TIMEOUT_MS"),
+            ("server_selection_timeout_ms", "MONGO_SERVER_SELECTION_TIMEOUT_MS")
+        ):
+            if os.environ.get(variable):
+                options[field] = int(os.environ[variable])
+
+        if os.environ.get("MONGO_COMPRESSORS"):
+            options["compressors"] = os.environ["MONGO_COMPRESSORS"]
+
+        return cls(**options)
+
+    def to_client_kwargs(self) -> dict[str, Any]:
+        """Convert the options to AsyncIOMotorClient keyword arguments."""
+        kwargs: dict[str, Any] = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "connectTimeoutMS": self.connect_timeout_ms,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms
+        }
+        if self.max_idle_time_ms is not None:
+            kwargs["maxIdleTimeMS"] = self.max_idle_time_ms
+        if self.compressors:
+            kwargs["compressors"] = self.compressors
+        return kwargs
+
+
+_clients: dict[str, AsyncIOMotorClient] = {}
+_indexed_databases: set[tuple[str, str]] = set()
+_index_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+
+def get_client(connection_string: str, options: ClientOptions | None = None) -> AsyncIOMotorClient:
+    """
+    Get the shared client for a connection string, creating it on first use
+
+    Options only take effect when the client is created; later calls for
+    the same connection string return the existing client unchanged.
+
+    Args:
+        connection_string: MongoDB connection string
+        options: Pool, timeout and compression options (defaults to ClientOptions.from_env())
+
+    Returns:
+        Shared MongoDB client instance
+    """
+    client = _clients.get(connection_string)
+    if client is None:
+        options = options or ClientOptions.from_env()
+        client = AsyncIOMotorClient(connection_string, **options.to_client_kwargs())
+        _clients[connection_string] = client
+    return client
+
+
+async def ensure_indexes_once(db: AsyncIOMotorDatabase, connection_string: str) -> bool:
+    """
+    Ensure the planned indexes of a database, once per process
+
+    Concurrent calls for the same database wait for the first one, and a
+    database only counts as done once its indexes have been created, so a
+    failed attempt is retried by the next call.
+
+    Args:
+        db: MongoDB database
+        connection_string: Connection string the database was reached through
+
+    Returns:
+        True if the indexes were ensured by this call, False if already done
+    """
+    key = (connection_string, db.name)
+    if key in _indexed_databases:
+        return False
+
+    async with _index_locks.setdefault(key, asyncio.Lock()):
+        if key in _indexed_databases:
+            return False
+
+        await ensure_indexes(db)
+        _indexed_databases.add(key)
+
+    return True
+
+
+def close_clients() -> None:
+    """
+    Close all shared clients
+
+    This should be called on shutdown, or before reusing the registry from
+    a different event loop, since Motor clients are bound to the loop they
+    were first used on.
+    """
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+    _indexed_databases.clear()
+    _index_locks.clear()
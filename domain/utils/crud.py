@@ -5,9 +5,11 @@ This module provides generic create, read, update, and delete functionality
 for MongoDB documents, as well as specific helpers for the sensor models.
 """
 
-from typing import Any, Type, TypeVar
+from typing import Any, AsyncIterator, Sequence, Type, TypeVar
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
 from domain.models.base import MongoBaseModel
@@ -20,6 +22,9 @@ from domain.models import (
     DriftEvent,
     ModelVersion
 )
+from domain.utils.db import ACTIVE_CLUSTER_COLLECTION, ACTIVE_CLUSTER_POINTER_ID, iter_cursor_batches
+from domain.utils.writebehind import LastSeenBuffer
+from domain.utils.rollups import update_rollups
 
 T = TypeVar('T', bound=MongoBaseModel)
 
@@ -135,6 +140,42 @@ async def get_documents(
     return [model_class(**doc) for doc in docs]
 
 
+async def iter_documents(
+    db: AsyncIOMotorDatabase, 
+    collection: str, 
+    model_class: Type[T], 
+    query: dict[str, Any] = None,
+    sort_by: list[tuple] = None,
+    batch_size: int = 1000,
+    raw: bool = False,
+    validate: bool = True
+) -> AsyncIterator[list[T] | list[dict[str, Any]]]:
+    """
+    Stream documents matching a query in batches
+    
+    Args:
+        db: MongoDB database
+        collection: Collection name
+        model_class: Pydantic model class to convert documents to
+        query: MongoDB query (default: empty query that matches all documents)
+        sort_by: List of (field, direction) tuples for sorting
+        batch_size: Number of documents per batch
+        raw: If True, yield raw documents instead of model instances
+        validate: If False, build models without validation
+        
+    Yields:
+        Batches of documents matching the query
+    """
+    query = query or {}
+    cursor = db[collection].find(query)
+    
+    if sort_by:
+        cursor = cursor.sort(sort_by)
+    
+    async for batch in iter_cursor_batches(cursor, model_class, batch_size, raw, validate):
+        yield batch
+
+
 # Specific CRUD operations for sensor models
 async def create_machine(db: AsyncIOMotorDatabase, machine_id: str) -> ObjectId:
     """
@@ -186,7 +227,9 @@ async def create_sensor_reading(
     machine_id: str | ObjectId, 
     values: dict[str, float],
     timestamp: datetime | None = None,
-    failure_id: str | ObjectId = None
+    failure_id: str | ObjectId = None,
+    last_seen_buffer: LastSeenBuffer | None = None,
+    rollups: bool = False
 ) -> ObjectId:
     """
     Create a new sensor reading
@@ -197,6 +240,11 @@ async def create_sensor_reading(
         values: Sensor measurements
         timestamp: When the reading was taken (defaults to current time)
         failure_id: ID of the associated failure, if any
+        last_seen_buffer: Optional write-behind buffer; when given, the
+            machine's last_seen update is coalesced in the buffer instead
+            of being written immediately
+        rollups: If True, also add the reading to the machine's minute
+            and hour rollups
         
     Returns:
         ID of the created reading
@@ -216,12 +264,67 @@ async def create_sensor_reading(
     
     reading_id = await create_document(db, reading)
     
+    if rollups:
+        await update_rollups(db, [reading])
+    
     # Update the machine's last_seen timestamp
-    await update_machine_last_seen(db, machine_id)
+    if last_seen_buffer is not None:
+        await last_seen_buffer.record(machine_id, reading.timestamp)
+    else:
+        await update_machine_last_seen(db, machine_id)
     
     return reading_id
 
 
+async def create_sensor_readings_bulk(
+    db: AsyncIOMotorDatabase, 
+    readings: list[SensorReading],
+    rollups: bool = False
+) -> list[ObjectId]:
+    """
+    Create many sensor readings, possibly from many machines, at once
+    
+    Inserts all readings with a single unordered insert_many and then
+    advances the last_seen timestamp of each distinct machine to its
+    latest reading timestamp with a single bulk_write.
+    
+    Args:
+        db: MongoDB database
+        readings: Sensor readings to create
+        rollups: If True, also add the readings to their machines' minute
+            and hour rollups
+        
+    Returns:
+        IDs of the created readings, in the same order as the input
+    """
+    if not readings:
+        return []
+    
+    result = await db[SensorReading.Config.collection].insert_many(
+        [reading.dict(by_alias=True, exclude_none=True) for reading in readings],
+        ordered=False
+    )
+    
+    if rollups:
+        await update_rollups(db, readings)
+    
+    # Collapse the last_seen updates to one per machine
+    last_seen: dict[ObjectId, datetime] = {}
+    for reading in readings:
+        if reading.machine_id not in last_seen or reading.timestamp > last_seen[reading.machine_id]:
+            last_seen[reading.machine_id] = reading.timestamp
+    
+    await db[Machine.Config.collection].bulk_write(
+        [
+            UpdateOne({"_id": machine_id}, {"$max": {"last_seen": timestamp}})
+            for machine_id, timestamp in last_seen.items()
+        ],
+        ordered=False
+    )
+    
+    return result.inserted_ids
+
+
 async def create_failure(
     db: AsyncIOMotorDatabase, 
     machine_id: str | ObjectId,
@@ -320,6 +423,129 @@ async def create_prediction(
     return await create_document(db, prediction)
 
 
+async def create_predictions_bulk(
+    db: AsyncIOMotorDatabase, 
+    reading_ids: Sequence[str | ObjectId],
+    cluster_ids: Sequence[int],
+    model_version: str,
+    confidence_scores: Sequence[float] | None = None,
+    mlflow_run_id: str | None = None,
+    model_name: str = "sensor_failure_clustering"
+) -> list[str]:
+    """
+    Create or update the predictions of one model version for many readings at once
+    
+    Each prediction is an upsert on (reading_id, model_version), so retrying
+    a batch overwrites the earlier predictions instead of failing on the
+    unique index. All upserts are sent in a single unordered bulk_write, and
+    a failure of one prediction does not prevent the others from being written.
+    The inputs may be lists or NumPy arrays as returned by a vectorised model.
+    
+    Args:
+        db: MongoDB database
+        reading_ids: IDs of the readings
+        cluster_ids: ID of the predicted cluster for each reading
+        model_version: Version of the model used
+        confidence_scores: Confidence level of each prediction, if available
+        mlflow_run_id: MLflow run ID of the model used
+        model_name: Name of the machine learning model
+        
+    Returns:
+        Outcome of each prediction, in the same order as the input:
+        "inserted", "updated" or "failed"
+        
+    Raises:
+        ValueError: If the input sequences differ in length
+    """
+    reading_ids = list(reading_ids)
+    cluster_ids = cluster_ids.tolist() if hasattr(cluster_ids, "tolist") else list(cluster_ids)
+    if confidence_scores is None:
+        confidence_scores = [None] * len(reading_ids)
+    else:
+        confidence_scores = confidence_scores.tolist() if hasattr(confidence_scores, "tolist") else list(confidence_scores)
+    
+    if not len(reading_ids) == len(cluster_ids) == len(confidence_scores):
+        raise ValueError(
+            f"Got {len(reading_ids)} reading IDs, {len(cluster_ids)} cluster IDs "
+            f"and {len(confidence_scores)} confidence scores"
+        )
+    
+    if not reading_ids:
+        return []
+    
+    prediction_time = datetime.now()
+    operations = []
+    for reading_id, cluster_id, confidence_score in zip(reading_ids, cluster_ids, confidence_scores):
+        if isinstance(reading_id, str) and ObjectId.is_valid(reading_id):
+            reading_id = ObjectId(reading_id)
+        
+        operations.append(UpdateOne(
+            {"reading_id": reading_id, "model_version": model_version},
+            {"$set": {
+                "cluster_id": int(cluster_id),
+                "confidence_score": None if confidence_score is None else float(confidence_score),
+                "prediction_time": prediction_time,
+                "mlflow_run_id": mlflow_run_id,
+                "model_name": model_name
+            }},
+            upsert=True
+        ))
+    
+    try:
+        result = (await db[SensorPrediction.Config.collection].bulk_write(operations, ordered=False)).bulk_api_result
+    except BulkWriteError as err:
+        result = err.details
+    
+    outcomes = ["updated"] * len(operations)
+    for upserted in result.get("upserted", []):
+        outcomes[upserted["index"]] = "inserted"
+    for error in result.get("writeErrors", []):
+        outcomes[error["index"]] = "failed"
+    
+    return outcomes
+
+
+async def _switch_active_cluster(db: AsyncIOMotorDatabase, cluster: dict[str, Any]) -> None:
+    """Point the active cluster pointer at a snapshot of a cluster document with one upsert."""
+    await db[ACTIVE_CLUSTER_COLLECTION].update_one(
+        {"_id": ACTIVE_CLUSTER_POINTER_ID},
+        {
+            "$set": {"cluster": {**cluster, "is_active": True}, "activated_at": datetime.now()},
+            "$inc": {"version": 1}
+        },
+        upsert=True
+    )
+
+
+async def activate_cluster(db: AsyncIOMotorDatabase, cluster_id: str | ObjectId) -> None:
+    """
+    Make a cluster model the only active one
+    
+    The active cluster is held by a single pointer document, which carries
+    a snapshot of the cluster, including its profiles, and a version that is
+    incremented on every switch. The switch is one upsert of that document,
+    so it is atomic without a transaction, and readers using
+    get_active_cluster see either the old or the new cluster with one
+    find_one, never none or both. The is_active flags of stored clusters are
+    not updated; the active cluster returned by get_active_cluster has it set.
+    
+    Args:
+        db: MongoDB database
+        cluster_id: ID of the cluster to activate
+        
+    Raises:
+        ValueError: If no cluster has the given ID, in which case nothing is changed
+    """
+    if isinstance(cluster_id, str) and ObjectId.is_valid(cluster_id):
+        cluster_id = ObjectId(cluster_id)
+    
+    cluster = await db[Cluster.Config.collection].find_one({"_id": cluster_id})
+    if cluster is None:
+        raise ValueError(f"Cluster {cluster_id} does not exist")
+    
+    await _switch_active_cluster(db, cluster)
+
+
 async def create_cluster_model(
     db: AsyncIOMotorDatabase, 
     mlflow_run_id: str,
@@ -339,29 +565,27 @@ async def create_cluster_model(
         n_clusters: Number of clusters in this model
         silhouette_score: Clustering quality metric
         cluster_profiles: JSON representation of the cluster centroids
-        is_active: Whether this is the currently active clustering model
+        is_active: Whether to make this the active clustering model
         
     Returns:
         ID of the created cluster model
     """
-    # If this model is active, deactivate all other models
-    if is_active:
-        await db[Cluster.Config.collection].update_many(
-            {"is_active": True},
-            {"$set": {"is_active": False}}
-        )
-    
     cluster = Cluster(
         mlflow_run_id=mlflow_run_id,
         mlflow_model_version=mlflow_model_version,
         created_at=datetime.now(),
-        is_active=is_active,
+        is_active=False,
         n_clusters=n_clusters,
         silhouette_score=silhouette_score,
         cluster_profiles=cluster_profiles
     )
     
-    return await create_document(db, cluster)
+    cluster_id = await create_document(db, cluster)
+    if is_active:
+        # The new model is inactive until the pointer names it
+        await _switch_active_cluster(db, cluster.dict(by_alias=True, exclude_none=True))
+    
+    return cluster_id
 
 
 async def create_drift_event(
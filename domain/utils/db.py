@@ -2,39 +2,62 @@
 Database utility functions for MongoDB/CosmosDB connections and relationship helpers.
 
 This module provides utility functions for initializing database connections
-and retrieving related documents using reference-based relationships.
+and retrieving related documents using reference-based relationships. The
+list-returning helpers have streaming counterparts (`iter_*`) that yield
+results in batches so that long histories can be processed with bounded
+memory, and keyset-paginated counterparts (`*_page`) whose page fetches
+cost the same regardless of how deep the page is.
+
+Read helpers accept an optional projection, and can return raw documents or
+models built without validation for trusted data read back from the database.
+Aggregation helpers compute summaries on the server so that only the
+results, not the readings, are transferred.
 """
 
-from typing import Any, Type, TypeVar
-from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import IndexModel, ASCENDING, DESCENDING
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Mapping, Type, TypeVar
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCursor
+from pymongo import DESCENDING
 from bson import ObjectId
 
 from domain.models.base import MongoBaseModel
+from domain.utils.connections import ClientOptions, get_client, ensure_indexes_once
 from domain.models import (
-    Machine, 
+    Cluster,
     Failure, 
     SensorReading, 
-    SensorPrediction, 
-    Cluster, 
-    DriftEvent,
-    ModelVersion
+    SensorPrediction
 )
 
 T = TypeVar('T', bound=MongoBaseModel)
 
+# Single document naming the active cluster, so that switching it is one write
+ACTIVE_CLUSTER_COLLECTION = "active_cluster"
+ACTIVE_CLUSTER_POINTER_ID = "active"
+
+Projection = Mapping[str, Any] | list[str]
+
 
-async def init_db(connection_string: str, db_name: str = "sensors") -> AsyncIOMotorClient:
+async def init_db(
+    connection_string: str, 
+    db_name: str = "sensors",
+    options: ClientOptions | None = None
+) -> AsyncIOMotorClient:
     """
     Initialize the MongoDB connection and create indexes.
     
-    This function establishes a connection to the MongoDB database using
-    the provided connection string and creates necessary indexes for
-    efficient querying.
+    This function returns the process-wide client for the provided
+    connection string, creating it with the configured pool settings on
+    first use, and creates the indexes declared in
+    domain.utils.indexes.INDEX_PLAN once per process for efficient querying.
 
     Args:
         connection_string (str): MongoDB connection string for Azure CosmosDB
         db_name (str): Database name to use. Defaults to "sensors"
+        options (ClientOptions, optional): Pool, timeout and compression
+            options. Defaults to ClientOptions.from_env()
         
     Returns:
         AsyncIOMotorClient: MongoDB client instance
@@ -42,58 +65,82 @@ async def init_db(connection_string: str, db_name: str = "sensors") -> AsyncIOMo
     Raises:
         ConnectionError: If the database connection cannot be established
     """
-    client = AsyncIOMotorClient(connection_string)
+    client = get_client(connection_string, options)
     db = client[db_name]
     
-    # Create indexes for efficient querying
-    await db[Machine.Config.collection].create_indexes([
-        IndexModel([("machine_id", ASCENDING)], unique=True),
-        IndexModel([("last_seen", DESCENDING)])
-    ])
-    
-    await db[Failure.Config.collection].create_indexes([
-        IndexModel([("machine_id", ASCENDING)]),
-        IndexModel([("start_time", DESCENDING)]),
-        IndexModel([("is_active", ASCENDING)])
-    ])
-    
-    await db[SensorReading.Config.collection].create_indexes([
-        IndexModel([("machine_id", ASCENDING)]),
-        IndexModel([("timestamp", DESCENDING)]),
-        IndexModel([("failure_id", ASCENDING)])
-    ])
-    
-    await db[SensorPrediction.Config.collection].create_indexes([
-        IndexModel([("reading_id", ASCENDING)]),
-        IndexModel([("prediction_time", DESCENDING)]),
-        IndexModel([("reading_id", ASCENDING), ("model_version", ASCENDING)], unique=True)
-    ])
-    
-    await db[Cluster.Config.collection].create_indexes([
-        IndexModel([("mlflow_run_id", ASCENDING)], unique=True),
-        IndexModel([("created_at", DESCENDING)]),
-        IndexModel([("is_active", ASCENDING)])
-    ])
-    
-    await db[DriftEvent.Config.collection].create_indexes([
-        IndexModel([("detection_time", DESCENDING)])
-    ])
-    
-    await db[ModelVersion.Config.collection].create_indexes([
-        IndexModel([("version", ASCENDING)]),
-        IndexModel([("created_at", DESCENDING)]),
-        IndexModel([("is_processed", ASCENDING)])
-    ])
+    # Create the indexes planned for each query helper
+    await ensure_indexes_once(db, connection_string)
     
     return client
 
 
+def decode_documents(
+    docs: list[dict[str, Any]],
+    model_class: Type[T],
+    raw: bool = False,
+    validate: bool = True
+) -> list[T] | list[dict[str, Any]]:
+    """
+    Convert raw documents to model instances
+    
+    Validation is the dominant cost when reading large numbers of documents.
+    Documents read back from the database were validated when they were
+    written, so validation can be skipped with validate=False, which builds
+    the models with model_construct, or avoided altogether with raw=True.
+    
+    Args:
+        docs: Raw documents as returned by the driver
+        model_class: Pydantic model class to convert documents to
+        raw: If True, return the raw documents unchanged
+        validate: If False, build models with model_construct without validation
+        
+    Returns:
+        List of model instances, or the raw documents if raw is True
+    """
+    if raw:
+        return docs
+    if not validate:
+        return [model_class.model_construct(**doc) for doc in docs]
+    return [model_class(**doc) for doc in docs]
+
+
+async def iter_cursor_batches(
+    cursor: AsyncIOMotorCursor,
+    model_class: Type[T],
+    batch_size: int = 1000,
+    raw: bool = False,
+    validate: bool = True
+) -> AsyncIterator[list[T] | list[dict[str, Any]]]:
+    """
+    Consume a cursor in batches, yielding each batch as it arrives
+    
+    Args:
+        cursor: Motor cursor to consume
+        model_class: Pydantic model class to convert documents to
+        batch_size: Number of documents per batch
+        raw: If True, yield the raw documents instead of model instances
+        validate: If False, build models without validation
+        
+    Yields:
+        Lists of at most batch_size documents, as models or raw dicts
+    """
+    cursor = cursor.batch_size(batch_size)
+    while True:
+        docs = await cursor.to_list(length=batch_size)
+        if not docs:
+            break
+        yield decode_documents(docs, model_class, raw, validate)
+
+
 async def get_document_by_id(
     db: AsyncIOMotorClient, 
     collection: str, 
     doc_id: str | ObjectId, 
-    model_class: Type[T]
-) -> T | None:
+    model_class: Type[T],
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> T | dict[str, Any] | None:
     """
     Get a document by its ID and convert it to a specific model class
     
@@ -102,26 +149,41 @@ async def get_document_by_id(
         collection: Collection name
         doc_id: Document ID (can be string or ObjectId)
         model_class: Pydantic model class to convert the document to
+        projection: Optional fields to include or exclude
+        raw: If True, return the raw document instead of a model instance
+        validate: If False, build the model without validation
         
     Returns:
-        Document as specified model class or None if not found
+        Document as specified model class (or raw dict) or None if not found
     """
     if isinstance(doc_id, str) and ObjectId.is_valid(doc_id):
         doc_id = ObjectId(doc_id)
     
-    doc = await db[collection].find_one({"_id": doc_id})
+    doc = await db[collection].find_one({"_id": doc_id}, projection)
     if doc:
-        return model_class(**doc)
+        return decode_documents([doc], model_class, raw, validate)[0]
     return None
 
 
-async def get_machine_readings(db: AsyncIOMotorClient, machine_id: str | ObjectId) -> list[SensorReading]:
+async def get_machine_readings(
+    db: AsyncIOMotorClient, 
+    machine_id: str | ObjectId,
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[SensorReading] | list[dict[str, Any]]:
     """
     Get all readings for a specific machine
     
+    Projected readings lack the excluded fields, so a projection that drops
+    required fields should be combined with raw=True or validate=False.
+    
     Args:
         db: MongoDB database connection
         machine_id: ID of the machine
+        projection: Optional fields to include or exclude, e.g. ["timestamp", "values"]
+        raw: If True, return raw documents instead of SensorReading models
+        validate: If False, build models without validation
         
     Returns:
         List of sensor readings for the machine, sorted by timestamp (newest first)
@@ -129,18 +191,26 @@ async def get_machine_readings(db: AsyncIOMotorClient, machine_id: str | ObjectI
     if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
         machine_id = ObjectId(machine_id)
     
-    cursor = db[SensorReading.Config.collection].find({"machine_id": machine_id}).sort("timestamp", DESCENDING)
-    readings = [SensorReading(**doc) for doc in await cursor.to_list(length=None)]
-    return readings
+    cursor = db[SensorReading.Config.collection].find({"machine_id": machine_id}, projection).sort("timestamp", DESCENDING)
+    return decode_documents(await cursor.to_list(length=None), SensorReading, raw, validate)
 
 
-async def get_machine_failures(db: AsyncIOMotorClient, machine_id: str | ObjectId) -> list[Failure]:
+async def get_machine_failures(
+    db: AsyncIOMotorClient, 
+    machine_id: str | ObjectId,
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[Failure] | list[dict[str, Any]]:
     """
     Get all failures for a specific machine
     
     Args:
         db: MongoDB database connection
         machine_id: ID of the machine
+        projection: Optional fields to include or exclude
+        raw: If True, return raw documents instead of Failure models
+        validate: If False, build models without validation
         
     Returns:
         List of failures for the machine, sorted by start_time (newest first)
@@ -148,18 +218,26 @@ async def get_machine_failures(db: AsyncIOMotorClient, machine_id: str | ObjectI
     if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
         machine_id = ObjectId(machine_id)
     
-    cursor = db[Failure.Config.collection].find({"machine_id": machine_id}).sort("start_time", DESCENDING)
-    failures = [Failure(**doc) for doc in await cursor.to_list(length=None)]
-    return failures
+    cursor = db[Failure.Config.collection].find({"machine_id": machine_id}, projection).sort("start_time", DESCENDING)
+    return decode_documents(await cursor.to_list(length=None), Failure, raw, validate)
 
 
-async def get_failure_readings(db: AsyncIOMotorClient, failure_id: str | ObjectId) -> list[SensorReading]:
+async def get_failure_readings(
+    db: AsyncIOMotorClient, 
+    failure_id: str | ObjectId,
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[SensorReading] | list[dict[str, Any]]:
     """
     Get all readings associated with a specific failure
     
     Args:
         db: MongoDB database connection
         failure_id: ID of the failure
+        projection: Optional fields to include or exclude
+        raw: If True, return raw documents instead of SensorReading models
+        validate: If False, build models without validation
         
     Returns:
         List of sensor readings for the failure, sorted by timestamp (newest first)
@@ -167,18 +245,26 @@ async def get_failure_readings(db: AsyncIOMotorClient, failure_id: str | ObjectI
     if isinstance(failure_id, str) and ObjectId.is_valid(failure_id):
         failure_id = ObjectId(failure_id)
     
-    cursor = db[SensorReading.Config.collection].find({"failure_id": failure_id}).sort("timestamp", DESCENDING)
-    readings = [SensorReading(**doc) for doc in await cursor.to_list(length=None)]
-    return readings
+    cursor = db[SensorReading.Config.collection].find({"failure_id": failure_id}, projection).sort("timestamp", DESCENDING)
+    return decode_documents(await cursor.to_list(length=None), SensorReading, raw, validate)
 
 
-async def get_reading_predictions(db: AsyncIOMotorClient, reading_id: str | ObjectId) -> list[SensorPrediction]:
+async def get_reading_predictions(
+    db: AsyncIOMotorClient, 
+    reading_id: str | ObjectId,
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[SensorPrediction] | list[dict[str, Any]]:
     """
     Get all predictions for a specific reading
     
     Args:
         db: MongoDB database connection
         reading_id: ID of the reading
+        projection: Optional fields to include or exclude
+        raw: If True, return raw documents instead of SensorPrediction models
+        validate: If False, build models without validation
         
     Returns:
         List of predictions for the reading
@@ -186,33 +272,74 @@ async def get_reading_predictions(db: AsyncIOMotorClient, reading_id: str | Obje
     if isinstance(reading_id, str) and ObjectId.is_valid(reading_id):
         reading_id = ObjectId(reading_id)
     
-    cursor = db[SensorPrediction.Config.collection].find({"reading_id": reading_id})
-    predictions = [SensorPrediction(**doc) for doc in await cursor.to_list(length=None)]
-    return predictions
+    cursor = db[SensorPrediction.Config.collection].find({"reading_id": reading_id}, projection)
+    return decode_documents(await cursor.to_list(length=None), SensorPrediction, raw, validate)
 
 
 # Advanced querying functions
-async def get_active_failures(db: AsyncIOMotorClient) -> list[Failure]:
+async def get_active_failures(
+    db: AsyncIOMotorClient,
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[Failure] | list[dict[str, Any]]:
     """
     Get all currently active failures across all machines
     
     Args:
         db: MongoDB database connection
+        projection: Optional fields to include or exclude
+        raw: If True, return raw documents instead of Failure models
+        validate: If False, build models without validation
         
     Returns:
         List of active failures, sorted by start_time (newest first)
     """
-    cursor = db[Failure.Config.collection].find({"is_active": True}).sort("start_time", DESCENDING)
-    failures = [Failure(**doc) for doc in await cursor.to_list(length=None)]
-    return failures
+    cursor = db[Failure.Config.collection].find({"is_active": True}, projection).sort("start_time", DESCENDING)
+    return decode_documents(await cursor.to_list(length=None), Failure, raw, validate)
+
+
+async def get_active_cluster(
+    db: AsyncIOMotorClient,
+    raw: bool = False,
+    validate: bool = True
+) -> Cluster | dict[str, Any] | None:
+    """
+    Get the active clustering model
+    
+    The active cluster is the snapshot held by the active cluster pointer,
+    read with a single find_one. For databases where no cluster has been
+    activated through the pointer yet, the most recent cluster flagged
+    is_active is returned instead.
+    
+    Args:
+        db: MongoDB database connection
+        raw: If True, return the raw document instead of a Cluster model
+        validate: If False, build the model without validation
+        
+    Returns:
+        The active cluster, or None if no cluster is active
+    """
+    pointer = await db[ACTIVE_CLUSTER_COLLECTION].find_one({"_id": ACTIVE_CLUSTER_POINTER_ID})
+    if pointer:
+        doc = pointer["cluster"]
+    else:
+        doc = await db[Cluster.Config.collection].find_one({"is_active": True}, sort=[("created_at", DESCENDING)])
+    
+    if doc:
+        return decode_documents([doc], Cluster, raw, validate)[0]
+    return None
 
 
 async def get_readings_in_timerange(
     db: AsyncIOMotorClient, 
     machine_id: str | ObjectId, 
     start_time: Any, 
-    end_time: Any
-) -> list[SensorReading]:
+    end_time: Any,
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[SensorReading] | list[dict[str, Any]]:
     """
     Get readings for a machine within a specific time range
     
@@ -221,6 +348,9 @@ async def get_readings_in_timerange(
         machine_id: ID of the machine
         start_time: Start of the time range
         end_time: End of the time range
+        projection: Optional fields to include or exclude
+        raw: If True, return raw documents instead of SensorReading models
+        validate: If False, build models without validation
         
     Returns:
         List of readings in the specified time range, sorted by timestamp (newest first)
@@ -231,7 +361,421 @@ async def get_readings_in_timerange(
     cursor = db[SensorReading.Config.collection].find({
         "machine_id": machine_id,
         "timestamp": {"$gte": start_time, "$lte": end_time}
-    }).sort("timestamp", DESCENDING)
+    }, projection).sort("timestamp", DESCENDING)
+    
+    return decode_documents(await cursor.to_list(length=None), SensorReading, raw, validate)
+
+
+# Batched lookups
+async def get_documents_by_ids(
+    db: AsyncIOMotorClient, 
+    collection: str, 
+    doc_ids: list[str | ObjectId], 
+    model_class: Type[T],
+    projection: Projection | None = None,
+    raw: bool = False,
+    validate: bool = True
+) -> list[T | dict[str, Any] | None]:
+    """
+    Get many documents by their IDs in a single query
+    
+    Args:
+        db: MongoDB database connection
+        collection: Collection name
+        doc_ids: Document IDs (can be strings or ObjectIds)
+        model_class: Pydantic model class to convert the documents to
+        projection: Optional fields to include or exclude; _id is still fetched
+            to match documents to doc_ids when the projection excludes it,
+            and removed from the results
+        raw: If True, return raw documents instead of model instances
+        validate: If False, build models without validation
+        
+    Returns:
+        Documents in the same order as doc_ids, with None for IDs that were not found
+    """
+    doc_ids = [
+        ObjectId(doc_id) if isinstance(doc_id, str) and ObjectId.is_valid(doc_id) else doc_id
+        for doc_id in doc_ids
+    ]
+    if not doc_ids:
+        return []
+    
+    exclude_id = isinstance(projection, Mapping) and "_id" in projection and not projection["_id"]
+    if exclude_id:
+        projection = {**projection, "_id": 1}
+    
+    cursor = db[collection].find({"_id": {"$in": list(set(doc_ids))}}, projection)
+    docs = await cursor.to_list(length=None)
+    ids = [doc["_id"] for doc in docs]
+    if exclude_id:
+        for doc in docs:
+            del doc["_id"]
+    
+    by_id = dict(zip(ids, decode_documents(docs, model_class, raw, validate)))
+    return [by_id.get(doc_id) for doc_id in doc_ids]
+
+
+async def prefetch_reading_relations(
+    db: AsyncIOMotorClient, 
+    readings: list[SensorReading],
+    model_version: str | None = None
+) -> list[dict[str, Any]]:
+    """
+    Load the predictions and failures of many readings with one query per collection
+    
+    Args:
+        db: MongoDB database connection
+        readings: Sensor readings to load the relations of
+        model_version: Optional model version to restrict the predictions to
+        
+    Returns:
+        List of dicts, in the same order as readings, with the "reading", its
+        "predictions" (list of SensorPrediction) and its "failure" (Failure or None)
+    """
+    if not readings:
+        return []
+    
+    prediction_query: dict[str, Any] = {"reading_id": {"$in": [reading.id for reading in readings]}}
+    if model_version is not None:
+        prediction_query["model_version"] = model_version
+    
+    predictions: dict[ObjectId, list[SensorPrediction]] = {}
+    cursor = db[SensorPrediction.Config.collection].find(prediction_query)
+    for doc in await cursor.to_list(length=None):
+        predictions.setdefault(doc["reading_id"], []).append(SensorPrediction(**doc))
+    
+    failure_ids = list({reading.failure_id for reading in readings if reading.failure_id is not None})
+    failures: dict[ObjectId, Failure] = {}
+    if failure_ids:
+        cursor = db[Failure.Config.collection].find({"_id": {"$in": failure_ids}})
+        failures = {doc["_id"]: Failure(**doc) for doc in await cursor.to_list(length=None)}
+    
+    return [
+        {
+            "reading": reading,
+            "predictions": predictions.get(reading.id, []),
+            "failure": failures.get(reading.failure_id) if reading.failure_id is not None else None
+        }
+        for reading in readings
+    ]
+
+
+# Streaming variants
+async def iter_machine_readings(
+    db: AsyncIOMotorClient, 
+    machine_id: str | ObjectId,
+    batch_size: int = 1000,
+    raw: bool = False,
+    projection: Projection | None = None,
+    validate: bool = True
+) -> AsyncIterator[list[SensorReading] | list[dict[str, Any]]]:
+    """
+    Stream all readings for a specific machine in batches
+    
+    Args:
+        db: MongoDB database connection
+        machine_id: ID of the machine
+        batch_size: Number of readings per batch
+        raw: If True, yield raw documents instead of SensorReading models
+        projection: Optional fields to include or exclude
+        validate: If False, build models without validation
+        
+    Yields:
+        Batches of sensor readings for the machine, sorted by timestamp (newest first)
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+    
+    cursor = db[SensorReading.Config.collection].find({"machine_id": machine_id}, projection).sort("timestamp", DESCENDING)
+    async for batch in iter_cursor_batches(cursor, SensorReading, batch_size, raw, validate):
+        yield batch
+
+
+async def iter_failure_readings(
+    db: AsyncIOMotorClient, 
+    failure_id: str | ObjectId,
+    batch_size: int = 1000,
+    raw: bool = False,
+    projection: Projection | None = None,
+    validate: bool = True
+) -> AsyncIterator[list[SensorReading] | list[dict[str, Any]]]:
+    """
+    Stream all readings associated with a specific failure in batches
+    
+    Args:
+        db: MongoDB database connection
+        failure_id: ID of the failure
+        batch_size: Number of readings per batch
+        raw: If True, yield raw documents instead of SensorReading models
+        projection: Optional fields to include or exclude
+        validate: If False, build models without validation
+        
+    Yields:
+        Batches of sensor readings for the failure, sorted by timestamp (newest first)
+    """
+    if isinstance(failure_id, str) and ObjectId.is_valid(failure_id):
+        failure_id = ObjectId(failure_id)
+    
+    cursor = db[SensorReading.Config.collection].find({"failure_id": failure_id}, projection).sort("timestamp", DESCENDING)
+    async for batch in iter_cursor_batches(cursor, SensorReading, batch_size, raw, validate):
+        yield batch
+
+
+async def iter_readings_in_timerange(
+    db: AsyncIOMotorClient, 
+    machine_id: str | ObjectId, 
+    start_time: Any, 
+    end_time: Any,
+    batch_size: int = 1000,
+    raw: bool = False,
+    projection: Projection | None = None,
+    validate: bool = True
+) -> AsyncIterator[list[SensorReading] | list[dict[str, Any]]]:
+    """
+    Stream readings for a machine within a specific time range in batches
+    
+    Args:
+        db: MongoDB database connection
+        machine_id: ID of the machine
+        start_time: Start of the time range
+        end_time: End of the time range
+        batch_size: Number of readings per batch
+        raw: If True, yield raw documents instead of SensorReading models
+        projection: Optional fields to include or exclude
+        validate: If False, build models without validation
+        
+    Yields:
+        Batches of readings in the specified time range, sorted by timestamp (newest first)
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+    
+    cursor = db[SensorReading.Config.collection].find({
+        "machine_id": machine_id,
+        "timestamp": {"$gte": start_time, "$lte": end_time}
+    }, projection).sort("timestamp", DESCENDING)
+    
+    async for batch in iter_cursor_batches(cursor, SensorReading, batch_size, raw, validate):
+        yield batch
+
+
+
+# Keyset pagination
+def encode_page_token(sort_value: datetime, doc_id: ObjectId) -> str:
+    """
+    Encode the position after a document as an opaque continuation token
+    
+    Args:
+        sort_value: Value of the sort field of the last document on the page
+        doc_id: ID of the last document on the page
+        
+    Returns:
+        URL-safe continuation token
+    """
+    payload = json.dumps({"v": sort_value.isoformat(), "id": str(doc_id)})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_page_token(page_token: str) -> tuple[datetime, ObjectId]:
+    """
+    Decode a continuation token produced by encode_page_token
+    
+    Args:
+        page_token: Continuation token
+        
+    Returns:
+        Tuple of (sort_value, doc_id) of the last document on the previous page
+        
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))
+        return datetime.fromisoformat(payload["v"]), ObjectId(payload["id"])
+    except Exception as err:
+        raise ValueError(f"Invalid page token: {page_token!r}") from err
+
+
+async def get_keyset_page(
+    db: AsyncIOMotorClient,
+    collection: str,
+    model_class: Type[T],
+    query: dict[str, Any],
+    sort_field: str,
+    page_size: int = 100,
+    page_token: str | None = None,
+    direction: int = DESCENDING,
+    validate: bool = True
+) -> tuple[list[T], str | None]:
+    """
+    Get one page of documents ordered by (sort_field, _id) using keyset pagination
+    
+    Instead of skipping over previous pages, the query seeks directly to the
+    position after the last document of the previous page, so with an index
+    on (filter fields, sort_field, _id) every page costs the same.
+    
+    Args:
+        db: MongoDB database connection
+        collection: Collection name
+        model_class: Pydantic model class to convert documents to
+        query: MongoDB query selecting the documents to page through
+        sort_field: Datetime field to order by, ties broken by _id
+        page_size: Maximum number of documents per page
+        page_token: Continuation token from the previous page, or None for the first page
+        direction: DESCENDING (newest first) or ASCENDING
+        validate: If False, build models without validation
+        
+    Returns:
+        Tuple of (documents, next_page_token); the token is None on the last page
+    """
+    if page_token:
+        sort_value, doc_id = decode_page_token(page_token)
+        op = "$lt" if direction == DESCENDING else "$gt"
+        query = {"$and": [query, {"$or": [
+            {sort_field: {op: sort_value}},
+            {sort_field: sort_value, "_id": {op: doc_id}}
+        ]}]}
+    
+    cursor = db[collection].find(query).sort([(sort_field, direction), ("_id", direction)]).limit(page_size + 1)
+    docs = await cursor.to_list(length=page_size + 1)
+    
+    next_token = None
+    if len(docs) > page_size:
+        docs = docs[:page_size]
+        next_token = encode_page_token(docs[-1][sort_field], docs[-1]["_id"])
+    
+    return decode_documents(docs, model_class, validate=validate), next_token
+
+
+async def get_machine_readings_page(
+    db: AsyncIOMotorClient, 
+    machine_id: str | ObjectId,
+    page_size: int = 100,
+    page_token: str | None = None,
+    validate: bool = True
+) -> tuple[list[SensorReading], str | None]:
+    """
+    Get one page of readings for a specific machine
+    
+    Args:
+        db: MongoDB database connection
+        machine_id: ID of the machine
+        page_size: Maximum number of readings per page
+        page_token: Continuation token from the previous page, or None for the first page
+        validate: If False, build models without validation
+        
+    Returns:
+        Tuple of (readings sorted by timestamp newest first, next_page_token)
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+    
+    return await get_keyset_page(
+        db,
+        SensorReading.Config.collection,
+        SensorReading,
+        {"machine_id": machine_id},
+        "timestamp",
+        page_size,
+        page_token,
+        validate=validate
+    )
+
+
+async def get_predictions_page(
+    db: AsyncIOMotorClient,
+    query: dict[str, Any] = None,
+    page_size: int = 100,
+    page_token: str | None = None,
+    validate: bool = True
+) -> tuple[list[SensorPrediction], str | None]:
+    """
+    Get one page of predictions ordered by prediction time
+    
+    Args:
+        db: MongoDB database connection
+        query: Optional MongoDB query to restrict the predictions
+        page_size: Maximum number of predictions per page
+        page_token: Continuation token from the previous page, or None for the first page
+        validate: If False, build models without validation
+        
+    Returns:
+        Tuple of (predictions sorted by prediction_time newest first, next_page_token)
+    """
+    return await get_keyset_page(
+        db,
+        SensorPrediction.Config.collection,
+        SensorPrediction,
+        query or {},
+        "prediction_time",
+        page_size,
+        page_token,
+        validate=validate
+    )
+
+
+# Server-side aggregation
+async def aggregate_sensor_stats(
+    db: AsyncIOMotorClient, 
+    machine_id: str | ObjectId, 
+    start_time: datetime, 
+    end_time: datetime,
+    bucket_seconds: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Compute per-sensor statistics for a machine's readings on the server
+    
+    The readings are grouped into fixed time buckets and reduced by an
+    aggregation pipeline, so only one summary per bucket and sensor is
+    transferred instead of the readings themselves.
+    
+    Args:
+        db: MongoDB database connection
+        machine_id: ID of the machine
+        start_time: Start of the time range
+        end_time: End of the time range
+        bucket_seconds: Length of each time bucket in seconds, or None to
+            summarise the whole range as a single bucket
+        
+    Returns:
+        List of buckets sorted by bucket_start (oldest first), each a dict with
+        "bucket_start" (None when bucket_seconds is None), "count" and "sensors",
+        mapping each sensor name to its "mean", "std", "min", "max" and "count"
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+    
+    if bucket_seconds:
+        # Floor each timestamp to a multiple of the bucket length since the epoch
+        bucket = {"$subtract": ["$timestamp", {"$mod": [{"$toLong": "$timestamp"}, bucket_seconds * 1000]}]}
+    else:
+        bucket = None
+    
+    pipeline = [
+        {"$match": {
+            "machine_id": machine_id,
+            "timestamp": {"$gte": start_time, "$lte": end_time}
+        }},
+        {"$project": {"_id": 0, "timestamp": 1, "values": {"$objectToArray": "$values"}}},
+        {"$unwind": "$values"},
+        {"$group": {
+            "_id": {"bucket": bucket, "sensor": "$values.k"},
+            "mean": {"$avg": "$values.v"},
+            "std": {"$stdDevPop": "$values.v"},
+            "min": {"$min": "$values.v"},
+            "max": {"$max": "$values.v"},
+            "count": {"$sum": 1}
+        }},
+        {"$group": {
+            "_id": "$_id.bucket",
+            "count": {"$max": "$count"},
+            "sensors": {"$push": {
+                "k": "$_id.sensor",
+                "v": {"mean": "$mean", "std": "$std", "min": "$min", "max": "$max", "count": "$count"}
+            }}
+        }},
+        {"$sort": {"_id": 1}},
+        {"$project": {"_id": 0, "bucket_start": "$_id", "count": 1, "sensors": {"$arrayToObject": "$sensors"}}}
+    ]
     
-    readings = [SensorReading(**doc) for doc in await cursor.to_list(length=None)]
-    return readings
\ No newline at end of file
+    return await db[SensorReading.Config.collection].aggregate(pipeline).to_list(length=None)
@@ -0,0 +1,334 @@
+"""
+Streaming drift detection for sensor readings.
+
+This module compares the recent distribution of each sensor against a
+reference distribution and records a DriftEvent when the difference crosses
+a threshold. The reference is either built from the per-sensor statistics
+produced by the producer's analyse_dataset ({sensor: {mean, std, min, max}}),
+assuming each sensor is normally distributed, or from a sample of reference
+readings, which makes no assumption about the shape of the distribution.
+
+The recent distribution is kept over a sliding window split into panes.
+Each pane holds a fixed-bin histogram and Welford mean/variance accumulators
+per sensor, and the oldest pane is dropped as a new one starts, so memory
+depends on the number of panes and bins rather than on the window length.
+Window histograms are maintained incrementally, so each check costs O(bins)
+per sensor for the PSI and KS scores.
+"""
+
+import bisect
+import math
+from collections import deque
+from typing import Any, Mapping, Sequence
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
+
+from domain.utils.crud import create_drift_event
+
+# Probability floor used in PSI to avoid division by and logarithms of zero
+PSI_EPSILON = 1e-4
+
+
+class _Pane:
+    """Histogram counts and Welford accumulators of each sensor over part of the window."""
+
+    def __init__(self, num_buckets: Mapping[str, int]) -> None:
+        self.size = 0
+        self.counts = {sensor: [0] * buckets for sensor, buckets in num_buckets.items()}
+        # [count, mean, sum of squared deviations] per sensor
+        self.moments = {sensor: [0, 0.0, 0.0] for sensor in num_buckets}
+
+
+def _merge_moments(moments: list[list[float]]) -> tuple[int, float, float]:
+    """Combine Welford accumulators (Chan et al.) into a count, mean and population variance."""
+    count, mean, m2 = 0, 0.0, 0.0
+    for n, pane_mean, pane_m2 in moments:
+        if not n:
+            continue
+        total = count + n
+        delta = pane_mean - mean
+        mean += delta * n / total
+        m2 += pane_m2 + delta * delta * count * n / total
+        count = total
+    return count, mean, (m2 / count if count else 0.0)
+
+
+def _normal_cdf(x: float, mean: float, std: float) -> float:
+    """Cumulative distribution function of a normal distribution."""
+    if std <= 0:
+        return 1.0 if x >= mean else 0.0
+    return 0.5 * (1.0 + math.erf((x - mean) / (std * math.sqrt(2.0))))
+
+
+def _sample_bins(samples: Sequence[float], bins: int) -> tuple[list[float], list[float]]:
+    """Equal-frequency bin edges of a sample, and the fraction of the sample in each bin."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    # Repeated values collapse into one bin; the last edge is just above the
+    # maximum so that the maximum falls inside the range
+    edges = sorted({*(ordered[(n - 1) * i // bins] for i in range(bins)), math.nextafter(ordered[-1], math.inf)})
+    counts = [0] * (len(edges) + 1)
+    for value in ordered:
+        counts[bisect.bisect_right(edges, value)] += 1
+    return edges, [count / n for count in counts]
+
+
+def _sample_stats(samples: Sequence[float]) -> dict[str, float]:
+    """Mean, population standard deviation, minimum and maximum of a sample."""
+    mean = math.fsum(samples) / len(samples)
+    variance = math.fsum((value - mean) ** 2 for value in samples) / len(samples)
+    return {"mean": mean, "std": math.sqrt(variance), "min": min(samples), "max": max(samples)}
+
+
+class DriftDetector:
+    """
+    Detects drift of sensor distributions over a sliding window of readings.
+
+    Each sensor's range [min, max] from the reference statistics is divided
+    into equal-width bins, with one extra bin on each side for values outside
+    the range. The reference probability of each bin follows a normal
+    distribution with the reference mean and standard deviation, so sensors
+    whose values are far from normal, such as uniform or multimodal ones,
+    are reported as drifting even when their distribution is unchanged. For
+    those, build the detector with from_samples, which takes equal-frequency
+    bins and their probabilities from reference readings instead.
+
+    A sensor with zero standard deviation has a single bin holding its
+    constant value, so that it only drifts when it takes another value.
+
+    The drift score is the largest per-sensor Population Stability Index
+    (PSI) between the window and the reference. A binned Kolmogorov-Smirnov
+    (KS) statistic is reported alongside it. A DriftEvent is recorded only
+    when the score rises above the threshold, not on every check while it
+    stays above.
+
+    Attributes:
+        reference_stats: Reference statistics per sensor, as returned by analyse_dataset
+        bins: Number of bins within each sensor's reference range
+        pane_size: Number of readings per pane
+        num_panes: Number of panes in the sliding window
+        threshold: PSI above which the window is considered to have drifted
+        min_count: Number of readings required in the window before checking
+        drifting: Whether the last check found drift
+    """
+
+    def __init__(
+        self,
+        reference_stats: Mapping[str, Mapping[str, float]],
+        bins: int = 10,
+        pane_size: int = 1000,
+        num_panes: int = 10,
+        threshold: float = 0.2,
+        min_count: int | None = None,
+        reference_samples: Mapping[str, Sequence[float]] | None = None
+    ) -> None:
+        self.reference_stats = {sensor: dict(stats) for sensor, stats in reference_stats.items()}
+        self.bins = bins
+        self.pane_size = pane_size
+        self.num_panes = num_panes
+        self.threshold = threshold
+        self.min_count = min_count if min_count is not None else pane_size
+        self.drifting = False
+
+        self.sensors = list(self.reference_stats)
+        self._edges: dict[str, list[float]] = {}
+        self._reference: dict[str, list[float]] = {}
+        for sensor, stats in self.reference_stats.items():
+            if reference_samples and reference_samples.get(sensor):
+                edges, reference = _sample_bins(reference_samples[sensor], bins)
+            elif stats["std"] <= 0:
+                # Every reference value is the mean: one bin [mean, next float)
+                edges = [stats["mean"], math.nextafter(stats["mean"], math.inf)]
+                reference = [0.0, 1.0, 0.0]
+            else:
+                low, high = stats.get("min"), stats.get("max")
+                if low is None or high is None or high <= low:
+                    low, high = stats["mean"] - 3 * stats["std"], stats["mean"] + 3 * stats["std"]
+                edges = [low + (high - low) * i / bins for i in range(bins + 1)]
+                cdf = [0.0] + [_normal_cdf(edge, stats["mean"], stats["std"]) for edge in edges] + [1.0]
+                reference = [cdf[i + 1] - cdf[i] for i in range(bins + 2)]
+            self._edges[sensor] = edges
+            self._reference[sensor] = reference
+
+        self._num_buckets = {sensor: len(edges) + 1 for sensor, edges in self._edges.items()}
+        self._panes: deque[_Pane] = deque()
+        self._window_counts = {sensor: [0] * buckets for sensor, buckets in self._num_buckets.items()}
+        self._window_size = 0
+
+    @classmethod
+    def from_samples(cls, reference_samples: Mapping[str, Sequence[float]], **kwargs: Any) -> "DriftDetector":
+        """
+        Build a detector whose reference distribution comes from reference readings
+
+        Each sensor's range is divided into equal-frequency bins at the
+        quantiles of its sample, and the reference probability of each bin
+        is the fraction of the sample that falls in it.
+
+        Args:
+            reference_samples: Reference values of each sensor
+            **kwargs: Other DriftDetector arguments (bins, pane_size, num_panes, threshold, min_count)
+
+        Returns:
+            Detector comparing the window against the sampled distributions
+
+        Raises:
+            ValueError: If a sensor has no reference values
+        """
+        empty = [sensor for sensor, samples in reference_samples.items() if not samples]
+        if empty:
+            raise ValueError(f"No reference values for sensors: {', '.join(empty)}")
+
+        reference_stats = {sensor: _sample_stats(samples) for sensor, samples in reference_samples.items()}
+        return cls(reference_stats, reference_samples=reference_samples, **kwargs)
+
+    def __len__(self) -> int:
+        return self._window_size
+
+    def add(self, values: Mapping[str, float]) -> None:
+        """
+        Add a reading to the window, dropping the oldest pane if the window is full
+
+        Sensors without reference statistics are ignored.
+
+        Args:
+            values: Sensor measurements of the reading
+        """
+        if not self._panes or self._panes[-1].size >= self.pane_size:
+            self._panes.append(_Pane(self._num_buckets))
+            if len(self._panes) > self.num_panes:
+                self._evict(self._panes.popleft())
+
+        pane = self._panes[-1]
+        pane.size += 1
+        self._window_size += 1
+
+        for sensor in self.sensors:
+            value = values.get(sensor)
+            if value is None:
+                continue
+
+            bucket = bisect.bisect_right(self._edges[sensor], value)
+            pane.counts[sensor][bucket] += 1
+            self._window_counts[sensor][bucket] += 1
+
+            # Welford update
+            moments = pane.moments[sensor]
+            moments[0] += 1
+            delta = value - moments[1]
+            moments[1] += delta / moments[0]
+            moments[2] += delta * (value - moments[1])
+
+    def _evict(self, pane: _Pane) -> None:
+        """Remove a pane's counts from the window totals."""
+        self._window_size -= pane.size
+        for sensor, counts in pane.counts.items():
+            window_counts = self._window_counts[sensor]
+            for bucket, count in enumerate(counts):
+                window_counts[bucket] -= count
+
+    def _current_probabilities(self, sensor: str) -> list[float]:
+        """Fraction of the window's values of a sensor in each bin."""
+        counts = self._window_counts[sensor]
+        total = sum(counts)
+        return [count / total for count in counts] if total else [0.0] * len(counts)
+
+    def scores(self) -> dict[str, dict[str, float]]:
+        """
+        Compute the PSI and KS scores of each sensor
+
+        Returns:
+            Dictionary mapping each sensor with values in the window to its "psi" and "ks" scores
+        """
+        scores = {}
+        for sensor in self.sensors:
+            if not sum(self._window_counts[sensor]):
+                continue
+
+            current = self._current_probabilities(sensor)
+            reference = self._reference[sensor]
+
+            psi = 0.0
+            ks = 0.0
+            current_cdf = reference_cdf = 0.0
+            for p, q in zip(current, reference):
+                p_smooth, q_smooth = max(p, PSI_EPSILON), max(q, PSI_EPSILON)
+                psi += (p_smooth - q_smooth) * math.log(p_smooth / q_smooth)
+                current_cdf += p
+                reference_cdf += q
+                ks = max(ks, abs(current_cdf - reference_cdf))
+
+            scores[sensor] = {"psi": psi, "ks": ks}
+
+        return scores
+
+    def reference_summary(self) -> dict[str, Any]:
+        """
+        Summarise the reference distribution of each sensor
+
+        Returns:
+            Dictionary mapping each sensor to its reference statistics, bin edges and bin probabilities
+        """
+        return {
+            sensor: {**self.reference_stats[sensor], "edges": self._edges[sensor], "probabilities": self._reference[sensor]}
+            for sensor in self.sensors
+        }
+
+    def current_summary(self) -> dict[str, Any]:
+        """
+        Summarise the distribution of each sensor over the window
+
+        Returns:
+            Dictionary mapping each sensor to its count, mean, std, bin
+            probabilities and drift scores over the window
+        """
+        scores = self.scores()
+        summary = {}
+        for sensor in self.sensors:
+            count, mean, variance = _merge_moments([pane.moments[sensor] for pane in self._panes])
+            summary[sensor] = {
+                "count": count,
+                "mean": mean,
+                "std": math.sqrt(variance),
+                "probabilities": self._current_probabilities(sensor),
+                **scores.get(sensor, {})
+            }
+        return summary
+
+    def check(self) -> tuple[float, bool]:
+        """
+        Compute the drift score and detect threshold crossings
+
+        Returns:
+            Tuple of (drift score, whether the score has just risen above the
+            threshold); the score is 0.0 until the window holds min_count readings
+        """
+        if self._window_size < self.min_count:
+            return 0.0, False
+
+        scores = self.scores()
+        drift_score = max((score["psi"] for score in scores.values()), default=0.0)
+
+        crossed = drift_score > self.threshold and not self.drifting
+        self.drifting = drift_score > self.threshold
+        return drift_score, crossed
+
+    async def check_and_record(self, db: AsyncIOMotorDatabase) -> ObjectId | None:
+        """
+        Check for drift and record a DriftEvent if the threshold has just been crossed
+
+        Args:
+            db: MongoDB database
+
+        Returns:
+            ID of the created drift event, or None if no event was recorded
+        """
+        drift_score, crossed = self.check()
+        if not crossed:
+            return None
+
+        return await create_drift_event(
+            db,
+            drift_score=drift_score,
+            reference_distribution=self.reference_summary(),
+            current_distribution=self.current_summary()
+        )
@@ -0,0 +1,116 @@
+"""
+Columnar export of sensor readings to Polars DataFrames.
+
+This module builds DataFrames with one column per sensor directly from raw
+documents streamed in batches, without constructing a SensorReading model
+per row, for training and drift jobs that work on readings as matrices.
+
+Polars is an optional dependency, installed with the "analytics" extra:
+
+    pip install "sensor-domain[analytics]"
+"""
+
+from typing import Any
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING
+from bson import ObjectId
+import polars as pl
+
+from domain.models import SensorReading
+from domain.utils.db import iter_cursor_batches
+
+READINGS_FRAME_PROJECTION = {"_id": 0, "timestamp": 1, "machine_id": 1, "values": 1}
+
+
+def _batch_to_frame(docs: list[dict[str, Any]], include_machine_id: bool) -> pl.DataFrame:
+    """Convert a batch of raw reading documents to a DataFrame."""
+    sensors = pl.from_dicts([doc["values"] for doc in docs], infer_schema_length=None)
+    columns = [pl.Series("timestamp", [doc["timestamp"] for doc in docs], dtype=pl.Datetime)]
+    if include_machine_id:
+        columns.insert(0, pl.Series("machine_id", [str(doc["machine_id"]) for doc in docs], dtype=pl.Utf8))
+    return pl.DataFrame(columns).hstack(sensors.cast(pl.Float64))
+
+
+async def _collect_frame(cursor, batch_size: int, include_machine_id: bool) -> pl.DataFrame:
+    """Stream a readings cursor in batches and concatenate the batches into one DataFrame."""
+    frames = [
+        _batch_to_frame(docs, include_machine_id)
+        async for docs in iter_cursor_batches(cursor, SensorReading, batch_size, raw=True)
+    ]
+
+    if not frames:
+        schema = {"timestamp": pl.Datetime}
+        if include_machine_id:
+            schema = {"machine_id": pl.Utf8, **schema}
+        return pl.DataFrame(schema=schema)
+
+    # Sensors missing from some batches become null in those rows
+    return pl.concat(frames, how="diagonal")
+
+
+async def get_readings_frame(
+    db: AsyncIOMotorClient,
+    machine_id: str | ObjectId,
+    start_time: Any,
+    end_time: Any,
+    batch_size: int = 10000
+) -> pl.DataFrame:
+    """
+    Get readings for a machine within a time range as a DataFrame
+
+    Args:
+        db: MongoDB database connection
+        machine_id: ID of the machine
+        start_time: Start of the time range
+        end_time: End of the time range
+        batch_size: Number of readings fetched per batch
+
+    Returns:
+        DataFrame with a timestamp column and one Float64 column per sensor,
+        sorted by timestamp (oldest first)
+    """
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+
+    cursor = db[SensorReading.Config.collection].find({
+        "machine_id": machine_id,
+        "timestamp": {"$gte": start_time, "$lte": end_time}
+    }, READINGS_FRAME_PROJECTION).sort("timestamp", ASCENDING)
+
+    return await _collect_frame(cursor, batch_size, include_machine_id=False)
+
+
+async def get_machines_readings_frame(
+    db: AsyncIOMotorClient,
+    machine_ids: list[str | ObjectId],
+    start_time: Any,
+    end_time: Any,
+    batch_size: int = 10000
+) -> pl.DataFrame:
+    """
+    Get readings for several machines within a time range as a single DataFrame
+
+    Args:
+        db: MongoDB database connection
+        machine_ids: IDs of the machines
+        start_time: Start of the time range
+        end_time: End of the time range
+        batch_size: Number of readings fetched per batch
+
+    Returns:
+        DataFrame with machine_id and timestamp columns and one Float64 column
+        per sensor, sorted by machine_id and then timestamp (oldest first)
+    """
+    machine_ids = [
+        ObjectId(machine_id) if isinstance(machine_id, str) and ObjectId.is_valid(machine_id) else machine_id
+        for machine_id in machine_ids
+    ]
+
+    cursor = db[SensorReading.Config.collection].find({
+        "machine_id": {"$in": machine_ids},
+        "timestamp": {"$gte": start_time, "$lte": end_time}
+    }, READINGS_FRAME_PROJECTION).sort([("machine_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)])
+
+    # The server returns the index order, so oldest first is restored locally
+    frame = await _collect_frame(cursor, batch_size, include_machine_id=True)
+    return frame.sort(["machine_id", "timestamp"], maintain_order=True)
@@ -0,0 +1,272 @@
+"""
+Index planning for MongoDB/CosmosDB collections.
+
+This module declares the indexes each collection needs, alongside the
+query helpers that rely on them, so that indexes follow the actual query
+shapes (equality filters first, then the sort or range field). It also
+provides helpers to create the planned indexes, to report indexes that are
+missing, unplanned or unused, and to check which index a query uses.
+"""
+
+from typing import Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+from pydantic import BaseModel, Field
+
+from domain.models import (
+    Machine,
+    Failure,
+    SensorReading,
+    ReadingBucket,
+    SensorRollup,
+    SensorPrediction,
+    Cluster,
+    DriftEvent,
+    ModelVersion
+)
+
+
+class PlannedIndex(BaseModel):
+    """
+    An index declared for a collection and the query helpers that use it.
+
+    Attributes:
+        collection (str): Collection the index belongs to
+        keys (List[Tuple[str, int]]): Index keys and directions, in order
+        used_by (List[str]): Query helpers whose filter and sort the index serves
+        unique (bool): Whether the index enforces uniqueness
+        partial_filter (Dict, optional): Partial filter expression, if any
+    """
+    collection: str = Field(..., description="Collection the index belongs to")
+    keys: list[tuple[str, int]] = Field(..., description="Index keys and directions, in order")
+    used_by: list[str] = Field(default_factory=list, description="Query helpers whose filter and sort the index serves")
+    unique: bool = Field(default=False, description="Whether the index enforces uniqueness")
+    partial_filter: dict[str, Any] | None = Field(None, description="Partial filter expression, if any")
+
+    @property
+    def name(self) -> str:
+        """Index name, following MongoDB's default naming with a suffix for partial indexes."""
+        name = "_".join(f"{field}_{direction}" for field, direction in self.keys)
+        if self.partial_filter:
+            name += "_partial_" + "_".join(self.partial_filter)
+        return name
+
+    def to_index_model(self) -> IndexModel:
+        """Convert the planned index to a pymongo IndexModel."""
+        options: dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.partial_filter:
+            options["partialFilterExpression"] = self.partial_filter
+        return IndexModel(self.keys, **options)
+
+
+INDEX_PLAN: list[PlannedIndex] = [
+    PlannedIndex(
+        collection=Machine.Config.collection,
+        keys=[("machine_id", ASCENDING)],
+        unique=True,
+        used_by=["create_machine"]
+    ),
+    PlannedIndex(
+        collection=Machine.Config.collection,
+        keys=[("last_seen", DESCENDING)],
+        used_by=["get_documents"]
+    ),
+    PlannedIndex(
+        collection=Failure.Config.collection,
+        keys=[("machine_id", ASCENDING), ("start_time", DESCENDING)],
+        used_by=["get_machine_failures"]
+    ),
+    PlannedIndex(
+        collection=Failure.Config.collection,
+        keys=[("is_active", ASCENDING), ("start_time", DESCENDING)],
+        partial_filter={"is_active": True},
+        used_by=["get_active_failures", "resolve_failure"]
+    ),
+    PlannedIndex(
+        collection=SensorReading.Config.collection,
+        keys=[("machine_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)],
+        used_by=[
+            "get_machine_readings",
+            "get_readings_in_timerange",
+            "iter_machine_readings",
+            "iter_readings_in_timerange",
+            "get_machine_readings_page",
+            "get_readings_frame",
+            "get_machines_readings_frame",
+            "aggregate_sensor_stats"
+        ]
+    ),
+    PlannedIndex(
+        collection=SensorReading.Config.collection,
+        keys=[("failure_id", ASCENDING), ("timestamp", DESCENDING)],
+        used_by=["get_failure_readings", "iter_failure_readings"]
+    ),
+    PlannedIndex(
+        collection=ReadingBucket.Config.collection,
+        keys=[("machine_id", ASCENDING), ("start_time", DESCENDING)],
+        used_by=["append_reading_to_bucket", "append_readings_to_buckets", "iter_bucketed_readings"]
+    ),
+    PlannedIndex(
+        collection=SensorRollup.Config.collection,
+        keys=[("machine_id", ASCENDING), ("resolution", ASCENDING), ("start_time", ASCENDING)],
+        unique=True,
+        used_by=["update_rollups", "get_rollups", "get_sensor_rollup_series"]
+    ),
+    PlannedIndex(
+        collection=SensorPrediction.Config.collection,
+        keys=[("reading_id", ASCENDING), ("model_version", ASCENDING)],
+        unique=True,
+        used_by=["get_reading_predictions", "create_prediction", "create_predictions_bulk", "prefetch_reading_relations"]
+    ),
+    PlannedIndex(
+        collection=SensorPrediction.Config.collection,
+        keys=[("prediction_time", DESCENDING), ("_id", DESCENDING)],
+        used_by=["get_predictions_page"]
+    ),
+    PlannedIndex(
+        collection=Cluster.Config.collection,
+        keys=[("mlflow_run_id", ASCENDING)],
+        unique=True,
+        used_by=["create_cluster_model"]
+    ),
+    PlannedIndex(
+        collection=Cluster.Config.collection,
+        keys=[("is_active", ASCENDING), ("created_at", DESCENDING)],
+        partial_filter={"is_active": True},
+        used_by=["get_active_cluster"]
+    ),
+    PlannedIndex(
+        collection=DriftEvent.Config.collection,
+        keys=[("detection_time", DESCENDING)],
+        used_by=["get_documents"]
+    ),
+    PlannedIndex(
+        collection=ModelVersion.Config.collection,
+        keys=[("version", ASCENDING)],
+        used_by=["get_documents"]
+    ),
+    PlannedIndex(
+        collection=ModelVersion.Config.collection,
+        keys=[("is_processed", ASCENDING), ("created_at", DESCENDING)],
+        used_by=["get_documents", "ActiveClusterCache"]
+    ),
+]
+
+
+def plan_by_collection(plan: list[PlannedIndex] = INDEX_PLAN) -> dict[str, list[PlannedIndex]]:
+    """
+    Group planned indexes by collection
+
+    Args:
+        plan: Planned indexes (defaults to INDEX_PLAN)
+
+    Returns:
+        Dictionary mapping collection names to their planned indexes
+    """
+    grouped: dict[str, list[PlannedIndex]] = {}
+    for index in plan:
+        grouped.setdefault(index.collection, []).append(index)
+    return grouped
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase, plan: list[PlannedIndex] = INDEX_PLAN) -> None:
+    """
+    Create all planned indexes that do not exist yet
+
+    Existing indexes are listed first, so that when every planned index is
+    already present no index builds are requested.
+
+    Args:
+        db: MongoDB database
+        plan: Planned indexes (defaults to INDEX_PLAN)
+    """
+    for collection, indexes in plan_by_collection(plan).items():
+        existing = await db[collection].index_information()
+        missing = [index.to_index_model() for index in indexes if index.name not in existing]
+        if missing:
+            await db[collection].create_indexes(missing)
+
+
+async def report_indexes(
+    db: AsyncIOMotorDatabase,
+    plan: list[PlannedIndex] = INDEX_PLAN
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Compare the indexes in the database with the plan
+
+    Usage statistics come from $indexStats and only cover operations since
+    the server last started; they are skipped where $indexStats is not
+    supported.
+
+    Args:
+        db: MongoDB database
+        plan: Planned indexes (defaults to INDEX_PLAN)
+
+    Returns:
+        Dictionary mapping collection names to lists of index names under
+        "missing" (planned but absent), "unplanned" (present but not planned)
+        and "unused" (present but never used)
+    """
+    report: dict[str, dict[str, list[str]]] = {}
+    for collection, indexes in plan_by_collection(plan).items():
+        existing = await db[collection].index_information()
+        planned = {index.name for index in indexes}
+
+        unused: list[str] = []
+        try:
+            async for stats in db[collection].aggregate([{"$indexStats": {}}]):
+                if stats["name"] != "_id_" and stats["accesses"]["ops"] == 0:
+                    unused.append(stats["name"])
+        except OperationFailure:
+            pass
+
+        report[collection] = {
+            "missing": sorted(planned - set(existing)),
+            "unplanned": sorted(set(existing) - planned - {"_id_"}),
+            "unused": sorted(unused)
+        }
+
+    return report
+
+
+def _iter_stages(stage: dict[str, Any]):
+    """Yield every stage of a query plan stage tree, depth first."""
+    yield stage
+    for key in ("inputStage", "queryPlan"):
+        if key in stage:
+            yield from _iter_stages(stage[key])
+    for child in stage.get("inputStages", []):
+        yield from _iter_stages(child)
+
+
+async def explain_index(
+    db: AsyncIOMotorDatabase,
+    collection: str,
+    query: dict[str, Any],
+    sort: list[tuple[str, int]] | None = None
+) -> tuple[str | None, bool]:
+    """
+    Explain a query and report which index it uses
+
+    Args:
+        db: MongoDB database
+        collection: Collection name
+        query: MongoDB query
+        sort: Optional list of (field, direction) tuples for sorting
+
+    Returns:
+        Tuple of (index name or None for a collection scan, whether the
+        plan needs an in-memory sort)
+    """
+    cursor = db[collection].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+
+    explanation = await cursor.explain()
+    stages = list(_iter_stages(explanation["queryPlanner"]["winningPlan"]))
+    index_name = next((stage["indexName"] for stage in stages if "indexName" in stage), None)
+    in_memory_sort = any(stage.get("stage") == "SORT" for stage in stages)
+    return index_name, in_memory_sort
@@ -0,0 +1,183 @@
+"""
+Pre-aggregated rollups of sensor values.
+
+This module maintains per-minute and per-hour statistics of each machine's
+sensor values (see SensorRollup) as readings are written, using $inc, $min
+and $max upserts, and provides query helpers that read these rollups instead
+of the raw readings, so that the cost of a long-range chart depends on the
+number of periods rather than on the number of readings.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne, ASCENDING
+from bson import ObjectId
+
+from domain.models import SensorReading, SensorRollup
+from domain.models.rollup import SensorStats
+from domain.utils.buckets import bucket_start
+
+ROLLUP_RESOLUTIONS: dict[str, int] = {
+    "minute": 60,
+    "hour": 3600
+}
+
+
+def _rollup_operations(
+    readings: list[SensorReading],
+    resolutions: list[str]
+) -> list[UpdateOne]:
+    """Reduce readings to one $inc/$min/$max upsert per machine, resolution and period."""
+    groups: dict[tuple[ObjectId, str, datetime], list[SensorReading]] = defaultdict(list)
+    for reading in readings:
+        for resolution in resolutions:
+            period_start = bucket_start(reading.timestamp, ROLLUP_RESOLUTIONS[resolution])
+            groups[(reading.machine_id, resolution, period_start)].append(reading)
+
+    operations = []
+    for (machine_id, resolution, period_start), group in groups.items():
+        inc: dict[str, Any] = {"count": len(group)}
+        minimum: dict[str, float] = {}
+        maximum: dict[str, float] = {}
+        for reading in group:
+            for sensor, value in reading.values.items():
+                prefix = f"sensors.{sensor}"
+                inc[f"{prefix}.count"] = inc.get(f"{prefix}.count", 0) + 1
+                inc[f"{prefix}.sum"] = inc.get(f"{prefix}.sum", 0.0) + value
+                inc[f"{prefix}.sum_sq"] = inc.get(f"{prefix}.sum_sq", 0.0) + value * value
+                minimum[f"{prefix}.min"] = min(value, minimum.get(f"{prefix}.min", value))
+                maximum[f"{prefix}.max"] = max(value, maximum.get(f"{prefix}.max", value))
+
+        update: dict[str, Any] = {"$inc": inc}
+        if minimum:
+            update["$min"] = minimum
+            update["$max"] = maximum
+
+        operations.append(UpdateOne(
+            {"machine_id": machine_id, "resolution": resolution, "start_time": period_start},
+            update,
+            upsert=True
+        ))
+
+    return operations
+
+
+async def update_rollups(
+    db: AsyncIOMotorDatabase,
+    readings: list[SensorReading],
+    resolutions: list[str] | None = None
+) -> int:
+    """
+    Add readings to the rollups of their machines
+
+    Readings are first reduced in memory, so a batch of readings costs one
+    upsert per machine, resolution and period, all sent in one bulk_write.
+
+    Args:
+        db: MongoDB database
+        readings: Sensor readings to add
+        resolutions: Resolutions to maintain (defaults to all of ROLLUP_RESOLUTIONS)
+
+    Returns:
+        Number of rollup documents written
+    """
+    operations = _rollup_operations(readings, resolutions or list(ROLLUP_RESOLUTIONS))
+    if operations:
+        await db[SensorRollup.Config.collection].bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+async def get_rollups(
+    db: AsyncIOMotorDatabase,
+    machine_id: str | ObjectId,
+    start_time: datetime,
+    end_time: datetime,
+    resolution: str = "minute"
+) -> list[SensorRollup]:
+    """
+    Get the rollups of a machine within a time range
+
+    Args:
+        db: MongoDB database
+        machine_id: ID of the machine
+        start_time: Start of the time range
+        end_time: End of the time range
+        resolution: Rollup resolution ("minute" or "hour")
+
+    Returns:
+        List of rollups whose periods start within the range, sorted by start_time (oldest first)
+
+    Raises:
+        ValueError: If the resolution is unknown
+    """
+    if resolution not in ROLLUP_RESOLUTIONS:
+        raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+
+    cursor = db[SensorRollup.Config.collection].find({
+        "machine_id": machine_id,
+        "resolution": resolution,
+        "start_time": {"$gte": bucket_start(start_time, ROLLUP_RESOLUTIONS[resolution]), "$lte": end_time}
+    }).sort("start_time", ASCENDING)
+
+    return [SensorRollup(**doc) for doc in await cursor.to_list(length=None)]
+
+
+async def get_sensor_rollup_series(
+    db: AsyncIOMotorDatabase,
+    machine_id: str | ObjectId,
+    sensor: str,
+    start_time: datetime,
+    end_time: datetime,
+    resolution: str = "minute"
+) -> list[dict[str, Any]]:
+    """
+    Get the rollup statistics of one sensor of a machine as a time series
+
+    Only the requested sensor's statistics are read from each rollup.
+
+    Args:
+        db: MongoDB database
+        machine_id: ID of the machine
+        sensor: Name of the sensor
+        start_time: Start of the time range
+        end_time: End of the time range
+        resolution: Rollup resolution ("minute" or "hour")
+
+    Returns:
+        List of dicts with "start_time", "count", "mean", "std", "min" and
+        "max", sorted by start_time (oldest first)
+
+    Raises:
+        ValueError: If the resolution is unknown
+    """
+    if resolution not in ROLLUP_RESOLUTIONS:
+        raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+    if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+        machine_id = ObjectId(machine_id)
+
+    cursor = db[SensorRollup.Config.collection].find({
+        "machine_id": machine_id,
+        "resolution": resolution,
+        "start_time": {"$gte": bucket_start(start_time, ROLLUP_RESOLUTIONS[resolution]), "$lte": end_time},
+        f"sensors.{sensor}": {"$exists": True}
+    }, {"_id": 0, "start_time": 1, f"sensors.{sensor}": 1}).sort("start_time", ASCENDING)
+
+    series = []
+    async for doc in cursor:
+        stats = SensorStats(**doc["sensors"][sensor])
+        series.append({
+            "start_time": doc["start_time"],
+            "count": stats.count,
+            "mean": stats.mean,
+            "std": stats.std,
+            "min": stats.min,
+            "max": stats.max
+        })
+
+    return series
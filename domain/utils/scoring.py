@@ -0,0 +1,172 @@
+"""
+Vectorised nearest-centroid scoring of sensor readings.
+
+This module compiles the centroids stored in Cluster.cluster_profiles into
+a NumPy matrix once, and then assigns whole batches of readings to their
+nearest cluster in a single vectorised call, returning cluster IDs and
+confidence scores as arrays that can be passed directly to
+create_predictions_bulk.
+
+NumPy is an optional dependency, installed with the "analytics" extra:
+
+    pip install "sensor-domain[analytics]"
+"""
+
+from typing import Any, Mapping, Sequence
+import numpy as np
+
+from domain.models import Cluster, SensorReading
+
+
+class CentroidScorer:
+    """
+    Assigns readings to the nearest cluster centroid.
+
+    The cluster profiles map each cluster ID to its centroid, either
+    directly as a mapping of sensor names to values or under a "centroid"
+    key alongside other characteristics of the cluster:
+
+        {"0": {"centroid": {"sensor_00": 1.2, "sensor_01": 0.4}, "size": 812}, ...}
+        {"0": {"sensor_00": 1.2, "sensor_01": 0.4}, ...}
+
+    Confidence is the inverse-distance share of the nearest centroid: 1.0
+    when a reading coincides with its centroid, and 1/k when it is equally
+    far from all k centroids.
+
+    Attributes:
+        cluster_ids: Cluster ID of each row of the centroid matrix
+        centroids: Centroid matrix, one row per cluster and one column per sensor
+        sensors: Sensor name of each column of the centroid matrix
+    """
+
+    def __init__(self, cluster_ids: Sequence[int], centroids: np.ndarray, sensors: Sequence[str]) -> None:
+        self.cluster_ids = np.asarray(cluster_ids, dtype=np.int64)
+        self.centroids = np.asarray(centroids, dtype=np.float64)
+        self.sensors = list(sensors)
+
+        if self.centroids.shape != (len(self.cluster_ids), len(self.sensors)):
+            raise ValueError(
+                f"Expected a {len(self.cluster_ids)} x {len(self.sensors)} centroid matrix, "
+                f"got {self.centroids.shape}"
+            )
+
+        # Squared norms are reused by every call to score()
+        self._centroid_norms = np.einsum("ij,ij->i", self.centroids, self.centroids)
+
+    @classmethod
+    def from_profiles(cls, cluster_profiles: Mapping[str, Any], sensors: Sequence[str] | None = None) -> "CentroidScorer":
+        """
+        Compile cluster profiles into a scorer
+
+        Args:
+            cluster_profiles: Cluster profiles as stored in Cluster.cluster_profiles
+            sensors: Sensors to use as columns (defaults to all sensors of the centroids, sorted)
+
+        Returns:
+            Scorer for the clusters in the profiles
+
+        Raises:
+            ValueError: If there are no profiles or a cluster ID is not an integer
+            KeyError: If a centroid lacks one of the sensors
+        """
+        if not cluster_profiles:
+            raise ValueError("No cluster profiles to compile")
+
+        centroids = {
+            int(cluster_id): profile.get("centroid", profile)
+            for cluster_id, profile in cluster_profiles.items()
+        }
+
+        if sensors is None:
+            sensors = sorted({sensor for centroid in centroids.values() for sensor in centroid})
+
+        cluster_ids = sorted(centroids)
+        matrix = np.array(
+            [[float(centroids[cluster_id][sensor]) for sensor in sensors] for cluster_id in cluster_ids],
+            dtype=np.float64
+        )
+        return cls(cluster_ids, matrix, sensors)
+
+    @classmethod
+    def from_cluster(cls, cluster: Cluster, sensors: Sequence[str] | None = None) -> "CentroidScorer":
+        """
+        Compile the profiles of a cluster model into a scorer
+
+        Args:
+            cluster: Cluster model, typically the active one
+            sensors: Sensors to use as columns (defaults to all sensors of the centroids, sorted)
+
+        Returns:
+            Scorer for the clusters of the model
+        """
+        return cls.from_profiles(cluster.cluster_profiles, sensors)
+
+    def to_matrix(self, readings: Sequence[SensorReading | Mapping[str, float]]) -> np.ndarray:
+        """
+        Arrange readings as a matrix with the scorer's sensor columns
+
+        Args:
+            readings: Sensor readings, or their values as mappings of sensor names to values
+
+        Returns:
+            Matrix with one row per reading and one column per sensor
+
+        Raises:
+            KeyError: If a reading lacks one of the sensors
+        """
+        rows = [reading.values if isinstance(reading, SensorReading) else reading for reading in readings]
+        matrix = np.empty((len(rows), len(self.sensors)), dtype=np.float64)
+        for j, sensor in enumerate(self.sensors):
+            matrix[:, j] = [row[sensor] for row in rows]
+        return matrix
+
+    def score(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Assign readings to their nearest centroid
+
+        Args:
+            values: Matrix with one row per reading and one column per sensor,
+                in the order of the scorer's sensors; a single reading may be
+                given as a vector
+
+        Returns:
+            Tuple of (cluster IDs, confidence scores), each an array with one entry per reading
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+        if values.shape[1] != len(self.sensors):
+            raise ValueError(f"Expected {len(self.sensors)} sensor columns, got {values.shape[1]}")
+
+        # |x - c|^2 = |x|^2 - 2 x.c + |c|^2, computed with one matrix product
+        distances = np.einsum("ij,ij->i", values, values)[:, None] - 2.0 * values @ self.centroids.T
+        distances += self._centroid_norms
+        np.maximum(distances, 0.0, out=distances)
+        np.sqrt(distances, out=distances)
+
+        nearest = np.argmin(distances, axis=1)
+        rows = np.arange(len(values))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = 1.0 / distances
+            confidence = weights[rows, nearest] / weights.sum(axis=1)
+
+        # A reading on a centroid has infinite weight, shared among coincident centroids
+        exact = np.isinf(weights)
+        on_centroid = exact.any(axis=1)
+        if on_centroid.any():
+            confidence[on_centroid] = 1.0 / exact[on_centroid].sum(axis=1)
+
+        return self.cluster_ids[nearest], confidence
+
+    def score_readings(self, readings: Sequence[SensorReading | Mapping[str, float]]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Assign sensor readings to their nearest centroid
+
+        Args:
+            readings: Sensor readings, or their values as mappings of sensor names to values
+
+        Returns:
+            Tuple of (cluster IDs, confidence scores), each an array with one entry per reading
+        """
+        if not readings:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        return self.score(self.to_matrix(readings))
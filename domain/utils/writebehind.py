@@ -0,0 +1,142 @@
+"""
+Write-behind buffering for machine last_seen updates.
+
+This module provides an in-process coalescer that collects last_seen
+timestamps per machine in memory and writes only the latest one for each
+machine to the database, periodically or once enough machines are pending,
+instead of issuing one update per sensor reading.
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from bson import ObjectId
+
+from domain.models import Machine
+
+logger = logging.getLogger(__name__)
+
+
+class LastSeenBuffer:
+    """
+    Coalesces machine last_seen updates and flushes them in one bulk write.
+
+    Only the maximum timestamp recorded for each machine is kept, so memory
+    grows with the number of distinct machines rather than the number of
+    readings. Flushing uses $max so that an older buffered timestamp never
+    overwrites a newer one already stored.
+
+    Attributes:
+        db: MongoDB database
+        flush_interval: Seconds between periodic flushes once started
+        max_pending: Number of pending machines that triggers an immediate flush
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        flush_interval: float = 5.0,
+        max_pending: int = 1000
+    ) -> None:
+        self.db = db
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[ObjectId, datetime] = {}
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def __aenter__(self) -> "LastSeenBuffer":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def record(self, machine_id: str | ObjectId, timestamp: datetime | None = None) -> None:
+        """
+        Record that a machine was seen, flushing if the size threshold is reached
+
+        Args:
+            machine_id: ID of the machine
+            timestamp: When the machine was seen (defaults to current time)
+        """
+        if isinstance(machine_id, str) and ObjectId.is_valid(machine_id):
+            machine_id = ObjectId(machine_id)
+
+        timestamp = timestamp or datetime.now()
+        current = self._pending.get(machine_id)
+        if current is None or timestamp > current:
+            self._pending[machine_id] = timestamp
+
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending last_seen timestamps in a single bulk write
+
+        If the write fails, the pending timestamps are kept so that they
+        are retried on the next flush.
+
+        Returns:
+            Number of machines written
+        """
+        async with self._lock:
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, {}
+            try:
+                await self.db[Machine.Config.collection].bulk_write(
+                    [
+                        UpdateOne({"_id": machine_id}, {"$max": {"last_seen": timestamp}})
+                        for machine_id, timestamp in pending.items()
+                    ],
+                    ordered=False
+                )
+
+            except Exception:
+                for machine_id, timestamp in pending.items():
+                    current = self._pending.get(machine_id)
+                    if current is None or timestamp > current:
+                        self._pending[machine_id] = timestamp
+                raise
+
+            return len(pending)
+
+    async def _flush_periodically(self) -> None:
+        """Flush pending timestamps every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                # The timestamps stay pending and are retried on the next flush
+                logger.exception("Flushing %d pending last_seen updates failed", len(self._pending))
+
+    def start(self) -> None:
+        """
+        Start flushing periodically in the background of the running event loop
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """
+        Stop periodic flushing and write any pending timestamps
+
+        This should be called on shutdown so that no updates are lost.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        await self.flush()
@@ -11,11 +11,19 @@ import time
 
 from loguru import logger
 
+from producer.config import config
 from producer.services.producer import SensorDataProducer
 
 if __name__ == "__main__":
     time.sleep(10)
-    logger.info("Starting sensor data producer...")
+    logger.info(f"Starting sensor data producer in {config.producer_mode} mode...")
+
+    if config.producer_mode == "async":
+        from producer.services.pipeline import AsyncSensorDataProducer
+
+        producer: SensorDataProducer = AsyncSensorDataProducer()
+
+    else:
+        producer = SensorDataProducer()
 
-    producer = SensorDataProducer()
     producer.produce_messages()
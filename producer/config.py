@@ -48,9 +48,21 @@ class Config:
         self.eventhub_name = os.environ.get("EVENTHUB_NAME", "sensors")
         self.eventhub_namespace = os.environ.get("EVENTHUB_NAMESPACE", "")
         self.num_sensors = int(os.environ.get("NUM_SENSORS", "20"))
-        self.simulation_interval_ms = int(
+        self.num_machines = int(os.environ.get("NUM_MACHINES", "1"))
+        self.simulation_interval_ms = float(
             os.environ.get("SIMULATION_INTERVAL_MS", "1000")
         )
+        self.tick_policy = os.environ.get("TICK_POLICY", "catch_up").lower()
+        self.producer_mode = os.environ.get("PRODUCER_MODE", "sync").lower()
+        self.pipeline_queue_size = int(os.environ.get("PIPELINE_QUEUE_SIZE", "1000"))
+        self.max_inflight_sends = int(os.environ.get("MAX_INFLIGHT_SENDS", "4"))
+        self.pipeline_drain_timeout_ms = int(
+            os.environ.get("PIPELINE_DRAIN_TIMEOUT_MS", "10000")
+        )
+        self.message_serializer = os.environ.get("MESSAGE_SERIALIZER", "json").lower()
+        self.micro_batch_ticks = int(os.environ.get("MICRO_BATCH_TICKS", "0"))
+        self.batch_linger_ms = int(os.environ.get("BATCH_LINGER_MS", "0"))
+        self.batch_max_size_bytes = int(os.environ.get("BATCH_MAX_SIZE_BYTES", "0"))
         self.data_file = os.environ.get("SENSOR_DATA_FILE", "data_sensors.csv")
         self.storage_container = os.environ.get("STORAGE_CONTAINER", "data")
 
@@ -80,7 +92,17 @@ class Config:
         logger.info(f"  STORAGE_ACCOUNT_NAME: {self.storage_account_name}")
         logger.info(f"  STORAGE_CONTAINER: {self.storage_container}")
         logger.info(f"  NUM_SENSORS: {self.num_sensors}")
+        logger.info(f"  NUM_MACHINES: {self.num_machines}")
         logger.info(f"  SIMULATION_INTERVAL_MS: {self.simulation_interval_ms}")
+        logger.info(f"  TICK_POLICY: {self.tick_policy}")
+        logger.info(f"  PRODUCER_MODE: {self.producer_mode}")
+        logger.info(f"  PIPELINE_QUEUE_SIZE: {self.pipeline_queue_size}")
+        logger.info(f"  MAX_INFLIGHT_SENDS: {self.max_inflight_sends}")
+        logger.info(f"  PIPELINE_DRAIN_TIMEOUT_MS: {self.pipeline_drain_timeout_ms}")
+        logger.info(f"  MESSAGE_SERIALIZER: {self.message_serializer}")
+        logger.info(f"  MICRO_BATCH_TICKS: {self.micro_batch_ticks}")
+        logger.info(f"  BATCH_LINGER_MS: {self.batch_linger_ms}")
+        logger.info(f"  BATCH_MAX_SIZE_BYTES: {self.batch_max_size_bytes}")
         logger.info(f"  SENSOR_DATA_FILE: {self.data_file}")
 
 
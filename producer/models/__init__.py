@@ -6,8 +6,9 @@ the sensor data and messages published to Kafka. These models ensure
 consistent data formats and validation throughout the application.
 """
 
+from .batch import SensorBatchMessage
 from .failure import FailureInfo
 from .message import SensorMessage
 from .reading import SensorReading
 
-__all__ = ["SensorReading", "SensorMessage", "FailureInfo"]
+__all__ = ["SensorReading", "SensorMessage", "SensorBatchMessage", "FailureInfo"]
@@ -0,0 +1,79 @@
+"""
+Micro-batch message models for the Sensor Data Producer Service.
+
+This module defines a columnar message that carries the readings of many
+machines over several simulation ticks in a single event, instead of one
+event per reading.
+"""
+
+from pydantic import BaseModel, model_validator
+
+from .message import SensorMessage
+from .reading import SensorReading
+
+
+class SensorBatchMessage(BaseModel):
+    """
+    Model for columnar micro-batch messages.
+
+    This class represents the readings of N machines over M ticks as
+    columns. Machine IDs, timestamps and sensor names are each sent once,
+    and the values form a 2-D block with one row per reading, ordered
+    tick-major: row `t * N + m` holds the reading of `machine_ids[m]` at
+    `timestamps[t]`.
+
+    Attributes:
+        machine_ids (`list[str]`): Identifiers of the N machines in the batch
+        timestamps (`list[str]`): ISO format timestamps of the M ticks
+        sensors (`list[str]`): Sensor names, one per column of `values`
+        values (`list[list[float]]`): M * N rows of sensor values
+        has_failure (`list[bool]`): Failure indicator for each row
+    """
+
+    machine_ids: list[str]
+    timestamps: list[str]
+    sensors: list[str]
+    values: list[list[float]]
+    has_failure: list[bool]
+
+    @model_validator(mode="after")
+    def check_shape(self) -> "SensorBatchMessage":
+        """Check that the values block matches the machine, tick and sensor counts."""
+        rows = len(self.machine_ids) * len(self.timestamps)
+        if len(self.values) != rows or len(self.has_failure) != rows:
+            raise ValueError(
+                f"Expected {rows} rows for {len(self.machine_ids)} machines and "
+                f"{len(self.timestamps)} ticks, got {len(self.values)} values "
+                f"and {len(self.has_failure)} failure flags"
+            )
+
+        if any(len(row) != len(self.sensors) for row in self.values):
+            raise ValueError(f"Every row must have {len(self.sensors)} values")
+
+        return self
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def to_messages(self) -> list[SensorMessage]:
+        """
+        Expand the batch into one `SensorMessage` per reading.
+
+        Returns:
+            `list[SensorMessage]`: Messages in tick-major order
+        """
+        messages = []
+        num_machines = len(self.machine_ids)
+        for row, (values, has_failure) in enumerate(zip(self.values, self.has_failure)):
+            messages.append(
+                SensorMessage.model_construct(
+                    machine_id=self.machine_ids[row % num_machines],
+                    timestamp=self.timestamps[row // num_machines],
+                    readings=SensorReading.model_construct(
+                        readings=dict(zip(self.sensors, values)),
+                        has_failure=has_failure,
+                    ),
+                )
+            )
+
+        return messages
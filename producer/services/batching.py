@@ -0,0 +1,343 @@
+"""
+Batching utilities for the Sensor Data Producer Service.
+
+This module provides a sender that packs many events into a single
+`EventDataBatch` before publishing it to Azure Event Hubs, so that the cost
+of an AMQP round-trip is shared by every message in the batch rather than
+paid once per reading. It also provides a builder that collects several
+simulation ticks into a columnar `SensorBatchMessage`, so that a single
+event carries many readings.
+"""
+
+import time
+from typing import Any
+
+from azure.eventhub import EventData, EventDataBatch, EventHubProducerClient
+from loguru import logger
+
+from producer.models import SensorBatchMessage
+from producer.services.health import HealthService
+
+# Event Hubs message size limit on the Basic and Standard tiers
+DEFAULT_MAX_BATCH_BYTES = 1024 * 1024
+
+# Allowance for the micro-batch header and the AMQP framing of its event
+BATCH_OVERHEAD_BYTES = 1024
+
+# Allowance per row for its failure flag and separators
+ROW_OVERHEAD_BYTES = 8
+
+
+class BatchingSender:
+    """
+    Accumulates events into `EventDataBatch` instances and sends them when full.
+
+    Events are added to the current batch until it reaches its size limit,
+    at which point the batch is sent and a new one is started, or until the
+    oldest event in the batch has waited for the configured linger time.
+    Events can be added across simulation ticks and across machines.
+
+    Attributes:
+        `producer_client`: EventHubProducerClient instance used to send batches
+        `linger_ms`: Maximum time an event may wait in a batch before it is sent
+        `max_size_in_bytes`: Optional batch size limit, defaults to the link limit
+        `health_service`: Optional health service for monitoring and metrics
+    """
+
+    def __init__(
+        self,
+        producer_client: EventHubProducerClient,
+        linger_ms: int = 0,
+        max_size_in_bytes: int | None = None,
+        health_service: HealthService | None = None,
+    ) -> None:
+        """
+        Initialise the sender without an open batch.
+
+        Args:
+            `producer_client`: EventHubProducerClient instance used to send batches
+            `linger_ms`: Maximum time in milliseconds an event may wait before
+                the batch is sent. Defaults to 0, which sends on every check.
+            `max_size_in_bytes`: Optional batch size limit in bytes
+            `health_service`: Optional health service for monitoring and metrics
+
+        Returns:
+            `None`
+        """
+        self.producer_client = producer_client
+        self.linger_ms = linger_ms
+        self.max_size_in_bytes = max_size_in_bytes
+        self.health_service = health_service
+
+        self._batch: EventDataBatch | None = None
+        self._batch_count = 0
+        self._first_added_at: float | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting in the current batch."""
+        return self._batch_count
+
+    def _new_batch(self) -> EventDataBatch:
+        """Create a new empty batch respecting the configured size limit."""
+        if self.max_size_in_bytes:
+            return self.producer_client.create_batch(
+                max_size_in_bytes=self.max_size_in_bytes
+            )
+
+        return self.producer_client.create_batch()
+
+    def add(self, event: EventData) -> None:
+        """
+        Add an event to the current batch, sending the batch first if it is full.
+
+        Args:
+            `event`: Event to publish
+
+        Returns:
+            `None`
+
+        Raises:
+            `ValueError`: If the event is too large to fit in an empty batch
+        """
+        if self._batch is None:
+            self._batch = self._new_batch()
+
+        try:
+            self._batch.add(event)
+
+        except ValueError:
+            if self._batch_count == 0:
+                raise
+
+            self.flush()
+            self._batch = self._new_batch()
+            self._batch.add(event)
+
+        self._batch_count += 1
+        if self._first_added_at is None:
+            self._first_added_at = time.monotonic()
+
+    def flush_if_due(self) -> int:
+        """
+        Send the current batch if its oldest event has exceeded the linger time.
+
+        Returns:
+            `int`: Number of events sent, 0 if the batch was not due
+        """
+        if self._first_added_at is None:
+            return 0
+
+        waited_ms = (time.monotonic() - self._first_added_at) * 1000
+        if waited_ms < self.linger_ms:
+            return 0
+
+        return self.flush()
+
+    def flush(self) -> int:
+        """
+        Send the current batch regardless of its fill level.
+
+        Send errors are logged and counted against every event in the batch,
+        which is then discarded so that the producer can carry on.
+
+        Returns:
+            `int`: Number of events sent
+        """
+        if self._batch is None or self._batch_count == 0:
+            return 0
+
+        batch, count = self._batch, self._batch_count
+        self._batch = None
+        self._batch_count = 0
+        self._first_added_at = None
+
+        try:
+            logger.debug(f"Sending batch of {count} events ({batch.size_in_bytes} bytes)")
+            self.producer_client.send_batch(batch)
+
+        except Exception as err:
+            logger.error(f"Error sending batch of {count} events: {str(err)}")
+            logger.exception("Detailed exception information:")
+            if self.health_service:
+                self.health_service.increment_message_errors(count)
+            return 0
+
+        if self.health_service:
+            self.health_service.increment_messages_sent(count)
+
+        return count
+
+    def close(self) -> None:
+        """
+        Send any pending events.
+
+        Returns:
+            `None`
+        """
+        self.flush()
+
+
+class MicroBatchBuilder:
+    """
+    Collects simulation ticks into columnar micro-batch messages.
+
+    Every tick must contain the same machines in the same order, as is the
+    case for both the single-machine and the fleet simulation. A batch is
+    complete once it holds `ticks_per_batch` ticks, or once another tick
+    would take its estimated encoded size over `max_size_in_bytes`. The
+    size of a row is estimated from its number of sensors times
+    `bytes_per_value`, plus its machine ID and timestamp. A tick whose rows
+    alone exceed the limit is split across batches by machine.
+
+    Attributes:
+        `ticks_per_batch`: Number of ticks collected into each batch
+        `max_size_in_bytes`: Optional limit on the estimated encoded size of a batch
+        `bytes_per_value`: Estimated encoded size of one sensor value
+    """
+
+    def __init__(
+        self,
+        ticks_per_batch: int,
+        max_size_in_bytes: int | None = None,
+        bytes_per_value: int = 8,
+    ) -> None:
+        """
+        Initialise an empty builder.
+
+        Args:
+            `ticks_per_batch`: Number of ticks collected into each batch
+            `max_size_in_bytes`: Optional limit on the estimated encoded size
+                of a batch, such as the Event Hub batch size limit
+            `bytes_per_value`: Estimated encoded size of one sensor value,
+                as given by the serialiser's `batch_value_size`
+
+        Returns:
+            `None`
+        """
+        self.ticks_per_batch = ticks_per_batch
+        self.max_size_in_bytes = max_size_in_bytes
+        self.bytes_per_value = bytes_per_value
+        self._reset()
+
+    def _reset(self) -> None:
+        """Discard the collected ticks."""
+        self._machine_ids: list[str] = []
+        self._sensors: list[str] = []
+        self._timestamps: list[str] = []
+        self._values: list[list[float]] = []
+        self._has_failure: list[bool] = []
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the builder holds a complete batch."""
+        return len(self._timestamps) >= self.ticks_per_batch
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the builder holds no ticks."""
+        return not self._timestamps
+
+    def _max_rows(
+        self, timestamp: str, machine_data: list[tuple[str, dict[str, Any]]]
+    ) -> int | None:
+        """
+        Estimate how many rows like those of a tick fit in one batch.
+
+        Args:
+            `timestamp`: ISO format timestamp of the tick
+            `machine_data`: (machine_id, sensor_data) pairs of the tick
+
+        Returns:
+            `int | None`: Maximum number of rows per batch, at least 1, or
+                None if the batch size is not limited
+        """
+        if not self.max_size_in_bytes or not machine_data:
+            return None
+
+        sensors = machine_data[0][1]["readings"]
+        row_size = (
+            len(sensors) * self.bytes_per_value
+            + max(len(machine_id) for machine_id, _ in machine_data)
+            + len(timestamp)
+            + ROW_OVERHEAD_BYTES
+        )
+        # Sensor names are sent once per batch
+        budget = (
+            self.max_size_in_bytes
+            - BATCH_OVERHEAD_BYTES
+            - sum(len(sensor) + ROW_OVERHEAD_BYTES for sensor in sensors)
+        )
+        return max(1, budget // row_size)
+
+    def add_tick(
+        self, timestamp: str, machine_data: list[tuple[str, dict[str, Any]]]
+    ) -> list[SensorBatchMessage]:
+        """
+        Add the readings of one tick to the batch.
+
+        If the machines or sensors differ from those of the ticks already
+        collected, or the tick would not fit in the size limit, the pending
+        batch is completed first. A tick with more rows than fit in one
+        batch is split by machine into several batches.
+
+        Args:
+            `timestamp`: ISO format timestamp of the tick
+            `machine_data`: (machine_id, sensor_data) pairs as returned by
+                `SensorDataProducer.simulate_tick`
+
+        Returns:
+            `list[SensorBatchMessage]`: Batches completed by this call, in order
+        """
+        sensors = list(machine_data[0][1]["readings"]) if machine_data else []
+        max_rows = self._max_rows(timestamp, machine_data)
+        chunk_size = max_rows or max(len(machine_data), 1)
+
+        completed = []
+        for start in range(0, max(len(machine_data), 1), chunk_size):
+            chunk = machine_data[start : start + chunk_size]
+            machine_ids = [machine_id for machine_id, _ in chunk]
+
+            if not self.is_empty and (
+                machine_ids != self._machine_ids
+                or sensors != self._sensors
+                or (max_rows is not None and len(self._values) + len(chunk) > max_rows)
+            ):
+                completed.append(self.build())
+
+            if self.is_empty:
+                self._machine_ids = machine_ids
+                self._sensors = sensors
+
+            self._timestamps.append(timestamp)
+            for _, sensor_data in chunk:
+                self._values.append(list(sensor_data["readings"].values()))
+                self._has_failure.append(sensor_data["has_failure"])
+
+            # Complete the batch as soon as another tick could not fit
+            if self.is_full or (
+                max_rows is not None and len(self._values) + len(chunk) > max_rows
+            ):
+                completed.append(self.build())
+
+        return [batch for batch in completed if batch is not None]
+
+    def build(self) -> SensorBatchMessage | None:
+        """
+        Complete the pending batch and start a new one.
+
+        Returns:
+            `SensorBatchMessage | None`: The pending batch, or None if empty
+        """
+        if self.is_empty:
+            return None
+
+        batch = SensorBatchMessage.model_construct(
+            machine_ids=self._machine_ids,
+            timestamps=self._timestamps,
+            sensors=self._sensors,
+            values=self._values,
+            has_failure=self._has_failure,
+        )
+        self._reset()
+        return batch
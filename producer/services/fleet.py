@@ -0,0 +1,183 @@
+"""
+Vectorised fleet simulation engine for the Sensor Data Producer Service.
+
+This module provides a NumPy-backed simulator that advances many machines
+at once. The state of the whole fleet is held as a (machines x sensors)
+float array so that random drift, mean-reversion, clamping and failure
+blending are applied to every machine in a single vectorised step, with
+the same statistical behaviour as the per-machine logic in
+`SensorDataProducer.update_sensor_values`.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+from loguru import logger
+
+from producer.services.health import HealthService
+
+
+class FleetSimulator:
+    """
+    Simulator for a fleet of machines sharing the same sensor statistics.
+
+    Each row of the state arrays corresponds to one machine and each column
+    to one sensor, ordered as `Sensor 1` to `Sensor N`. Failures are tracked
+    per machine with a time counter (`-1` when no failure is active) and a
+    duration, mirroring `FailureInfo`.
+
+    Attributes:
+        `machine_ids`: Unique identifiers of the simulated machines
+        `sensor_names`: Sensor names in column order
+        `values`: Current (unrounded) sensor values, shape (machines, sensors)
+        `failure_time`: Time counter of the active failure per machine, -1 if none
+        `failure_duration`: Duration of the active failure per machine
+        `health_service`: Optional health service for monitoring and metrics
+    """
+
+    def __init__(
+        self,
+        sensor_stats: dict[str, dict[str, Any]],
+        failure_patterns: dict[Any, dict[str, dict[str, Any]]],
+        num_machines: int,
+        num_sensors: int,
+        health_service: HealthService | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialise the fleet with random starting values.
+
+        Args:
+            `sensor_stats`: Statistical properties of each sensor during normal operation
+            `failure_patterns`: Patterns of sensor behaviour during different failure types
+            `num_machines`: Number of machines to simulate
+            `num_sensors`: Number of sensors per machine
+            `health_service`: Optional health service for monitoring and metrics
+            `seed`: Optional seed for the random number generator
+
+        Returns:
+            `None`
+        """
+        self.rng = np.random.default_rng(seed)
+        self.health_service = health_service
+
+        self.machine_ids = [str(uuid4())[:8] for _ in range(num_machines)]
+        self.sensor_names = [f"Sensor {i}" for i in range(1, num_sensors + 1)]
+
+        default_stats = {"mean": 0, "std": 1, "min": -1, "max": 1}
+        stats = [sensor_stats.get(col, default_stats) for col in self.sensor_names]
+        self.mean = np.array([s["mean"] for s in stats], dtype=np.float64)
+        self.std = np.array([s["std"] for s in stats], dtype=np.float64)
+        self.drift = self.std * 0.1
+        self.upper = np.array([s["max"] for s in stats], dtype=np.float64) * 1.2
+        self.lower = np.array([s["min"] for s in stats], dtype=np.float64) * 1.2
+
+        patterns = list(failure_patterns.values())
+        shape = (len(patterns), num_sensors)
+        self.pattern_mean = np.zeros(shape, dtype=np.float64)
+        self.pattern_std = np.zeros(shape, dtype=np.float64)
+        self.pattern_mask = np.zeros(shape, dtype=bool)
+        for p, pattern in enumerate(patterns):
+            for s, col in enumerate(self.sensor_names):
+                if col in pattern:
+                    self.pattern_mean[p, s] = pattern[col]["mean"]
+                    self.pattern_std[p, s] = pattern[col]["std"]
+                    self.pattern_mask[p, s] = True
+
+        self.values = self.mean + self.std * self.rng.standard_normal(
+            (num_machines, num_sensors)
+        )
+        self.failure_time = np.full(num_machines, -1, dtype=np.int64)
+        self.failure_duration = np.zeros(num_machines, dtype=np.int64)
+
+    @property
+    def num_machines(self) -> int:
+        """Number of machines in the fleet."""
+        return len(self.machine_ids)
+
+    def step(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Advance every machine in the fleet by one time step.
+
+        Applies random drift, mean-reversion and clamping to the whole state
+        array, blends the readings of failing machines towards a randomly
+        chosen failure pattern, and then progresses, resolves and randomly
+        starts failures.
+
+        Returns:
+            `tuple[np.ndarray, np.ndarray]`: Rounded readings with shape
+                (machines, sensors) and a boolean array flagging machines
+                that had an active failure at the start of the step
+        """
+        has_failure = self.failure_time >= 0
+
+        values = self.values + self.drift * self.rng.standard_normal(self.values.shape)
+        values += 0.05 * (self.mean - values)
+        values = np.maximum(np.minimum(values, self.upper), self.lower)
+        self.values = values
+
+        readings = values.copy()
+        failing = np.flatnonzero(has_failure)
+        if failing.size and len(self.pattern_mean):
+            pattern_idx = self.rng.integers(0, len(self.pattern_mean), size=failing.size)
+            progress = np.minimum(1.0, self.failure_time[failing] / 10)[:, None]
+            failure_values = self.pattern_mean[pattern_idx] + self.pattern_std[
+                pattern_idx
+            ] * self.rng.standard_normal((failing.size, values.shape[1]))
+            blended = readings[failing] * (1 - progress) + failure_values * progress
+            readings[failing] = np.where(
+                self.pattern_mask[pattern_idx], blended, readings[failing]
+            )
+
+        self._advance_failures(failing, np.flatnonzero(~has_failure))
+
+        return np.round(readings, 6), has_failure
+
+    def _advance_failures(self, failing: np.ndarray, idle: np.ndarray) -> None:
+        """Progress active failures, resolve expired ones and start new ones."""
+        self.failure_time[failing] += 1
+        resolved = failing[self.failure_time[failing] >= self.failure_duration[failing]]
+        self.failure_time[resolved] = -1
+
+        started = idle[self.rng.random(idle.size) < 0.05]
+        self.failure_time[started] = 0
+        self.failure_duration[started] = self.rng.integers(30, 61, size=started.size)
+
+        if resolved.size:
+            logger.info(f"Failure resolved on {resolved.size} machine(s)")
+
+        if started.size:
+            logger.info(f"Failure started on {started.size} machine(s)")
+
+        if self.health_service and (resolved.size or started.size):
+            if started.size:
+                self.health_service.increment_failure_events(int(started.size))
+            active = int(np.count_nonzero(self.failure_time >= 0))
+            self.health_service.set_active_failures(active)
+
+    def to_sensor_data(
+        self, readings: np.ndarray, has_failure: np.ndarray
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Convert the arrays returned by `step` into per-machine sensor data.
+
+        Args:
+            `readings`: Rounded readings with shape (machines, sensors)
+            `has_failure`: Boolean failure flags with shape (machines,)
+
+        Returns:
+            `list[tuple[str, dict[str, Any]]]`: (machine_id, sensor_data) pairs
+                where sensor_data has the same format as the output of
+                `SensorDataProducer.update_sensor_values`
+        """
+        names = self.sensor_names
+        return [
+            (
+                machine_id,
+                {"readings": dict(zip(names, row)), "has_failure": flag},
+            )
+            for machine_id, row, flag in zip(
+                self.machine_ids, readings.tolist(), has_failure.tolist()
+            )
+        ]
@@ -14,6 +14,10 @@ from producer.utils.metrics import (
     FAILURE_EVENTS,
     ACTIVE_FAILURES,
     MESSAGE_SEND_ERRORS,
+    TICK_LATENESS,
+    TICK_PERIOD,
+    TICK_RATE,
+    TICKS_SKIPPED,
 )
 
 from producer.utils import start_health_server
@@ -32,6 +36,10 @@ class HealthService:
         `failure_events`: Counter for tracking total number of simulated failures
         `active_failures`: Gauge for tracking number of currently active failures
         `message_errors`: Counter for tracking message send errors
+        `tick_lateness`: Histogram of simulation tick lateness
+        `tick_period`: Histogram of achieved simulation tick periods
+        `tick_rate`: Gauge for the achieved simulation tick rate
+        `ticks_skipped`: Counter for ticks dropped while behind schedule
         `start_time`: Time when the service was initialized
     """
     
@@ -49,6 +57,10 @@ class HealthService:
         self.failure_events = FAILURE_EVENTS
         self.active_failures = ACTIVE_FAILURES
         self.message_errors = MESSAGE_SEND_ERRORS
+        self.tick_lateness = TICK_LATENESS
+        self.tick_period = TICK_PERIOD
+        self.tick_rate = TICK_RATE
+        self.ticks_skipped = TICKS_SKIPPED
         self.start_time = time.time()
         
         try:
@@ -123,6 +135,54 @@ class HealthService:
         if seconds > 0.5:
             logger.warning(f"Slow message processing: {seconds:.3f}s")
     
+    def observe_tick_lateness(self, seconds: float) -> None:
+        """
+        Record how late a simulation tick started relative to its deadline.
+        
+        Args:
+            `seconds`: Lateness in seconds
+            
+        Returns:
+            `None`
+        """
+        self.tick_lateness.observe(max(seconds, 0.0))
+    
+    def observe_tick_period(self, seconds: float) -> None:
+        """
+        Record the achieved time between two consecutive simulation ticks.
+        
+        Args:
+            `seconds`: Period in seconds
+            
+        Returns:
+            `None`
+        """
+        self.tick_period.observe(seconds)
+    
+    def set_tick_rate(self, rate: float) -> None:
+        """
+        Set the achieved simulation tick rate.
+        
+        Args:
+            `rate`: Ticks per second
+            
+        Returns:
+            `None`
+        """
+        self.tick_rate.set(rate)
+    
+    def increment_ticks_skipped(self, count: int = 1) -> None:
+        """
+        Increment the count of simulation ticks dropped while behind schedule.
+        
+        Args:
+            `count`: Number of skipped ticks to add to the counter. Defaults to 1.
+            
+        Returns:
+            `None`
+        """
+        self.ticks_skipped.inc(count)
+    
     def get_uptime_seconds(self) -> float:
         """
         Get the service uptime in seconds.
@@ -0,0 +1,358 @@
+"""
+Asyncio producer pipeline for the Sensor Data Producer Service.
+
+This module provides an asynchronous variant of the sensor data producer
+built on the `azure.eventhub.aio` client. Simulation, serialisation and
+sending run as separate stages connected by bounded queues, so that the
+latency of sending to Event Hubs does not delay the simulation cadence.
+Several batches can be in flight per partition at the same time.
+"""
+
+import asyncio
+import time
+import zlib
+from datetime import datetime
+from typing import Any
+
+from azure.eventhub import EventData
+from azure.eventhub.aio import EventHubProducerClient
+from azure.identity.aio import DefaultAzureCredential
+from loguru import logger
+
+from producer.config import config
+from producer.services.producer import SensorDataProducer
+
+# Seconds to wait before retrying after a batch could not be created
+CREATE_BATCH_RETRY_DELAY = 1.0
+
+
+class AsyncSensorDataProducer(SensorDataProducer):
+    """
+    Sensor data producer running an asyncio simulate/serialise/send pipeline.
+
+    Reuses the simulation logic of `SensorDataProducer` and replaces the
+    synchronous publish loop with three stages:
+    - simulation, which advances the machines on a fixed schedule
+    - serialisation, which encodes readings and routes them to a partition
+    - sending, with `max_inflight_sends` concurrent senders per partition
+
+    Stages are connected by `asyncio.Queue` instances bounded by
+    `queue_size`, which applies back-pressure to the simulation when
+    sending cannot keep up. On shutdown the simulation stops first, and the
+    readings already queued are serialised and sent before the client is
+    closed, for at most `drain_timeout` seconds.
+
+    Attributes:
+        `producer_client`: Asynchronous EventHubProducerClient instance
+        `queue_size`: Maximum number of items in each stage queue
+        `max_inflight_sends`: Number of concurrent senders per partition
+        `drain_timeout`: Seconds allowed for sending queued readings on shutdown
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the producer and the pipeline settings.
+
+        Returns:
+            `None`
+        """
+        super().__init__()
+        self.queue_size = config.pipeline_queue_size
+        self.max_inflight_sends = config.max_inflight_sends
+        self.drain_timeout = config.pipeline_drain_timeout_ms / 1000
+
+    def create_producer_client(self) -> EventHubProducerClient:  # type: ignore[override]
+        """
+        Create the asynchronous Event Hubs client used to publish messages.
+
+        Returns:
+            `EventHubProducerClient`: Asynchronous client authenticated with
+                the default Azure credential chain
+        """
+        self.credential = DefaultAzureCredential()
+        return EventHubProducerClient(
+            fully_qualified_namespace=config.eventhub_namespace,
+            eventhub_name=config.eventhub_name,
+            credential=self.credential,
+        )
+
+    def create_sender(self) -> None:  # type: ignore[override]
+        """
+        Skip the synchronous sender, since `send_stage` packs its own batches.
+
+        Returns:
+            `None`
+        """
+        return None
+
+    async def simulate_stage(
+        self, ticks: asyncio.Queue[tuple[str, list[tuple[str, dict[str, Any]]]]]
+    ) -> None:
+        """
+        Advance the simulation at a fixed rate and queue each tick's readings.
+
+        Ticks are paced by the producer's `TickScheduler`, so the time spent
+        simulating or waiting on a full queue does not add to the configured
+        interval.
+
+        Args:
+            `ticks`: Queue receiving the readings of each tick
+
+        Returns:
+            `None`
+        """
+        while True:
+            await self.scheduler.wait_async()
+            timestamp = datetime.now().isoformat()
+            await ticks.put((timestamp, self.simulate_tick()))
+
+    async def serialize_stage(
+        self,
+        ticks: asyncio.Queue[tuple[str, list[tuple[str, dict[str, Any]]]]],
+        partitions: dict[str, asyncio.Queue[EventData]],
+    ) -> None:
+        """
+        Serialise queued readings and route them to per-partition send queues.
+
+        Individual readings are routed by machine so that all messages of
+        one machine go to the same partition. Micro-batches, which contain
+        every machine, are distributed round-robin across partitions.
+
+        Args:
+            `ticks`: Queue of readings produced by the simulation stage
+            `partitions`: Send queue for each partition ID
+
+        Returns:
+            `None`
+        """
+        partition_ids = list(partitions)
+        batches_sent = 0
+
+        while True:
+            timestamp, machine_data = await ticks.get()
+
+            if self.batch_builder is not None:
+                for batch in self.batch_builder.add_tick(timestamp, machine_data):
+                    try:
+                        event = self.serialize_batch_message(batch)
+
+                    except Exception as err:
+                        logger.error(f"Error serialising micro-batch: {str(err)}")
+                        if self.health_service:
+                            self.health_service.increment_message_errors()
+
+                    else:
+                        index = batches_sent % len(partition_ids)
+                        await partitions[partition_ids[index]].put(event)
+                        batches_sent += 1
+
+                ticks.task_done()
+                continue
+
+            for machine_id, sensor_data in machine_data:
+                try:
+                    event = self.serialize_sensor_data(machine_id, sensor_data, timestamp)
+
+                except Exception as err:
+                    logger.error(f"Error serialising message: {str(err)}")
+                    if self.health_service:
+                        self.health_service.increment_message_errors()
+                    continue
+
+                index = zlib.crc32(machine_id.encode("utf-8")) % len(partition_ids)
+                await partitions[partition_ids[index]].put(event)
+
+            ticks.task_done()
+
+    async def send_stage(self, partition_id: str, events: asyncio.Queue[EventData]) -> None:
+        """
+        Pack queued events into batches and send them to one partition.
+
+        Waits for at least one event, then drains whatever else is already
+        queued into the same batch. An event that does not fit is carried
+        over into the next batch, as is the first event when a batch cannot
+        be created, which is retried after `CREATE_BATCH_RETRY_DELAY`.
+
+        Args:
+            `partition_id`: Partition to send batches to
+            `events`: Queue of events routed to the partition
+
+        Returns:
+            `None`
+        """
+        carry: EventData | None = None
+
+        while True:
+            event = carry if carry is not None else await events.get()
+            carry = None
+            start_time = time.time()
+
+            try:
+                batch = await self.producer_client.create_batch(partition_id=partition_id)
+
+            except Exception as err:
+                logger.error(f"Error creating batch for partition {partition_id}: {str(err)}")
+                if self.health_service:
+                    self.health_service.increment_message_errors()
+                carry = event
+                await asyncio.sleep(CREATE_BATCH_RETRY_DELAY)
+                continue
+
+            try:
+                batch.add(event)
+
+            except ValueError as err:
+                logger.error(f"Event too large for an empty batch: {str(err)}")
+                if self.health_service:
+                    self.health_service.increment_message_errors()
+                events.task_done()
+                continue
+
+            count = 1
+
+            while not events.empty():
+                event = events.get_nowait()
+                try:
+                    batch.add(event)
+                    count += 1
+
+                except ValueError:
+                    carry = event
+                    break
+
+            try:
+                await self.producer_client.send_batch(batch)
+
+            except Exception as err:
+                logger.error(f"Error sending batch of {count} events: {str(err)}")
+                if self.health_service:
+                    self.health_service.increment_message_errors(count)
+
+            else:
+                if self.health_service:
+                    self.health_service.increment_messages_sent(count)
+                    self.health_service.observe_processing_time(time.time() - start_time)
+
+            for _ in range(count):
+                events.task_done()
+
+    async def run_pipeline(self) -> None:
+        """
+        Start all pipeline stages and run them until cancelled.
+
+        Returns:
+            `None`
+        """
+        partition_ids = await self.producer_client.get_partition_ids()
+        logger.info(
+            f"Starting async pipeline on {len(partition_ids)} partitions "
+            f"with {self.max_inflight_sends} in-flight sends per partition"
+        )
+
+        ticks: asyncio.Queue[tuple[str, list[tuple[str, dict[str, Any]]]]] = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+        partitions: dict[str, asyncio.Queue[EventData]] = {
+            partition_id: asyncio.Queue(maxsize=self.queue_size)
+            for partition_id in partition_ids
+        }
+
+        simulate = asyncio.create_task(self.simulate_stage(ticks))
+        serialize = asyncio.create_task(self.serialize_stage(ticks, partitions))
+        tasks = [simulate, serialize]
+        for partition_id, events in partitions.items():
+            tasks.extend(
+                asyncio.create_task(self.send_stage(partition_id, events))
+                for _ in range(self.max_inflight_sends)
+            )
+
+        try:
+            # Unlike gather, wait leaves the stages running when cancelled
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+
+        finally:
+            simulate.cancel()
+            await asyncio.gather(simulate, return_exceptions=True)
+
+            try:
+                await asyncio.wait_for(
+                    self.drain(ticks, partitions, serialize), self.drain_timeout
+                )
+
+            except asyncio.TimeoutError:
+                pending = ticks.qsize() + sum(events.qsize() for events in partitions.values())
+                logger.warning(f"Pipeline not drained after {self.drain_timeout}s, dropping {pending} queued items")
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def drain(
+        self,
+        ticks: asyncio.Queue[tuple[str, list[tuple[str, dict[str, Any]]]]],
+        partitions: dict[str, asyncio.Queue[EventData]],
+        serialize: asyncio.Task[None],
+    ) -> None:
+        """
+        Serialise and send everything queued once the simulation has stopped.
+
+        Waits for the serialisation stage to empty the tick queue, queues the
+        incomplete micro-batch, if any, and waits for the send stages to empty
+        every partition queue.
+
+        Args:
+            `ticks`: Queue of readings produced by the simulation stage
+            `partitions`: Send queue for each partition ID
+            `serialize`: Task running the serialisation stage
+
+        Returns:
+            `None`
+        """
+        logger.info("Draining pipeline queues")
+        if not serialize.done():
+            await ticks.join()
+        serialize.cancel()
+
+        if self.batch_builder is not None:
+            batch = self.batch_builder.build()
+            if batch is not None:
+                try:
+                    event = self.serialize_batch_message(batch)
+
+                except Exception as err:
+                    logger.error(f"Error serialising micro-batch: {str(err)}")
+                    if self.health_service:
+                        self.health_service.increment_message_errors()
+
+                else:
+                    await next(iter(partitions.values())).put(event)
+
+        for events in partitions.values():
+            await events.join()
+
+    async def _produce(self) -> None:
+        """Run the pipeline and close the Event Hubs client afterwards."""
+        try:
+            await self.run_pipeline()
+
+        finally:
+            logger.info("Closing producer client")
+            await self.producer_client.close()
+            await self.credential.close()
+            logger.info("Producer client closed")
+
+    def produce_messages(self) -> None:
+        """
+        Continuously produce and publish sensor messages using the async pipeline.
+        """
+        try:
+            asyncio.run(self._produce())
+
+        except KeyboardInterrupt:
+            logger.info("Producer stopped by user")
+
+        except Exception as err:
+            logger.error(f"Error in producer: {str(err)}")
+            logger.exception("Detailed exception information:")
@@ -7,7 +7,6 @@ Event Hubs. It simulates both normal machine operation and failure conditions
 based on statistical models derived from reference data.
 """
 
-import json
 import random
 import time
 from datetime import datetime
@@ -19,10 +18,17 @@ from azure.identity import DefaultAzureCredential
 from loguru import logger
 
 from producer.config import config
-from producer.models import FailureInfo, SensorMessage, SensorReading
+from producer.models import FailureInfo, SensorBatchMessage
+from producer.services.batching import (
+    DEFAULT_MAX_BATCH_BYTES,
+    BatchingSender,
+    MicroBatchBuilder,
+)
+from producer.services.fleet import FleetSimulator
 from producer.services.health import HealthService
+from producer.services.scheduler import TickScheduler
 from producer.services.storage import StorageService
-from producer.utils import analyse_dataset
+from producer.utils import analyse_dataset, get_serializer
 
 
 class SensorDataProducer:
@@ -42,9 +48,16 @@ class SensorDataProducer:
         `sensor_stats`: Statistical properties of each sensor during normal operation
         `failure_patterns`: Patterns of sensor behavior during different failure types
         `producer_client`: EventHubProducerClient instance for publishing messages
+        `sender`: Batching sender that packs messages into Event Hub batches
+        `scheduler`: Fixed-rate scheduler pacing the simulation ticks
+        `serializer`: Encoder turning readings into message bodies
+        `batch_builder`: Optional builder collecting ticks into columnar
+            micro-batch messages
         `machine_id`: Unique identifier for the simulated machine
         `machine`: Current state of the simulated machine
         `health_service`: Optional health service for monitoring and metrics
+        `fleet`: Vectorised fleet simulator, used instead of `machine` when
+            more than one machine is configured
     """
 
     def __init__(self) -> None:
@@ -88,11 +101,8 @@ class SensorDataProducer:
         except Exception as err:
             logger.error(f"Failed to read or analyse data file: {err}")
             
-        self.producer_client = EventHubProducerClient(
-            fully_qualified_namespace=config.eventhub_namespace,
-            eventhub_name=config.eventhub_name,
-            credential=DefaultAzureCredential(),
-        )
+        self.producer_client = self.create_producer_client()
+        self.serializer = get_serializer(config.message_serializer)
 
         self.machine_id = str(uuid4())[:8]
         self.machine: dict[str, Any] = {
@@ -104,9 +114,63 @@ class SensorDataProducer:
 
         self.health_service = HealthService()
 
-        logger.info("Producer initialised with 1 machine")
+        self.sender = self.create_sender()
+
+        self.fleet: FleetSimulator | None = None
+        if config.num_machines > 1:
+            self.fleet = FleetSimulator(
+                self.sensor_stats,
+                self.failure_patterns,
+                num_machines=config.num_machines,
+                num_sensors=config.num_sensors,
+                health_service=self.health_service,
+            )
+
+        self.batch_builder: MicroBatchBuilder | None = None
+        if config.micro_batch_ticks > 0:
+            self.batch_builder = MicroBatchBuilder(
+                config.micro_batch_ticks,
+                max_size_in_bytes=config.batch_max_size_bytes or DEFAULT_MAX_BATCH_BYTES,
+                bytes_per_value=self.serializer.batch_value_size,
+            )
+
+        self.scheduler = TickScheduler(
+            config.simulation_interval_ms / 1000,
+            policy=config.tick_policy,
+            health_service=self.health_service,
+        )
+
+        logger.info(f"Producer initialised with {config.num_machines} machine(s)")
         logger.info(f"Connected to Event Hub: {config.eventhub_name}")
 
+    def create_producer_client(self) -> EventHubProducerClient:
+        """
+        Create the Event Hubs client used to publish messages.
+
+        Returns:
+            `EventHubProducerClient`: Client authenticated with the default
+                Azure credential chain
+        """
+        return EventHubProducerClient(
+            fully_qualified_namespace=config.eventhub_namespace,
+            eventhub_name=config.eventhub_name,
+            credential=DefaultAzureCredential(),
+        )
+
+    def create_sender(self) -> BatchingSender:
+        """
+        Create the sender that packs events into Event Hub batches.
+
+        Returns:
+            `BatchingSender`: Sender publishing through the producer client
+        """
+        return BatchingSender(
+            self.producer_client,
+            linger_ms=config.batch_linger_ms,
+            max_size_in_bytes=config.batch_max_size_bytes or None,
+            health_service=self.health_service,
+        )
+
     def check_health(self) -> bool:
         """
         Check the health of the producer service.
@@ -214,6 +278,113 @@ class SensorDataProducer:
 
         return {"readings": readings, "has_failure": has_failure}
 
+    def simulate_tick(self) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Advance the simulation by one time step for every simulated machine.
+
+        Uses the vectorised fleet simulator when more than one machine is
+        configured, and the per-machine logic otherwise.
+
+        Returns:
+            `list[tuple[str, dict[str, Any]]]`: (machine_id, sensor_data) pairs
+                where sensor_data is in the format returned by
+                `update_sensor_values`
+        """
+        if self.fleet is not None:
+            readings, has_failure = self.fleet.step()
+            return self.fleet.to_sensor_data(readings, has_failure)
+
+        return [(self.machine_id, self.update_sensor_values())]
+
+    def serialize_sensor_data(
+        self, machine_id: str, sensor_data: dict[str, Any], timestamp: str
+    ) -> EventData:
+        """
+        Serialise a single machine reading into an event.
+
+        Args:
+            `machine_id`: Identifier of the machine that produced the reading
+            `sensor_data`: Readings and failure indicator for the machine
+            `timestamp`: ISO format timestamp of when the reading was taken
+
+        Returns:
+            `EventData`: Event whose body is encoded by the configured serializer
+        """
+        body = self.serializer.serialize(
+            machine_id,
+            sensor_data["readings"],
+            sensor_data["has_failure"],
+            timestamp,
+        )
+
+        event = EventData(body)
+        event.content_type = self.serializer.content_type
+        event.properties = {"encoding": self.serializer.name}
+        return event
+
+    def serialize_batch_message(self, batch: SensorBatchMessage) -> EventData:
+        """
+        Serialise a columnar micro-batch into an event.
+
+        Args:
+            `batch`: Micro-batch of readings
+
+        Returns:
+            `EventData`: Event whose body is encoded by the configured serializer
+        """
+        event = EventData(self.serializer.serialize_batch(batch))
+        event.content_type = self.serializer.batch_content_type
+        event.properties = {"encoding": self.serializer.name, "readings": len(batch)}
+        return event
+
+    def send_batch_message(self, batch: SensorBatchMessage) -> None:
+        """
+        Serialise a columnar micro-batch and queue it for publishing.
+
+        Args:
+            `batch`: Micro-batch of readings
+
+        Returns:
+            `None`
+        """
+        try:
+            self.sender.add(self.serialize_batch_message(batch))
+
+        except Exception as err:
+            logger.error(f"Error queueing micro-batch of {len(batch)} readings: {str(err)}")
+            logger.exception("Detailed exception information:")
+            if self.health_service:
+                self.health_service.increment_message_errors()
+
+    def send_sensor_data(self, machine_id: str, sensor_data: dict[str, Any]) -> None:
+        """
+        Serialise a single machine reading and queue it for publishing.
+
+        The message is added to the current Event Hub batch, which is sent
+        once it is full or its linger time has expired.
+
+        Args:
+            `machine_id`: Identifier of the machine that produced the reading
+            `sensor_data`: Readings and failure indicator for the machine
+
+        Returns:
+            `None`
+        """
+        try:
+            event = self.serialize_sensor_data(
+                machine_id, sensor_data, datetime.now().isoformat()
+            )
+            self.sender.add(event)
+
+        except Exception as err:
+            logger.error(f"Error queueing message: {str(err)}")
+            logger.exception("Detailed exception information:")
+            if self.health_service:
+                self.health_service.increment_message_errors()
+
+        if sensor_data["has_failure"]:
+            logger.debug("Queued message with failure indication")
+
     def produce_messages(self) -> None:
         """
         Continuously produce and publish sensor messages to Azure Event Hubs.
@@ -221,58 +392,25 @@ class SensorDataProducer:
         try:
             logger.info("Starting produce_messages loop")
             while True:
+                self.scheduler.wait()
                 start_time = time.time()
                 logger.debug("Updating sensor values")
-                sensor_data = self.update_sensor_values()
-                logger.debug(f"Sensor values updated, has_failure={sensor_data['has_failure']}")
-                
-                sensor_reading = SensorReading(
-                    readings=sensor_data["readings"],
-                    has_failure=sensor_data["has_failure"],
-                )
-
-                message = SensorMessage(
-                    machine_id=self.machine_id,
-                    timestamp=datetime.now().isoformat(),
-                    readings=sensor_reading,
-                )
-                
-                logger.debug("Preparing to create EventHub batch")
-                try:
-                    logger.debug("Creating event data batch")
-                    event_data_batch = self.producer_client.create_batch()
-                    logger.debug("Batch created successfully")
-                    
-                    serialized_message = json.dumps(message.model_dump()).encode("utf-8")
-                    logger.debug(f"Message serialized, size={len(serialized_message)} bytes")
-                    
-                    logger.debug("Adding event to batch")
-                    event_data_batch.add(EventData(serialized_message))
-                    logger.debug("Event added to batch successfully")
-
-                    logger.debug("Sending batch to Event Hub")
-                    self.producer_client.send_batch(event_data_batch)
-                    logger.debug("Batch sent successfully")
-
-                    if self.health_service:
-                        self.health_service.increment_messages_sent()
-                        processing_time = time.time() - start_time
-                        self.health_service.observe_processing_time(processing_time)
-                        logger.debug(f"Processing time observed: {processing_time:.4f}s")
-
-                except Exception as err:
-                    logger.error(f"Error sending message: {str(err)}")
-                    logger.exception("Detailed exception information:")
-                    if self.health_service:
-                        self.health_service.increment_message_errors()
-
-                if sensor_data["has_failure"]:
-                    logger.debug("Sent message with failure indication")
-
-                sleep_time = config.simulation_interval_ms / 1000
-                logger.debug(f"Sleeping for {sleep_time} seconds")
-                time.sleep(sleep_time)
-                logger.debug("Woke up from sleep, starting next iteration")
+                machine_data = self.simulate_tick()
+                if self.batch_builder is not None:
+                    for batch in self.batch_builder.add_tick(
+                        datetime.now().isoformat(), machine_data
+                    ):
+                        self.send_batch_message(batch)
+
+                else:
+                    for machine_id, sensor_data in machine_data:
+                        self.send_sensor_data(machine_id, sensor_data)
+
+                sent = self.sender.flush_if_due()
+                if sent and self.health_service:
+                    processing_time = time.time() - start_time
+                    self.health_service.observe_processing_time(processing_time)
+                    logger.debug(f"Processing time observed: {processing_time:.4f}s")
 
         except KeyboardInterrupt:
             logger.info("Producer stopped by user")
@@ -282,6 +420,12 @@ class SensorDataProducer:
             logger.exception("Detailed exception information:")
 
         finally:
+            logger.info("Flushing pending messages")
+            if self.batch_builder is not None:
+                batch = self.batch_builder.build()
+                if batch is not None:
+                    self.send_batch_message(batch)
+            self.sender.close()
             logger.info("Closing producer client")
             self.producer_client.close()
             logger.info("Producer client closed")
@@ -0,0 +1,139 @@
+"""
+Fixed-rate tick scheduler for the Sensor Data Producer Service.
+
+This module provides a scheduler that paces the simulation loop against
+absolute deadlines on `time.monotonic()`. Unlike sleeping for a fixed
+interval after each iteration, the time spent simulating and sending does
+not add to the period, so the achieved tick rate matches the configured one.
+"""
+
+import asyncio
+import time
+
+from producer.services.health import HealthService
+
+CATCH_UP = "catch_up"
+SKIP = "skip"
+
+
+class TickScheduler:
+    """
+    Scheduler that releases ticks at a fixed rate on a monotonic clock.
+
+    Each tick has an absolute deadline `start + n * interval`. When the loop
+    falls behind by more than one interval, the scheduler either runs the
+    missed ticks back-to-back until it has caught up (`catch_up`) or drops
+    them and realigns to the next deadline in the future (`skip`).
+
+    Attributes:
+        `interval`: Target period between ticks in seconds
+        `policy`: Behaviour when behind schedule, `catch_up` or `skip`
+        `health_service`: Optional health service for monitoring and metrics
+        `ticks`: Number of ticks released so far
+        `skipped`: Number of ticks dropped by the `skip` policy
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        policy: str = CATCH_UP,
+        health_service: HealthService | None = None,
+        rate_window: float = 1.0,
+    ) -> None:
+        """
+        Initialise the scheduler. The first tick is released immediately.
+
+        Args:
+            `interval`: Target period between ticks in seconds
+            `policy`: Behaviour when behind schedule, `catch_up` or `skip`
+            `health_service`: Optional health service for monitoring and metrics
+            `rate_window`: Window in seconds over which the achieved rate is measured
+
+        Returns:
+            `None`
+
+        Raises:
+            `ValueError`: If the interval is not positive or the policy is unknown
+        """
+        if interval <= 0:
+            raise ValueError(f"Tick interval must be positive, got {interval}")
+
+        if policy not in (CATCH_UP, SKIP):
+            raise ValueError(f"Unknown tick policy '{policy}'")
+
+        self.interval = interval
+        self.policy = policy
+        self.health_service = health_service
+        self.rate_window = rate_window
+
+        self.ticks = 0
+        self.skipped = 0
+        self._deadline: float | None = None
+        self._last_tick: float | None = None
+        self._window_start: float | None = None
+        self._window_ticks = 0
+
+    def _next_delay(self) -> float:
+        """Advance to the next deadline and return how long to wait for it."""
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now
+            return 0.0
+
+        self._deadline += self.interval
+        behind = now - self._deadline
+        if self.policy == SKIP and behind >= self.interval:
+            # Drop every deadline already passed and wait for the first future one
+            missed = int(behind // self.interval) + 1
+            self._deadline += missed * self.interval
+            self.skipped += missed
+            if self.health_service:
+                self.health_service.increment_ticks_skipped(missed)
+
+        return max(self._deadline - now, 0.0)
+
+    def _record_tick(self) -> None:
+        """Record lateness, period and achieved rate for the released tick."""
+        now = time.monotonic()
+        self.ticks += 1
+
+        if self._window_start is None:
+            self._window_start = now
+
+        self._window_ticks += 1
+        elapsed = now - self._window_start
+        if elapsed >= self.rate_window:
+            if self.health_service:
+                self.health_service.set_tick_rate(self._window_ticks / elapsed)
+            self._window_start = now
+            self._window_ticks = 0
+
+        if self.health_service and self._deadline is not None:
+            self.health_service.observe_tick_lateness(now - self._deadline)
+            if self._last_tick is not None:
+                self.health_service.observe_tick_period(now - self._last_tick)
+
+        self._last_tick = now
+
+    def wait(self) -> None:
+        """
+        Block until the next tick is due.
+
+        Returns:
+            `None`
+        """
+        delay = self._next_delay()
+        if delay > 0:
+            time.sleep(delay)
+        self._record_tick()
+
+    async def wait_async(self) -> None:
+        """
+        Suspend the current coroutine until the next tick is due.
+
+        Returns:
+            `None`
+        """
+        delay = self._next_delay()
+        await asyncio.sleep(delay)
+        self._record_tick()
@@ -29,7 +29,7 @@ class HealthHandler(BaseHTTPRequestHandler):
         `server_service`: Reference to the server service that created this handler
     """
     
-    server_service: ClassVar['ServerService' | None] = None
+    server_service: ClassVar['ServerService | None'] = None
     
     def do_GET(self) -> None:
         """
@@ -114,7 +114,7 @@ class ServerService:
     """
     
     # Global singleton instance
-    _instance: 'ServerService' | None = None
+    _instance: 'ServerService | None' = None
     _instance_lock = threading.Lock()
     
     @classmethod
@@ -13,6 +13,19 @@ from .analysis import (
     get_default_failure_patterns,
     get_default_sensor_statistics,
 )
+from .serialization import (
+    Binary32Serializer,
+    BinarySerializer,
+    MessageSerializer,
+    ModelJsonSerializer,
+    PydanticJsonSerializer,
+    TemplateSerializer,
+    decode_batch_message,
+    decode_binary_batch,
+    decode_binary_message,
+    decode_message,
+    get_serializer,
+)
 from .server import start_health_server
 
 __all__ = [
@@ -22,4 +35,15 @@ __all__ = [
     "get_default_failure_patterns",
     "analyse_dataset",
     "start_health_server",
+    "MessageSerializer",
+    "ModelJsonSerializer",
+    "PydanticJsonSerializer",
+    "TemplateSerializer",
+    "BinarySerializer",
+    "Binary32Serializer",
+    "get_serializer",
+    "decode_message",
+    "decode_binary_message",
+    "decode_batch_message",
+    "decode_binary_batch",
 ]
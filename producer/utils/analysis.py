@@ -19,8 +19,9 @@ def calculate_sensor_statistics(df: pl.DataFrame) -> dict[str, dict[str, float]]
 
     Analyses the provided DataFrame to extract statistical properties
     (mean, standard deviation, minimum, maximum) for each sensor column.
-    These statistics are used to generate realistic sensor values
-    during simulation.
+    These statistics are used to generate realistic sensor values during
+    simulation. All columns are aggregated in a single lazy query, so the
+    data is scanned once.
 
     Args:
         df (`pl.DataFrame`): Polars DataFrame containing sensor data
@@ -29,27 +30,27 @@ def calculate_sensor_statistics(df: pl.DataFrame) -> dict[str, dict[str, float]]
         `dict`: Dictionary of sensor statistics with structure
             {sensor_name: {mean, std, min, max}}
     """
-    sensor_stats = {}
     sensor_cols = [col for col in df.columns if col.startswith("Sensor")]
+    if not sensor_cols:
+        return {}
+
+    stat_names = ["mean", "std", "min", "max"]
 
+    exprs = []
     for col in sensor_cols:
-        stats = df.select(
-            [
-                pl.col(col).mean().alias("mean"),
-                pl.col(col).std().alias("std"),
-                pl.col(col).min().alias("min"),
-                pl.col(col).max().alias("max"),
-            ]
-        ).row(0)
-
-        sensor_stats[col] = {
-            "mean": float(stats[0]),
-            "std": float(stats[1]),
-            "min": float(stats[2]),
-            "max": float(stats[3]),
-        }
+        exprs += [
+            pl.col(col).mean().alias(f"{col}::mean"),
+            pl.col(col).std().alias(f"{col}::std"),
+            pl.col(col).min().alias(f"{col}::min"),
+            pl.col(col).max().alias(f"{col}::max"),
+        ]
 
-    return sensor_stats
+    row = df.lazy().select(exprs).collect().row(0, named=True)
+
+    return {
+        col: {name: float(row[f"{col}::{name}"]) for name in stat_names}
+        for col in sensor_cols
+    }
 
 
 def analyse_failure_patterns(
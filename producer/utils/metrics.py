@@ -34,6 +34,28 @@ PROCESSING_TIME = Histogram(
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5]
 )
 
+TICK_LATENESS = Histogram(
+    'sensor_producer_tick_lateness_seconds',
+    'Delay between the scheduled deadline of a simulation tick and its start',
+    buckets=[0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0]
+)
+
+TICK_PERIOD = Histogram(
+    'sensor_producer_tick_period_seconds',
+    'Achieved time between the starts of consecutive simulation ticks',
+    buckets=[0.0005, 0.001, 0.002, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0]
+)
+
+TICK_RATE = Gauge(
+    'sensor_producer_tick_rate_hz',
+    'Achieved simulation tick rate in ticks per second'
+)
+
+TICKS_SKIPPED = Counter(
+    'sensor_producer_ticks_skipped_total',
+    'Total number of simulation ticks dropped while behind schedule'
+)
+
 MEMORY_USAGE = Gauge(
     'sensor_producer_memory_bytes',
     'Memory usage of the producer service in bytes'
@@ -0,0 +1,523 @@
+"""
+Message serialisation utilities for the Sensor Data Producer Service.
+
+This module provides interchangeable serialisers that turn a machine
+reading into the body of an Event Hub message. The default serialiser
+builds the `SensorMessage` model and encodes it with `json.dumps`, while
+the faster variants skip model construction entirely, either by handing
+plain dictionaries to pydantic-core's JSON encoder or by filling a
+pre-rendered JSON template with the float values only.
+
+A compact binary format is also provided, in which the sensor values are
+packed as a float array ordered by sensor index behind a small versioned
+header, together with `decode_message` so that consumers can read both
+the JSON and binary formats.
+"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+
+from pydantic_core import to_json
+
+from producer.models import SensorBatchMessage, SensorMessage, SensorReading
+
+BATCH_JSON_CONTENT_TYPE = "application/vnd.prism.sensor-batch+json"
+
+
+class MessageSerializer(ABC):
+    """
+    Abstract base class for sensor message serialisers.
+
+    Attributes:
+        `name`: Name used to select the serialiser in configuration, also
+            sent as the `encoding` property of each event
+        `content_type`: MIME type of the produced message bodies
+        `batch_content_type`: MIME type of the produced micro-batch bodies
+        `batch_value_size`: Upper estimate of the encoded size in bytes of
+            one sensor value in a micro-batch
+    """
+
+    name = ""
+    content_type = "application/json"
+    batch_content_type = BATCH_JSON_CONTENT_TYPE
+    # Longest float repr, e.g. -1.2345678901234567e-05, and a separator
+    batch_value_size = 24
+
+    @abstractmethod
+    def serialize(
+        self,
+        machine_id: str,
+        readings: dict[str, float],
+        has_failure: bool,
+        timestamp: str,
+    ) -> bytes:
+        """
+        Encode a single machine reading as a message body.
+
+        Args:
+            `machine_id`: Identifier of the machine that produced the reading
+            `readings`: Mapping of sensor names to values
+            `has_failure`: Whether a failure was active for the reading
+            `timestamp`: ISO format timestamp of when the reading was taken
+
+        Returns:
+            `bytes`: Encoded message body
+        """
+
+    def serialize_batch(self, batch: SensorBatchMessage) -> bytes:
+        """
+        Encode a columnar micro-batch as a message body.
+
+        JSON serialisers share the compact JSON form of `SensorBatchMessage`.
+
+        Args:
+            `batch`: Micro-batch of readings
+
+        Returns:
+            `bytes`: Encoded message body
+        """
+        return batch.model_dump_json().encode("utf-8")
+
+
+class ModelJsonSerializer(MessageSerializer):
+    """
+    Serialiser that validates through the `SensorMessage` model.
+
+    Builds `SensorReading` and `SensorMessage` instances and encodes the
+    result of `model_dump` with `json.dumps`. This is the reference format
+    that the other JSON serialisers reproduce.
+    """
+
+    name = "json"
+
+    def serialize(
+        self,
+        machine_id: str,
+        readings: dict[str, float],
+        has_failure: bool,
+        timestamp: str,
+    ) -> bytes:
+        message = SensorMessage(
+            machine_id=machine_id,
+            timestamp=timestamp,
+            readings=SensorReading(readings=readings, has_failure=has_failure),
+        )
+        return json.dumps(message.model_dump()).encode("utf-8")
+
+
+class PydanticJsonSerializer(MessageSerializer):
+    """
+    Serialiser that encodes plain dictionaries with pydantic-core.
+
+    Produces the same document as `ModelJsonSerializer` in compact form
+    without constructing or validating any model instances.
+    """
+
+    name = "pydantic"
+
+    def serialize(
+        self,
+        machine_id: str,
+        readings: dict[str, float],
+        has_failure: bool,
+        timestamp: str,
+    ) -> bytes:
+        return to_json(
+            {
+                "machine_id": machine_id,
+                "timestamp": timestamp,
+                "readings": {"readings": readings, "has_failure": has_failure},
+            }
+        )
+
+
+class TemplateSerializer(MessageSerializer):
+    """
+    Serialiser that fills a pre-rendered JSON template.
+
+    The JSON skeleton for a given set of sensor names is rendered once and
+    cached, so encoding a reading only formats the machine ID, timestamp
+    and float values. The output is byte-for-byte identical to
+    `ModelJsonSerializer` for finite values.
+    """
+
+    name = "template"
+
+    def __init__(self) -> None:
+        """
+        Initialise an empty template cache.
+
+        Returns:
+            `None`
+        """
+        self._templates: dict[tuple[str, ...], str] = {}
+
+    def _template(self, sensor_names: tuple[str, ...]) -> str:
+        """Return the cached template for the given sensor names."""
+        template = self._templates.get(sensor_names)
+        if template is None:
+            fields = ", ".join(
+                json.dumps(name).replace("%", "%%") + ": %r" for name in sensor_names
+            )
+            template = (
+                '{"machine_id": %s, "timestamp": %s, "readings": {"readings": {'
+                + fields
+                + '}, "has_failure": %s}}'
+            )
+            self._templates[sensor_names] = template
+
+        return template
+
+    def serialize(
+        self,
+        machine_id: str,
+        readings: dict[str, float],
+        has_failure: bool,
+        timestamp: str,
+    ) -> bytes:
+        template = self._template(tuple(readings))
+        return (
+            template
+            % (
+                json.dumps(machine_id),
+                json.dumps(timestamp),
+                *readings.values(),
+                "true" if has_failure else "false",
+            )
+        ).encode("utf-8")
+
+
+BINARY_CONTENT_TYPE = "application/vnd.prism.sensor-message"
+BINARY_MAGIC = b"PRSM"
+BINARY_VERSION = 1
+FLAG_HAS_FAILURE = 0x01
+FLAG_FLOAT32 = 0x02
+
+BINARY_BATCH_CONTENT_TYPE = "application/vnd.prism.sensor-batch"
+BINARY_BATCH_MAGIC = b"PRSB"
+
+# magic, version, flags, number of sensors, machine_id length, timestamp length
+_BINARY_HEADER = struct.Struct("<4sBBHBB")
+
+# magic, version, flags, number of sensors, number of machines, number of ticks
+_BINARY_BATCH_HEADER = struct.Struct("<4sBBHII")
+
+
+class BinarySerializer(MessageSerializer):
+    """
+    Serialiser producing the compact binary sensor message format.
+
+    The layout is a little-endian header (magic `PRSM`, schema version,
+    flags, number of sensors, machine ID and timestamp lengths), followed
+    by the UTF-8 machine ID and ISO timestamp, followed by the sensor
+    values packed as float64 (or float32) in sensor index order. Sensor
+    names are not transmitted: value `i` belongs to `Sensor {i + 1}`.
+
+    Micro-batches use a similar layout: a header (magic `PRSB`, schema
+    version, flags, sensor, machine and tick counts), the length-prefixed
+    machine IDs and timestamps, one failure flag byte per row and the
+    values block packed row by row.
+
+    Attributes:
+        `float32`: Whether values are packed as float32 instead of float64
+    """
+
+    name = "binary"
+    content_type = BINARY_CONTENT_TYPE
+    batch_content_type = BINARY_BATCH_CONTENT_TYPE
+
+    def __init__(self, float32: bool = False) -> None:
+        """
+        Initialise the serialiser.
+
+        Args:
+            `float32`: Pack values as float32, halving the payload at the
+                cost of precision. Defaults to False.
+
+        Returns:
+            `None`
+        """
+        self.float32 = float32
+        self.batch_value_size = 4 if float32 else 8
+        self._value_format = "f" if float32 else "d"
+        self._values: dict[int, tuple[tuple[str, ...], struct.Struct]] = {}
+
+    def _values_struct(self, sensor_names: tuple[str, ...]) -> struct.Struct:
+        """Return the value packer for the given sensor names, checking their order."""
+        cached = self._values.get(len(sensor_names))
+        if cached is None:
+            expected = tuple(f"Sensor {i}" for i in range(1, len(sensor_names) + 1))
+            packer = struct.Struct(f"<{len(sensor_names)}{self._value_format}")
+            cached = self._values[len(sensor_names)] = (expected, packer)
+
+        expected, packer = cached
+        if sensor_names != expected:
+            raise ValueError(
+                "Binary encoding requires readings keyed 'Sensor 1' to "
+                f"'Sensor {len(sensor_names)}' in order"
+            )
+
+        return packer
+
+    def serialize(
+        self,
+        machine_id: str,
+        readings: dict[str, float],
+        has_failure: bool,
+        timestamp: str,
+    ) -> bytes:
+        packer = self._values_struct(tuple(readings))
+        machine_bytes = machine_id.encode("utf-8")
+        timestamp_bytes = timestamp.encode("ascii")
+
+        flags = FLAG_HAS_FAILURE if has_failure else 0
+        if self.float32:
+            flags |= FLAG_FLOAT32
+
+        header = _BINARY_HEADER.pack(
+            BINARY_MAGIC,
+            BINARY_VERSION,
+            flags,
+            len(readings),
+            len(machine_bytes),
+            len(timestamp_bytes),
+        )
+        return b"".join(
+            (header, machine_bytes, timestamp_bytes, packer.pack(*readings.values()))
+        )
+
+    def serialize_batch(self, batch: SensorBatchMessage) -> bytes:
+        packer = self._values_struct(tuple(batch.sensors))
+        header = _BINARY_BATCH_HEADER.pack(
+            BINARY_BATCH_MAGIC,
+            BINARY_VERSION,
+            FLAG_FLOAT32 if self.float32 else 0,
+            len(batch.sensors),
+            len(batch.machine_ids),
+            len(batch.timestamps),
+        )
+
+        parts = [header]
+        for text in (*batch.machine_ids, *batch.timestamps):
+            encoded = text.encode("utf-8")
+            parts.append(bytes((len(encoded),)))
+            parts.append(encoded)
+
+        parts.append(bytes(batch.has_failure))
+        parts.extend(packer.pack(*row) for row in batch.values)
+        return b"".join(parts)
+
+
+class Binary32Serializer(BinarySerializer):
+    """Binary serialiser packing sensor values as float32."""
+
+    name = "binary32"
+
+    def __init__(self) -> None:
+        super().__init__(float32=True)
+
+
+SERIALIZERS: dict[str, type[MessageSerializer]] = {
+    serializer.name: serializer
+    for serializer in (
+        ModelJsonSerializer,
+        PydanticJsonSerializer,
+        TemplateSerializer,
+        BinarySerializer,
+        Binary32Serializer,
+    )
+}
+
+
+# Sensor names and value unpacker per (number of sensors, float32 flag)
+_decode_layouts: dict[tuple[int, bool], tuple[tuple[str, ...], struct.Struct]] = {}
+
+
+def _decode_layout(num_sensors: int, float32: bool) -> tuple[tuple[str, ...], struct.Struct]:
+    """Return the cached sensor names and value unpacker of a binary message."""
+    layout = _decode_layouts.get((num_sensors, float32))
+    if layout is None:
+        layout = _decode_layouts[(num_sensors, float32)] = (
+            tuple(f"Sensor {i}" for i in range(1, num_sensors + 1)),
+            struct.Struct(f"<{num_sensors}{'f' if float32 else 'd'}"),
+        )
+
+    return layout
+
+
+def decode_binary_message(body: bytes) -> SensorMessage:
+    """
+    Decode a message in the compact binary format.
+
+    Args:
+        `body`: Message body produced by `BinarySerializer`
+
+    Returns:
+        `SensorMessage`: Decoded message
+
+    Raises:
+        `ValueError`: If the body is not a supported binary sensor message,
+            or its length does not match its header
+    """
+    if len(body) < _BINARY_HEADER.size:
+        raise ValueError("Binary sensor message is shorter than its header")
+
+    magic, version, flags, num_sensors, machine_len, timestamp_len = (
+        _BINARY_HEADER.unpack_from(body)
+    )
+    if magic != BINARY_MAGIC:
+        raise ValueError("Not a binary sensor message")
+
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary sensor message version {version}")
+
+    sensor_names, values_struct = _decode_layout(num_sensors, bool(flags & FLAG_FLOAT32))
+    expected = _BINARY_HEADER.size + machine_len + timestamp_len + values_struct.size
+    if len(body) != expected:
+        raise ValueError(
+            f"Binary sensor message is {len(body)} bytes, its header describes {expected}"
+        )
+
+    offset = _BINARY_HEADER.size
+    machine_id = body[offset : offset + machine_len].decode("utf-8")
+    offset += machine_len
+    timestamp = body[offset : offset + timestamp_len].decode("ascii")
+    offset += timestamp_len
+
+    values = values_struct.unpack_from(body, offset)
+
+    # Validating plain data in pydantic-core is faster than model_construct
+    return SensorMessage.model_validate(
+        {
+            "machine_id": machine_id,
+            "timestamp": timestamp,
+            "readings": {
+                "readings": dict(zip(sensor_names, values)),
+                "has_failure": bool(flags & FLAG_HAS_FAILURE),
+            },
+        }
+    )
+
+
+def decode_binary_batch(body: bytes) -> SensorBatchMessage:
+    """
+    Decode a micro-batch in the compact binary format.
+
+    Args:
+        `body`: Message body produced by `BinarySerializer.serialize_batch`
+
+    Returns:
+        `SensorBatchMessage`: Decoded micro-batch
+
+    Raises:
+        `ValueError`: If the body is not a supported binary micro-batch,
+            or its length does not match its header
+    """
+    if len(body) < _BINARY_BATCH_HEADER.size:
+        raise ValueError("Binary sensor batch is shorter than its header")
+
+    magic, version, flags, num_sensors, num_machines, num_ticks = (
+        _BINARY_BATCH_HEADER.unpack_from(body)
+    )
+    if magic != BINARY_BATCH_MAGIC:
+        raise ValueError("Not a binary sensor batch")
+
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary sensor batch version {version}")
+
+    offset = _BINARY_BATCH_HEADER.size
+    texts = []
+    for _ in range(num_machines + num_ticks):
+        if offset >= len(body) or offset + 1 + body[offset] > len(body):
+            raise ValueError("Binary sensor batch is truncated in its machine IDs or timestamps")
+        length = body[offset]
+        texts.append(body[offset + 1 : offset + 1 + length].decode("utf-8"))
+        offset += 1 + length
+
+    rows = num_machines * num_ticks
+    sensor_names, row_struct = _decode_layout(num_sensors, bool(flags & FLAG_FLOAT32))
+    expected = offset + rows + rows * row_struct.size
+    if len(body) != expected:
+        raise ValueError(
+            f"Binary sensor batch is {len(body)} bytes, its header describes {expected}"
+        )
+
+    has_failure = [bool(flag) for flag in body[offset : offset + rows]]
+    offset += rows
+
+    values = [list(values) for values in row_struct.iter_unpack(body[offset:])]
+
+    return SensorBatchMessage(
+        machine_ids=texts[:num_machines],
+        timestamps=texts[num_machines:],
+        sensors=list(sensor_names),
+        values=values,
+        has_failure=has_failure,
+    )
+
+
+def decode_batch_message(
+    body: bytes, content_type: str | None = None
+) -> SensorBatchMessage:
+    """
+    Decode a micro-batch in either the JSON or the binary format.
+
+    Args:
+        `body`: Message body
+        `content_type`: Content type of the event, if known
+
+    Returns:
+        `SensorBatchMessage`: Decoded micro-batch
+    """
+    if content_type == BINARY_BATCH_CONTENT_TYPE or (
+        content_type is None and body[:4] == BINARY_BATCH_MAGIC
+    ):
+        return decode_binary_batch(body)
+
+    return SensorBatchMessage.model_validate_json(body)
+
+
+def decode_message(body: bytes, content_type: str | None = None) -> SensorMessage:
+    """
+    Decode a sensor message in either the JSON or the binary format.
+
+    The format is taken from the event content type when available and
+    otherwise detected from the leading magic bytes.
+
+    Args:
+        `body`: Message body
+        `content_type`: Content type of the event, if known
+
+    Returns:
+        `SensorMessage`: Decoded message
+    """
+    if content_type == BINARY_CONTENT_TYPE or (
+        content_type is None and body[:4] == BINARY_MAGIC
+    ):
+        return decode_binary_message(body)
+
+    return SensorMessage.model_validate_json(body)
+
+
+def get_serializer(name: str) -> MessageSerializer:
+    """
+    Create the serialiser registered under the given name.
+
+    Args:
+        `name`: Serialiser name, one of `json`, `pydantic`, `template`,
+            `binary` or `binary32`
+
+    Returns:
+        `MessageSerializer`: New serialiser instance
+
+    Raises:
+        `ValueError`: If no serialiser is registered under the name
+    """
+    try:
+        return SERIALIZERS[name]()
+
+    except KeyError:
+        raise ValueError(
+            f"Unknown message serializer '{name}', expected one of {sorted(SERIALIZERS)}"
+        ) from None
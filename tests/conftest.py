@@ -0,0 +1,39 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+
+@pytest.fixture
+def run_with_db():
+    """
+    Run a coroutine function against a scratch database on the server at MONGODB_URI
+
+    Tests using this fixture are skipped unless MONGODB_URI points to a
+    replica set, which change streams require.
+    """
+    uri = os.environ.get("MONGODB_URI")
+    if not uri:
+        pytest.skip("MONGODB_URI is not set")
+
+    def run(scenario):
+        async def main():
+            client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=5000)
+            try:
+                hello = await client.admin.command("hello")
+                if "setName" not in hello:
+                    pytest.skip("MONGODB_URI does not point to a replica set")
+
+                db = client[f"test_{uuid.uuid4().hex[:12]}"]
+                try:
+                    return await scenario(db)
+                finally:
+                    await client.drop_database(db.name)
+            finally:
+                client.close()
+
+        return asyncio.run(main())
+
+    return run
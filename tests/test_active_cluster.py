@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from domain.models import Cluster
+from domain.utils.crud import activate_cluster, create_cluster_model
+from domain.utils.db import ACTIVE_CLUSTER_COLLECTION, ACTIVE_CLUSTER_POINTER_ID, get_active_cluster
+
+
+PROFILES = {"0": {"sensor_00": 0.0}, "1": {"sensor_00": 1.0}}
+
+
+async def _create(db, run_id, is_active=False):
+    return await create_cluster_model(
+        db,
+        mlflow_run_id=run_id,
+        mlflow_model_version=1,
+        n_clusters=2,
+        silhouette_score=0.5,
+        cluster_profiles=PROFILES,
+        is_active=is_active
+    )
+
+
+async def _pointer(db):
+    return await db[ACTIVE_CLUSTER_COLLECTION].find_one({"_id": ACTIVE_CLUSTER_POINTER_ID})
+
+
+class RecordingCollection:
+    def __init__(self, calls, name, doc=None):
+        self.calls = calls
+        self.name = name
+        self.doc = doc
+
+    async def find_one(self, *args, **kwargs):
+        self.calls.append((self.name, "find_one"))
+        return self.doc
+
+    async def update_one(self, *args, **kwargs):
+        self.calls.append((self.name, "update_one"))
+
+
+class RecordingDatabase:
+    def __init__(self, docs):
+        self.calls = []
+        self.docs = docs
+
+    def __getitem__(self, name):
+        return RecordingCollection(self.calls, name, self.docs.get(name))
+
+
+def test_activation_and_reads_take_one_round_trip_each():
+    cluster = Cluster(
+        mlflow_run_id="run-1", mlflow_model_version=1, n_clusters=2, silhouette_score=0.5, cluster_profiles=PROFILES
+    ).dict(by_alias=True)
+    db = RecordingDatabase({
+        Cluster.Config.collection: cluster,
+        ACTIVE_CLUSTER_COLLECTION: {"_id": ACTIVE_CLUSTER_POINTER_ID, "version": 1, "cluster": {**cluster, "is_active": True}}
+    })
+
+    asyncio.run(activate_cluster(db, cluster["_id"]))
+    assert db.calls == [(Cluster.Config.collection, "find_one"), (ACTIVE_CLUSTER_COLLECTION, "update_one")]
+
+    db.calls.clear()
+    active = asyncio.run(get_active_cluster(db))
+    assert db.calls == [(ACTIVE_CLUSTER_COLLECTION, "find_one")]
+    assert active.id == cluster["_id"]
+    assert active.is_active
+
+
+def test_activate_missing_cluster_writes_nothing():
+    db = RecordingDatabase({})
+
+    with pytest.raises(ValueError):
+        asyncio.run(activate_cluster(db, ObjectId()))
+    assert db.calls == [(Cluster.Config.collection, "find_one")]
+
+
+def test_activate_cluster_switches_pointer(run_with_db):
+    async def scenario(db):
+        first = await _create(db, "run-1", is_active=True)
+        second = await _create(db, "run-2")
+
+        assert (await get_active_cluster(db)).id == first
+        await activate_cluster(db, str(second))
+
+        pointer = await _pointer(db)
+        assert pointer["cluster"]["_id"] == second
+        assert pointer["cluster"]["cluster_profiles"] == PROFILES
+        assert pointer["version"] == 2
+
+        active = await get_active_cluster(db)
+        assert active.id == second
+        assert active.is_active
+
+    run_with_db(scenario)
+
+
+def test_activate_missing_cluster_changes_nothing(run_with_db):
+    async def scenario(db):
+        first = await _create(db, "run-1", is_active=True)
+
+        with pytest.raises(ValueError):
+            await activate_cluster(db, "0123456789abcdef01234567")
+
+        pointer = await _pointer(db)
+        assert pointer["cluster"]["_id"] == first
+        assert pointer["version"] == 1
+
+    run_with_db(scenario)
+
+
+def test_create_inactive_cluster_keeps_active_one(run_with_db):
+    async def scenario(db):
+        first = await _create(db, "run-1", is_active=True)
+        await _create(db, "run-2")
+
+        assert (await get_active_cluster(db)).id == first
+        assert (await _pointer(db))["version"] == 1
+
+    run_with_db(scenario)
+
+
+def test_flagged_cluster_is_active_until_the_pointer_exists(run_with_db):
+    async def scenario(db):
+        legacy = await _create(db, "run-1")
+        await db[Cluster.Config.collection].update_one({"_id": legacy}, {"$set": {"is_active": True}})
+        assert (await get_active_cluster(db)).id == legacy
+
+        second = await _create(db, "run-2", is_active=True)
+        assert (await get_active_cluster(db)).id == second
+
+    run_with_db(scenario)
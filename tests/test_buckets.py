@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from domain.models import ReadingBucket, SensorReading
+from domain.utils.buckets import append_readings_to_buckets, create_timeseries_readings_collection
+
+
+class FakeCollection:
+    def __init__(self):
+        self.operations = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.operations.extend(operations)
+
+
+class FakeDatabase:
+    def __init__(self, collections=()):
+        self.collections = {name: FakeCollection() for name in collections}
+        self.created = []
+
+    def __getitem__(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+    async def list_collection_names(self, filter=None):
+        return [name for name in self.collections if name == filter["name"]]
+
+    async def create_collection(self, name, **options):
+        self.created.append((name, options))
+
+
+def _reading(machine_id, timestamp, values):
+    return SensorReading(machine_id=machine_id, timestamp=timestamp, values=values)
+
+
+def test_readings_with_different_sensors_go_to_separate_buckets():
+    db = FakeDatabase()
+    machine_id = ObjectId()
+    start = datetime(2024, 1, 1)
+    readings = [
+        _reading(machine_id, start, {"a": 1.0, "b": 2.0}),
+        _reading(machine_id, start + timedelta(seconds=1), {"a": 3.0}),
+        _reading(machine_id, start + timedelta(seconds=2), {"b": 4.0, "a": 5.0})
+    ]
+
+    assert asyncio.run(append_readings_to_buckets(db, readings)) == 2
+
+    filters = [operation._filter for operation in db[ReadingBucket.Config.collection].operations]
+    assert [query["sensors"] for query in filters] == [["a", "b"], ["a"]]
+    pushes = [operation._doc["$push"] for operation in db[ReadingBucket.Config.collection].operations]
+    assert pushes[0]["values.a"] == {"$each": [1.0, 5.0]}
+    assert pushes[1]["values.a"] == {"$each": [3.0]}
+
+
+def test_chunks_only_match_buckets_with_room():
+    db = FakeDatabase()
+    machine_id = ObjectId()
+    start = datetime(2024, 1, 1)
+    readings = [_reading(machine_id, start + timedelta(seconds=i), {"a": float(i)}) for i in range(5)]
+
+    assert asyncio.run(append_readings_to_buckets(db, readings, max_bucket_size=2)) == 3
+
+    operations = db[ReadingBucket.Config.collection].operations
+    assert [operation._filter["count"] for operation in operations] == [{"$lte": 0}, {"$lte": 0}, {"$lte": 1}]
+    assert [operation._doc["$inc"]["count"] for operation in operations] == [2, 2, 1]
+
+
+def test_timeseries_collection_is_not_created_over_existing_readings(caplog):
+    db = FakeDatabase(collections=[SensorReading.Config.collection])
+
+    with caplog.at_level(logging.WARNING, logger="domain.utils.buckets"):
+        assert not asyncio.run(create_timeseries_readings_collection(db))
+
+    assert db.created == []
+    assert "already exists" in caplog.text
+
+
+def test_timeseries_collection_is_created():
+    db = FakeDatabase()
+
+    assert asyncio.run(create_timeseries_readings_collection(db, expire_after_seconds=60))
+    assert db.created == [(SensorReading.Config.collection, {
+        "timeseries": {"timeField": "timestamp", "metaField": "machine_id", "granularity": "seconds"},
+        "expireAfterSeconds": 60
+    })]
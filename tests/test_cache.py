@@ -0,0 +1,98 @@
+import asyncio
+
+from pymongo.errors import OperationFailure
+
+from domain.utils.cache import ActiveClusterCache
+
+
+class FakeCollection:
+    async def find_one(self, *args, **kwargs):
+        return None
+
+
+class FakeStream:
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    @property
+    def alive(self):
+        return bool(self.batches)
+
+    async def try_next(self):
+        await asyncio.sleep(0.01)
+        return self.batches.pop(0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeDatabase:
+    def __init__(self, watch_errors=(), batches=()):
+        self.watch_errors = list(watch_errors)
+        self.batches = batches
+        self.watch_calls = 0
+
+    def __getitem__(self, name):
+        return FakeCollection()
+
+    def watch(self, pipeline):
+        self.watch_calls += 1
+        if self.watch_errors:
+            raise self.watch_errors.pop(0)
+        return FakeStream(self.batches)
+
+
+async def _run_cache(db, seconds):
+    cache = ActiveClusterCache(db, poll_interval=0.01)
+    async with cache:
+        await asyncio.sleep(seconds)
+    return cache
+
+
+def test_unsupported_change_streams_fall_back_to_polling():
+    db = FakeDatabase(watch_errors=[OperationFailure("not a replica set", code=40573)])
+
+    asyncio.run(_run_cache(db, 0.1))
+
+    assert db.watch_calls == 1
+
+
+def test_other_change_stream_errors_reopen_the_stream(caplog):
+    db = FakeDatabase(watch_errors=[OperationFailure("interrupted", code=11601), ConnectionError("reset")])
+
+    asyncio.run(_run_cache(db, 0.1))
+
+    assert db.watch_calls >= 3
+    assert "Change stream failed" in caplog.text
+
+
+def test_staleness_follows_the_stream():
+    async def scenario():
+        db = FakeDatabase(batches=[None] * 1000)
+        cache = ActiveClusterCache(db, poll_interval=10.0)
+        async with cache:
+            await asyncio.sleep(0.1)
+            assert cache.watching
+            assert cache.staleness < 0.05
+
+            # Once the stream stops returning, the values age
+            cache._task.cancel()
+            await asyncio.sleep(0.1)
+            assert cache.staleness >= 0.1
+
+    asyncio.run(scenario())
+
+
+def test_reads_are_served_from_memory():
+    async def scenario():
+        cache = ActiveClusterCache(FakeDatabase(), poll_interval=10.0)
+        assert cache.staleness is None
+        assert await cache.get_active_cluster() is None
+        assert await cache.get_latest_model_version() is None
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,56 @@
+import asyncio
+import types
+
+import pytest
+
+from domain.utils import connections
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    connections.close_clients()
+    yield
+    connections.close_clients()
+
+
+def test_concurrent_calls_wait_for_the_indexes(monkeypatch):
+    calls = []
+    created = []
+
+    async def ensure_indexes(db):
+        calls.append(db.name)
+        await asyncio.sleep(0.05)
+        created.append(db.name)
+
+    async def caller(db):
+        result = await connections.ensure_indexes_once(db, "mongodb://test")
+        # No caller returns before the indexes exist
+        assert created == ["sensors"]
+        return result
+
+    async def scenario():
+        db = types.SimpleNamespace(name="sensors")
+        return await asyncio.gather(*(caller(db) for _ in range(3)))
+
+    monkeypatch.setattr(connections, "ensure_indexes", ensure_indexes)
+    assert sorted(asyncio.run(scenario())) == [False, False, True]
+    assert calls == ["sensors"]
+
+
+def test_failed_attempt_is_retried(monkeypatch):
+    attempts = []
+
+    async def ensure_indexes(db):
+        attempts.append(db.name)
+        if len(attempts) == 1:
+            raise RuntimeError("server unavailable")
+
+    async def scenario():
+        db = types.SimpleNamespace(name="sensors")
+        with pytest.raises(RuntimeError):
+            await connections.ensure_indexes_once(db, "mongodb://test")
+        return await connections.ensure_indexes_once(db, "mongodb://test")
+
+    monkeypatch.setattr(connections, "ensure_indexes", ensure_indexes)
+    assert asyncio.run(scenario())
+    assert len(attempts) == 2
@@ -0,0 +1,73 @@
+import random
+
+from domain.utils.drift import DriftDetector
+
+
+GAUSSIAN_STATS = {"mean": 0.0, "std": 1.0, "min": -3.0, "max": 3.0}
+CONSTANT_STATS = {"mean": 5.0, "std": 0.0, "min": 5.0, "max": 5.0}
+
+
+def test_constant_sensor_does_not_drift():
+    rng = random.Random(0)
+    detector = DriftDetector({"constant": CONSTANT_STATS, "gaussian": GAUSSIAN_STATS}, pane_size=100, num_panes=5)
+    for _ in range(500):
+        detector.add({"constant": 5.0, "gaussian": rng.gauss(0.0, 1.0)})
+
+    _, crossed = detector.check()
+    assert detector.scores()["constant"]["psi"] == 0.0
+    assert not crossed
+
+
+def test_constant_sensor_drifts_when_its_value_changes():
+    detector = DriftDetector({"constant": CONSTANT_STATS}, pane_size=100, num_panes=5)
+    for _ in range(500):
+        detector.add({"constant": 6.0})
+
+    score, crossed = detector.check()
+    assert crossed
+    assert score > detector.threshold
+
+
+def test_undrifted_uniform_samples_do_not_trigger():
+    rng = random.Random(1)
+    reference = [rng.uniform(0.0, 10.0) for _ in range(5000)]
+    detector = DriftDetector.from_samples({"uniform": reference}, pane_size=100, num_panes=10)
+    for _ in range(1000):
+        detector.add({"uniform": rng.uniform(0.0, 10.0)})
+
+    score, crossed = detector.check()
+    assert not crossed
+    assert score < detector.threshold
+
+
+def test_discrete_samples_do_not_trigger():
+    reference = [1.0, 1.0, 1.0, 2.0, 2.0, 3.0]
+    detector = DriftDetector.from_samples({"discrete": reference * 100}, pane_size=60, num_panes=5)
+    for _ in range(50):
+        for value in reference:
+            detector.add({"discrete": value})
+
+    assert detector.check() == (0.0, False)
+
+
+def test_shift_triggers_once():
+    rng = random.Random(2)
+    reference = [rng.uniform(0.0, 10.0) for _ in range(5000)]
+    detector = DriftDetector.from_samples({"uniform": reference}, pane_size=100, num_panes=10)
+    for _ in range(1000):
+        detector.add({"uniform": rng.uniform(5.0, 15.0)})
+
+    assert detector.check()[1]
+    assert not detector.check()[1]
+    assert detector.drifting
+
+
+def test_window_forgets_old_panes():
+    detector = DriftDetector({"constant": CONSTANT_STATS}, pane_size=10, num_panes=3)
+    for _ in range(30):
+        detector.add({"constant": 6.0})
+    for _ in range(30):
+        detector.add({"constant": 5.0})
+
+    assert len(detector) == 30
+    assert detector.check() == (0.0, False)
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo import DESCENDING
+
+from domain.models import Cluster, Failure
+from domain.utils.indexes import INDEX_PLAN, ensure_indexes, explain_index
+
+
+def _planned_name(collection, partial_field):
+    return next(
+        index.name for index in INDEX_PLAN
+        if index.collection == collection and index.partial_filter and partial_field in index.partial_filter
+    )
+
+
+@pytest.mark.parametrize("collection, time_field", [
+    (Failure.Config.collection, "start_time"),
+    (Cluster.Config.collection, "created_at")
+])
+def test_active_queries_use_partial_indexes(run_with_db, collection, time_field):
+    async def scenario(db):
+        await ensure_indexes(db)
+        start = datetime(2024, 1, 1)
+        await db[collection].insert_many([
+            {"is_active": i % 10 == 0, time_field: start + timedelta(minutes=i), "mlflow_run_id": f"run-{i}"}
+            for i in range(200)
+        ])
+        return await explain_index(db, collection, {"is_active": True}, [(time_field, DESCENDING)])
+
+    index_name, in_memory_sort = run_with_db(scenario)
+
+    assert index_name == _planned_name(collection, "is_active")
+    assert not in_memory_sort
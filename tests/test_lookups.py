@@ -0,0 +1,46 @@
+import asyncio
+
+from bson import ObjectId
+
+from domain.models import Machine
+from domain.utils.db import get_documents_by_ids
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length=None):
+        return self.docs
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.projections = []
+
+    def find(self, query, projection=None):
+        self.projections.append(projection)
+        ids = set(query["_id"]["$in"])
+        return FakeCursor([
+            {key: value for key, value in doc.items() if key == "_id" or projection.get(key, 0)}
+            for doc in self.docs if doc["_id"] in ids
+        ])
+
+
+def test_lookup_by_ids_with_projection_excluding_id():
+    first, second, missing = ObjectId(), ObjectId(), ObjectId()
+    collection = FakeCollection([
+        {"_id": first, "machine_id": "machine-a"},
+        {"_id": second, "machine_id": "machine-b"}
+    ])
+    projection = {"machine_id": 1, "_id": 0}
+
+    docs = asyncio.run(get_documents_by_ids(
+        {Machine.Config.collection: collection}, Machine.Config.collection, [second, missing, str(first)], Machine,
+        projection=projection, raw=True
+    ))
+
+    assert docs == [{"machine_id": "machine-b"}, None, {"machine_id": "machine-a"}]
+    assert collection.projections == [{"machine_id": 1, "_id": 1}]
+    assert projection == {"machine_id": 1, "_id": 0}
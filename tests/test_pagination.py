@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+
+from domain.utils.db import decode_page_token, encode_page_token
+
+
+@pytest.mark.parametrize("sort_value", [datetime(2024, 1, 1, 12, 30, 15, 123456), datetime(2024, 1, 1, tzinfo=timezone.utc)])
+def test_page_token_round_trip(sort_value):
+    doc_id = ObjectId()
+
+    token = encode_page_token(sort_value, doc_id)
+
+    assert decode_page_token(token) == (sort_value, doc_id)
+    assert token.isascii() and "/" not in token and "+" not in token
+
+
+@pytest.mark.parametrize("token", ["", "not-a-token", encode_page_token(datetime(2024, 1, 1), ObjectId())[:-4]])
+def test_malformed_page_token(token):
+    with pytest.raises(ValueError):
+        decode_page_token(token)
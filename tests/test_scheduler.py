@@ -0,0 +1,66 @@
+import types
+
+import pytest
+
+from producer.services import scheduler
+from producer.services.scheduler import CATCH_UP, SKIP, TickScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the scheduler's clock with one that only advances when told to or when sleeping."""
+    fake = types.SimpleNamespace(now=100.0, sleeps=[])
+
+    def sleep(delay):
+        fake.sleeps.append(delay)
+        fake.now += delay
+
+    monkeypatch.setattr(scheduler, "time", types.SimpleNamespace(monotonic=lambda: fake.now, sleep=sleep))
+    return fake
+
+
+def test_ticks_keep_a_fixed_rate(clock):
+    ticker = TickScheduler(1.0)
+    ticker.wait()
+    for _ in range(3):
+        clock.now += 0.25
+        ticker.wait()
+
+    assert clock.sleeps == [0.75, 0.75, 0.75]
+    assert ticker.ticks == 4
+
+
+def test_catch_up_runs_missed_ticks_back_to_back(clock):
+    ticker = TickScheduler(1.0, policy=CATCH_UP)
+    ticker.wait()
+    clock.now += 3.5
+    for _ in range(4):
+        ticker.wait()
+
+    assert clock.sleeps == [0.5]
+    assert ticker.skipped == 0
+
+
+def test_skip_drops_missed_ticks(clock):
+    ticker = TickScheduler(1.0, policy=SKIP)
+    ticker.wait()
+    clock.now += 3.5
+    ticker.wait()
+
+    # Deadlines 101 to 103 have passed; the tick waits for 104
+    assert clock.sleeps == [0.5]
+    assert ticker.skipped == 3
+
+
+def test_fractional_intervals(clock):
+    ticker = TickScheduler(0.0025)
+    for _ in range(5):
+        ticker.wait()
+
+    assert sum(clock.sleeps) == pytest.approx(0.01)
+
+
+@pytest.mark.parametrize("interval, policy", [(0, CATCH_UP), (-1.0, CATCH_UP), (1.0, "rewind")])
+def test_invalid_settings(interval, policy):
+    with pytest.raises(ValueError):
+        TickScheduler(interval, policy=policy)
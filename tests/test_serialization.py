@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from producer.models import SensorBatchMessage
+from producer.utils.serialization import (
+    SERIALIZERS,
+    decode_batch_message,
+    decode_binary_batch,
+    decode_binary_message,
+    decode_message,
+    get_serializer,
+)
+
+READINGS = {"Sensor 1": 0.1, "Sensor 2": -12.5, "Sensor 3": 1e-7}
+TIMESTAMP = "2024-01-01T12:00:00.123456"
+
+BATCH = SensorBatchMessage(
+    machine_ids=["machine-a", "machine-b"],
+    timestamps=["2024-01-01T12:00:00", "2024-01-01T12:00:01"],
+    sensors=["Sensor 1", "Sensor 2"],
+    values=[[1.0, 2.0], [3.0, 4.0], [5.5, -6.5], [7.25, 8.0]],
+    has_failure=[False, True, False, False],
+)
+
+
+@pytest.mark.parametrize("name", sorted(SERIALIZERS))
+def test_message_round_trip(name):
+    serializer = get_serializer(name)
+    body = serializer.serialize("machine-a", READINGS, True, TIMESTAMP)
+
+    message = decode_message(body, serializer.content_type)
+
+    assert message.machine_id == "machine-a"
+    assert message.timestamp == TIMESTAMP
+    assert message.readings.has_failure is True
+    assert message.readings.readings == pytest.approx(READINGS, rel=1e-6)
+
+
+@pytest.mark.parametrize("name", sorted(SERIALIZERS))
+def test_batch_round_trip(name):
+    serializer = get_serializer(name)
+    body = serializer.serialize_batch(BATCH)
+
+    assert decode_batch_message(body, serializer.batch_content_type) == BATCH
+    assert decode_batch_message(body) == BATCH
+
+
+def test_json_serializers_produce_the_same_document():
+    documents = {
+        name: json.loads(get_serializer(name).serialize("machine-a", READINGS, False, TIMESTAMP))
+        for name in ("json", "pydantic", "template")
+    }
+
+    assert documents["pydantic"] == documents["json"]
+    assert documents["template"] == documents["json"]
+
+
+def test_binary_requires_indexed_sensor_names():
+    with pytest.raises(ValueError):
+        get_serializer("binary").serialize("machine-a", {"Sensor 2": 1.0}, False, TIMESTAMP)
+
+
+def test_unknown_serializer():
+    with pytest.raises(ValueError):
+        get_serializer("xml")
+
+
+@pytest.mark.parametrize("name", ["binary", "binary32"])
+def test_truncated_binary_message(name):
+    body = get_serializer(name).serialize("machine-a", READINGS, False, TIMESTAMP)
+
+    for length in range(len(body)):
+        with pytest.raises(ValueError):
+            decode_binary_message(body[:length])
+
+
+@pytest.mark.parametrize("name", ["binary", "binary32"])
+def test_truncated_binary_batch(name):
+    body = get_serializer(name).serialize_batch(BATCH)
+
+    for length in range(len(body)):
+        with pytest.raises(ValueError):
+            decode_binary_batch(body[:length])
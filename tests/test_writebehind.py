@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from domain.models import Machine
+from domain.utils.writebehind import LastSeenBuffer
+
+
+class FakeCollection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.writes = []
+
+    async def bulk_write(self, operations, ordered=True):
+        if self.fail:
+            raise ConnectionError("server unavailable")
+        self.writes.append(operations)
+
+
+class FakeDatabase:
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getitem__(self, name):
+        assert name == Machine.Config.collection
+        return self.collection
+
+
+def test_only_the_latest_timestamp_per_machine_is_written():
+    collection = FakeCollection()
+    machine_id = ObjectId()
+    seen = datetime(2024, 1, 1)
+
+    async def scenario():
+        buffer = LastSeenBuffer(FakeDatabase(collection))
+        await buffer.record(machine_id, seen + timedelta(seconds=2))
+        await buffer.record(str(machine_id), seen)
+        assert len(buffer) == 1
+        return await buffer.flush()
+
+    assert asyncio.run(scenario()) == 1
+    [operation] = collection.writes[0]
+    assert operation._filter == {"_id": machine_id}
+    assert operation._doc == {"$max": {"last_seen": seen + timedelta(seconds=2)}}
+
+
+def test_reaching_max_pending_flushes():
+    collection = FakeCollection()
+
+    async def scenario():
+        buffer = LastSeenBuffer(FakeDatabase(collection), max_pending=3)
+        for _ in range(3):
+            await buffer.record(ObjectId())
+        return len(buffer)
+
+    assert asyncio.run(scenario()) == 0
+    assert len(collection.writes[0]) == 3
+
+
+def test_failed_flush_keeps_pending_timestamps():
+    collection = FakeCollection(fail=True)
+    machine_id = ObjectId()
+
+    async def scenario():
+        buffer = LastSeenBuffer(FakeDatabase(collection))
+        await buffer.record(machine_id, datetime(2024, 1, 1))
+        with pytest.raises(ConnectionError):
+            await buffer.flush()
+        assert len(buffer) == 1
+
+        collection.fail = False
+        return await buffer.flush()
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_close_writes_pending_timestamps():
+    collection = FakeCollection()
+
+    async def scenario():
+        async with LastSeenBuffer(FakeDatabase(collection), flush_interval=60.0) as buffer:
+            await buffer.record(ObjectId())
+
+    asyncio.run(scenario())
+    assert len(collection.writes) == 1
+
+
+def test_failed_periodic_flush_is_logged(caplog):
+    collection = FakeCollection(fail=True)
+
+    async def scenario():
+        buffer = LastSeenBuffer(FakeDatabase(collection), flush_interval=0.01)
+        await buffer.record(ObjectId())
+        buffer.start()
+        await asyncio.sleep(0.05)
+        collection.fail = False
+        await buffer.close()
+
+    with caplog.at_level("ERROR", logger="domain.utils.writebehind"):
+        asyncio.run(scenario())
+
+    assert "pending last_seen updates failed" in caplog.text
+    assert len(collection.writes) == 1